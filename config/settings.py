@@ -23,6 +23,10 @@ class Settings(BaseSettings):
     # LLM & Embeddings
     ANTHROPIC_API_KEY: str
     ANTHROPIC_MODEL: str = "claude-sonnet-4-20250514"
+    ANTHROPIC_MAX_CONCURRENCY: int = 5  # Claude calls in flight per engine
+    ANTHROPIC_USE_BATCH_API: bool = False  # Bulk queries via Message Batches (cheaper, slower)
+    ANTHROPIC_BATCH_POLL_SECONDS: int = 30
+    ANTHROPIC_BATCH_MAX_WAIT_SECONDS: int = 3600  # Then cancel and answer directly
     VOYAGE_API_KEY: str
     VOYAGE_MODEL: str = "voyage-3"
 
@@ -55,17 +59,23 @@ class Settings(BaseSettings):
 
     # Query Settings
     CONFIDENCE_THRESHOLD: float = 0.7
+    CONFIDENCE_CACHE_SIZE: int = 1024  # Scores kept for repeated queries, 0 disables
     MAX_QUERY_RESULTS: int = 100
     QUERY_TIMEOUT_SECONDS: int = 30
+    ANSWER_CACHE_SIZE: int = 1024  # Sessionless answers kept for repeat questions, 0 disables
+    ANSWER_CACHE_TTL_SECONDS: int = 300
 
     # Data Sync Settings
     SYNC_SCHEDULE_HOUR: int = 2  # 2 AM
     DEFAULT_DATA_RETENTION_DAYS: int = 365
+    CONNECTOR_CACHE_DIR: str | None = None  # Disk cache for API responses
 
     # Rate Limiting
     MAX_REQUESTS_PER_MINUTE: int = 60
     RETRY_MAX_ATTEMPTS: int = 3
     RETRY_BASE_DELAY_SECONDS: float = 1.0
+    GOOGLE_ADS_REQUESTS_PER_SECOND: float = 10.0
+    META_ADS_REQUESTS_PER_SECOND: float = 10.0
 
     # Azure Monitor (optional)
     AZURE_MONITOR_CONNECTION_STRING: str | None = None
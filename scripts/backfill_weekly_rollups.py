@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Build weekly metric rollups for metrics ingested before rollups existed.
+
+Run once after deploying weekly rollups; reports read whole weeks from the
+rollups, so weeks without one would be left out. Safe to re-run.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.graph.client import get_neo4j_client
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Backfill weekly rollups for one or every client."""
+    parser = argparse.ArgumentParser(description="Backfill MetricWeekly rollups")
+    parser.add_argument("--client-id", help="Only backfill this client")
+    args = parser.parse_args()
+
+    neo4j_client = get_neo4j_client()
+
+    if not neo4j_client.verify_connectivity():
+        logger.error("Cannot connect to Neo4j. Is it running?")
+        sys.exit(1)
+
+    # Rollup lookups need the MetricWeekly indexes
+    neo4j_client.initialize_schema()
+
+    if args.client_id:
+        client_ids = [args.client_id]
+    else:
+        client_ids = [
+            record["id"]
+            for record in neo4j_client.execute_query("MATCH (c:Client) RETURN c.id AS id")
+        ]
+
+    total = 0
+    for client_id in client_ids:
+        total += neo4j_client.build_weekly_rollups(client_id)
+
+    logger.info(f"Built {total} weekly rollups across {len(client_ids)} clients")
+
+    neo4j_client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -49,50 +49,37 @@ def main():
         adsets_per_campaign=3,
         ads_per_adset=5,
         metric_days=90,
+        metric_columns=True,
     )
+    metric_count = sum(len(batch["columns"]["id"]) for batch in data["metrics"])
 
     # Ingest clients
     logger.info(f"Ingesting {len(data['clients'])} clients...")
-    for client in data["clients"]:
-        ingester.ingest_client(client)
+    ingester.ingest_clients(data["clients"])
 
     # Ingest campaigns
     logger.info(f"Ingesting {len(data['campaigns'])} campaigns...")
-    for campaign in data["campaigns"]:
-        ingester.ingest_campaign(campaign, campaign["client_id"])
+    ingester.ingest_campaigns(data["campaigns"])
 
     # Ingest ad sets
     logger.info(f"Ingesting {len(data['adsets'])} ad sets...")
-    for adset in data["adsets"]:
-        ingester.ingest_adset(adset, adset["campaign_id"], adset["client_id"])
+    ingester.ingest_adsets(data["adsets"])
 
     # Ingest ads
     logger.info(f"Ingesting {len(data['ads'])} ads...")
-    for ad in data["ads"]:
-        ingester.ingest_ad(ad, ad["adset_id"], ad["client_id"])
-
-    # Ingest metrics (batched by entity)
-    logger.info(f"Ingesting {len(data['metrics'])} metric records...")
-    metrics_by_entity = {}
-    for metric in data["metrics"]:
-        key = metric["id"].rsplit("_", 1)[0]  # Entity ID
-        if key not in metrics_by_entity:
-            metrics_by_entity[key] = []
-        metrics_by_entity[key].append(metric)
-
-    # Find entity info for each metric batch
-    entity_info = {}
-    for campaign in data["campaigns"]:
-        entity_info[campaign["id"]] = ("campaign", campaign["client_id"])
-    for adset in data["adsets"]:
-        entity_info[adset["id"]] = ("adset", adset["client_id"])
-    for ad in data["ads"]:
-        entity_info[ad["id"]] = ("ad", ad["client_id"])
-
-    for entity_id, metrics in metrics_by_entity.items():
-        if entity_id in entity_info:
-            entity_type, client_id = entity_info[entity_id]
-            ingester.ingest_metrics(metrics, entity_type, entity_id, client_id)
+    ingester.ingest_ads(data["ads"])
+
+    # Ingest metrics, one column batch per entity, over one session
+    logger.info(f"Ingesting {metric_count} metric records...")
+    with neo4j_client.bulk_session() as bulk:
+        for batch in data["metrics"]:
+            ingester.ingest_metric_columns(
+                batch["columns"],
+                batch["entity_type"],
+                batch["entity_id"],
+                batch["client_id"],
+                bulk,
+            )
 
     # Generate and ingest users
     logger.info("Generating and ingesting users...")
@@ -107,7 +94,7 @@ def main():
     logger.info(f"  Campaigns: {len(data['campaigns'])}")
     logger.info(f"  Ad Sets: {len(data['adsets'])}")
     logger.info(f"  Ads: {len(data['ads'])}")
-    logger.info(f"  Metrics: {len(data['metrics'])}")
+    logger.info(f"  Metrics: {metric_count}")
     logger.info(f"  Users: {len(users)}")
     logger.info("=" * 50)
     logger.info("\nTest credentials:")
@@ -37,26 +37,7 @@ async def sync_google_ads(client_id: str, account_id: str, start_date: date, end
         neo4j = get_neo4j_client()
         ingester = DataIngester(neo4j)
 
-        for campaign in data.get("campaigns", []):
-            ingester.ingest_campaign(campaign, client_id)
-
-        for adset in data.get("adsets", []):
-            ingester.ingest_adset(adset, adset["campaign_id"], client_id)
-
-        for ad in data.get("ads", []):
-            ingester.ingest_ad(ad, ad["adset_id"], client_id)
-
-        # Group and ingest metrics
-        metrics_by_entity = {}
-        for m in data.get("metrics", []):
-            key = f"{m['entity_type']}_{m['entity_id']}"
-            if key not in metrics_by_entity:
-                metrics_by_entity[key] = []
-            metrics_by_entity[key].append(m)
-
-        for key, metrics in metrics_by_entity.items():
-            entity_type, entity_id = key.split("_", 1)
-            ingester.ingest_metrics(metrics, entity_type, entity_id, client_id)
+        ingester.ingest_all(data, client_id)
 
         logger.info(
             f"Google Ads sync completed: {len(data.get('campaigns', []))} campaigns, "
@@ -85,26 +66,7 @@ async def sync_meta_ads(client_id: str, account_id: str, start_date: date, end_d
         neo4j = get_neo4j_client()
         ingester = DataIngester(neo4j)
 
-        for campaign in data.get("campaigns", []):
-            ingester.ingest_campaign(campaign, client_id)
-
-        for adset in data.get("adsets", []):
-            ingester.ingest_adset(adset, adset["campaign_id"], client_id)
-
-        for ad in data.get("ads", []):
-            ingester.ingest_ad(ad, ad["adset_id"], client_id)
-
-        # Group and ingest metrics
-        metrics_by_entity = {}
-        for m in data.get("metrics", []):
-            key = f"{m['entity_type']}_{m['entity_id']}"
-            if key not in metrics_by_entity:
-                metrics_by_entity[key] = []
-            metrics_by_entity[key].append(m)
-
-        for key, metrics in metrics_by_entity.items():
-            entity_type, entity_id = key.split("_", 1)
-            ingester.ingest_metrics(metrics, entity_type, entity_id, client_id)
+        ingester.ingest_all(data, client_id)
 
         logger.info(
             f"Meta Ads sync completed: {len(data.get('campaigns', []))} campaigns, "
@@ -115,6 +77,9 @@ async def sync_meta_ads(client_id: str, account_id: str, start_date: date, end_d
         logger.error(f"Meta Ads sync failed: {e}")
         raise
 
+    finally:
+        await connector.aclose()
+
 
 async def trigger_scheduled_sync(client_id: str | None = None):
     """Trigger the scheduled sync job."""
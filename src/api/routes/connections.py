@@ -369,23 +369,7 @@ async def trigger_sync(
         # Ingest data
         ingester = DataIngester(neo4j)
 
-        for campaign in data.get("campaigns", []):
-            ingester.ingest_campaign(campaign, sync_request.client_id)
-        for adset in data.get("adsets", []):
-            ingester.ingest_adset(adset, adset["campaign_id"], sync_request.client_id)
-        for ad in data.get("ads", []):
-            ingester.ingest_ad(ad, ad["adset_id"], sync_request.client_id)
-
-        metrics_by_entity: dict[str, list] = {}
-        for m in data.get("metrics", []):
-            key = f"{m['entity_type']}_{m['entity_id']}"
-            if key not in metrics_by_entity:
-                metrics_by_entity[key] = []
-            metrics_by_entity[key].append(m)
-
-        for key, metrics in metrics_by_entity.items():
-            entity_type, entity_id = key.split("_", 1)
-            ingester.ingest_metrics(metrics, entity_type, entity_id, sync_request.client_id)
+        ingester.ingest_all(data, sync_request.client_id)
 
         # Update connection last_sync
         neo4j.execute_query("""
@@ -419,3 +403,6 @@ async def trigger_sync(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Sync failed: {str(e)}",
         )
+
+    finally:
+        await connector.aclose()
@@ -285,20 +285,21 @@ async def ingest_mock_data(
 
     # Generate data
     campaigns_data = generator.generate_campaigns(client_id, campaigns)
+    adsets = [
+        adset
+        for campaign in campaigns_data
+        for adset in generator.generate_adsets(campaign["id"], client_id, 3)
+    ]
+    ads = [ad for adset in adsets for ad in generator.generate_ads(adset["id"], client_id, 5)]
+
+    # One round-trip per entity type
+    ingester.ingest_campaigns(campaigns_data, client_id)
+    ingester.ingest_adsets(adsets, client_id)
+    ingester.ingest_ads(ads, client_id)
 
     total_metrics = 0
     for campaign in campaigns_data:
-        campaign_id = ingester.ingest_campaign(campaign, client_id)
-
-        # Generate ad sets
-        adsets = generator.generate_adsets(campaign_id, client_id, 3)
-        for adset in adsets:
-            adset_id = ingester.ingest_adset(adset, campaign_id, client_id)
-
-            # Generate ads
-            ads = generator.generate_ads(adset_id, client_id, 5)
-            for ad in ads:
-                ingester.ingest_ad(ad, adset_id, client_id)
+        campaign_id = campaign["id"]
 
         # Generate metrics
         metrics = generator.generate_metrics(campaign_id, "campaign", client_id, days)
@@ -405,26 +406,7 @@ async def _run_sync(
 
         ingester = DataIngester(neo4j)
 
-        for campaign in data["campaigns"]:
-            ingester.ingest_campaign(campaign, client_id)
-
-        for adset in data["adsets"]:
-            ingester.ingest_adset(adset, adset["campaign_id"], client_id)
-
-        for ad in data["ads"]:
-            ingester.ingest_ad(ad, ad["adset_id"], client_id)
-
-        # Group metrics by entity and ingest
-        metrics_by_entity: dict[str, list] = {}
-        for m in data["metrics"]:
-            key = f"{m['entity_type']}_{m['entity_id']}"
-            if key not in metrics_by_entity:
-                metrics_by_entity[key] = []
-            metrics_by_entity[key].append(m)
-
-        for key, metrics in metrics_by_entity.items():
-            entity_type, entity_id = key.split("_", 1)
-            ingester.ingest_metrics(metrics, entity_type, entity_id, client_id)
+        ingester.ingest_all(data, client_id)
 
         logger.info(
             f"Sync completed for client {client_id}: "
@@ -434,3 +416,6 @@ async def _run_sync(
 
     except Exception as e:
         logger.error(f"Sync failed for client {client_id}: {e}")
+
+    finally:
+        await connector.aclose()
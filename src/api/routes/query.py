@@ -42,7 +42,7 @@ async def query(
 
     try:
         # Execute query
-        result = graphrag.query(
+        result = await graphrag.aquery(
             query=request.query,
             client_id=request.client_id,
             user_role=current_user.role.value,
@@ -88,11 +88,10 @@ async def create_report_schedule(
     schedule_id = str(uuid.uuid4())
 
     # Get client name
-    client_result = neo4j.execute_query(
+    client_name = neo4j.execute_scalar(
         "MATCH (c:Client {id: $client_id}) RETURN c.name as name",
         {"client_id": schedule.client_id},
     )
-    client_name = client_result[0]["name"] if client_result else None
 
     neo4j.execute_query("""
         CREATE (s:ReportSchedule {
@@ -358,11 +357,10 @@ async def _send_report_email(schedule, neo4j) -> dict[str, Any]:
     report_format = schedule.get("format", "pdf")
 
     # Get client name
-    client_result = neo4j.execute_query(
+    client_name = neo4j.execute_scalar(
         "MATCH (c:Client {id: $id}) RETURN c.name as name",
         {"id": client_id},
-    )
-    client_name = client_result[0]["name"] if client_result else "Unknown Client"
+    ) or "Unknown Client"
 
     if settings.email_configured:
         try:
@@ -4,6 +4,7 @@ from .base import (
     AuthenticationError,
     BaseConnector,
     ConnectorError,
+    MetricRow,
     RateLimitError,
     TemporaryError,
 )
@@ -17,6 +18,7 @@ __all__ = [
     "ConnectorError",
     "GoogleAdsConnector",
     "MetaAdsConnector",
+    "MetricRow",
     "MockDataGenerator",
     "RateLimitError",
     "TemporaryError",
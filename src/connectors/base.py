@@ -1,7 +1,9 @@
 """Base connector with retry logic and error handling."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date
 from typing import Any
 
@@ -41,6 +43,26 @@ class TemporaryError(ConnectorError):
     pass
 
 
+@dataclass(slots=True)
+class MetricRow:
+    """Daily performance metrics for a single entity."""
+
+    entity_id: str
+    entity_type: str
+    date: str
+    impressions: int
+    clicks: int
+    conversions: int
+    spend: float
+    spend_currency: str
+    revenue: float | None
+    revenue_currency: str | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert to the metric dictionary shape used by the ingester."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
 def create_retry_decorator(settings: Settings):
     """Create a retry decorator with settings-based configuration.
 
@@ -88,6 +110,15 @@ class BaseConnector(ABC):
         """Check if the connector is authenticated."""
         return self._is_authenticated
 
+    async def aclose(self) -> None:
+        """Release resources held by the connector. Nothing to release by default."""
+
+    async def __aenter__(self) -> "BaseConnector":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     @abstractmethod
     async def authenticate(self) -> bool:
         """Authenticate with the platform.
@@ -206,56 +237,56 @@ class BaseConnector(ABC):
             "client_id": client_id,
         }
 
-    async def sync_all(
+    async def fetch_all(
         self,
         account_id: str,
-        client_id: str,
         start_date: date,
         end_date: date,
-    ) -> dict[str, Any]:
-        """Sync all data for an account.
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch all entities and metrics for an account.
+
+        Only the entity hierarchy is sequential (ad sets need campaign IDs,
+        ads need ad set IDs), so each level's metrics are fetched
+        concurrently with the next level's entities.
 
         Args:
             account_id: Platform account ID.
-            client_id: Internal client ID.
-            start_date: Start date for sync.
-            end_date: End date for sync.
+            start_date: Start date for data fetch.
+            end_date: End date for data fetch.
 
         Returns:
-            Dictionary with all synced data.
+            Dictionary with raw campaigns, adsets, ads and metrics.
         """
-        if not self.is_authenticated:
-            await self.authenticate()
 
-        logger.info(f"Starting sync for account {account_id}")
+        async def _no_rows() -> list[dict[str, Any]]:
+            return []
 
         # Fetch campaigns
         campaigns = await self.fetch_campaigns(account_id, start_date, end_date)
         campaign_ids = [c["id"] for c in campaigns]
         logger.info(f"Fetched {len(campaigns)} campaigns")
 
-        # Fetch ad sets
-        adsets = []
-        if campaign_ids:
-            adsets = await self.fetch_adsets(
-                account_id, campaign_ids, start_date, end_date
-            )
+        # Fetch ad sets alongside campaign metrics
+        adsets, campaign_metrics = await asyncio.gather(
+            self.fetch_adsets(account_id, campaign_ids, start_date, end_date)
+            if campaign_ids
+            else _no_rows(),
+            self.fetch_metrics(
+                account_id, "campaign", campaign_ids, start_date, end_date
+            ),
+        )
         adset_ids = [a["id"] for a in adsets]
         logger.info(f"Fetched {len(adsets)} ad sets")
 
-        # Fetch ads
-        ads = []
-        if adset_ids:
-            ads = await self.fetch_ads(account_id, adset_ids, start_date, end_date)
+        # Fetch ads alongside ad set metrics
+        ads, adset_metrics = await asyncio.gather(
+            self.fetch_ads(account_id, adset_ids, start_date, end_date)
+            if adset_ids
+            else _no_rows(),
+            self.fetch_metrics(account_id, "adset", adset_ids, start_date, end_date),
+        )
         logger.info(f"Fetched {len(ads)} ads")
 
-        # Fetch metrics for all entities
-        campaign_metrics = await self.fetch_metrics(
-            account_id, "campaign", campaign_ids, start_date, end_date
-        )
-        adset_metrics = await self.fetch_metrics(
-            account_id, "adset", adset_ids, start_date, end_date
-        )
         ad_metrics = await self.fetch_metrics(
             account_id, "ad", [a["id"] for a in ads], start_date, end_date
         )
@@ -264,15 +295,53 @@ class BaseConnector(ABC):
             f"{len(adset_metrics)} adset, {len(ad_metrics)} ad"
         )
 
+        return {
+            "campaigns": campaigns,
+            "adsets": adsets,
+            "ads": ads,
+            "metrics": campaign_metrics + adset_metrics + ad_metrics,
+        }
+
+    async def sync_all(
+        self,
+        account_id: str,
+        client_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, Any]:
+        """Sync all data for an account.
+
+        Args:
+            account_id: Platform account ID.
+            client_id: Internal client ID.
+            start_date: Start date for sync.
+            end_date: End date for sync.
+
+        Returns:
+            Dictionary with all synced data.
+        """
+        if not self.is_authenticated:
+            await self.authenticate()
+
+        logger.info(f"Starting sync for account {account_id}")
+
+        data = await self.fetch_all(account_id, start_date, end_date)
+
         # Transform all data
         return {
             "campaigns": [
                 self.transform_to_graph_format(c, "campaign", client_id)
-                for c in campaigns
+                for c in data["campaigns"]
             ],
             "adsets": [
-                self.transform_to_graph_format(a, "adset", client_id) for a in adsets
+                self.transform_to_graph_format(a, "adset", client_id)
+                for a in data["adsets"]
+            ],
+            "ads": [
+                self.transform_to_graph_format(a, "ad", client_id) for a in data["ads"]
+            ],
+            "metrics": [
+                m.as_dict() if isinstance(m, MetricRow) else m
+                for m in data["metrics"]
             ],
-            "ads": [self.transform_to_graph_format(a, "ad", client_id) for a in ads],
-            "metrics": campaign_metrics + adset_metrics + ad_metrics,
         }
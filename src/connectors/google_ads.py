@@ -1,20 +1,36 @@
 """Google Ads API connector."""
 
+import asyncio
 import logging
 from datetime import date
-from typing import Any
+from hashlib import blake2b
+from operator import attrgetter
+from typing import Any, Final
+
+import diskcache
+from aiolimiter import AsyncLimiter
 
 from config.settings import Settings, get_settings
 
 from .base import (
     AuthenticationError,
     BaseConnector,
+    MetricRow,
     RateLimitError,
     TemporaryError,
 )
 
 logger = logging.getLogger(__name__)
 
+# Google Ads reports money in micros (millionths of the account currency).
+# Kept as a divisor: multiplying by 1e-6 is not correctly rounded and turns
+# e.g. 100_000 micros into 0.09999999999999999.
+_MICROS_PER_UNIT: Final = 1_000_000
+
+# Response cache TTLs (seconds)
+_ENTITY_CACHE_TTL = 3600  # Campaign/ad group/ad lists change slowly
+_OPEN_METRICS_CACHE_TTL = 300  # Metrics for ranges that include today
+
 
 class GoogleAdsConnector(BaseConnector):
     """Connector for Google Ads API."""
@@ -27,6 +43,16 @@ class GoogleAdsConnector(BaseConnector):
         """
         super().__init__(settings)
         self._client = None
+        # Shared across all accounts so concurrent pulls can't exceed the quota
+        self._limiter = AsyncLimiter(
+            max_rate=self._settings.GOOGLE_ADS_REQUESTS_PER_SECOND,
+            time_period=1,
+        )
+        self._cache = (
+            diskcache.Cache(self._settings.CONNECTOR_CACHE_DIR)
+            if self._settings.CONNECTOR_CACHE_DIR
+            else None
+        )
 
     @property
     def is_configured(self) -> bool:
@@ -70,7 +96,71 @@ class GoogleAdsConnector(BaseConnector):
 
         except Exception as e:
             logger.error(f"Google Ads authentication failed: {e}")
-            raise AuthenticationError(f"Google Ads authentication failed: {e}")
+            raise AuthenticationError(f"Google Ads authentication failed: {e}") from e
+
+    async def _search(self, account_id: str, query: str) -> list[Any]:
+        """Run a GAQL search through the shared rate limiter.
+
+        The SDK call is blocking and pages lazily, so the whole result set is
+        materialized in a worker thread to keep the event loop free.
+
+        Args:
+            account_id: Google Ads customer ID.
+            query: GAQL query string.
+
+        Returns:
+            List of result rows.
+        """
+        ga_service = self._client.get_service("GoogleAdsService")
+
+        async with self._limiter:
+            return await asyncio.to_thread(
+                lambda: list(ga_service.search(customer_id=account_id, query=query))
+            )
+
+    def _cache_key(self, account_id: str, query: str) -> str:
+        """Build the response cache key for a query."""
+        return blake2b(f"{account_id}|{query}".encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> list[Any] | None:
+        """Get cached rows, or None on a miss or when caching is disabled."""
+        if self._cache is None:
+            return None
+        return self._cache.get(key)
+
+    def _cache_set(
+        self, key: str, rows: list[Any], ttl: float | None
+    ) -> None:
+        """Cache rows for a query; a ttl of None never expires."""
+        if self._cache is not None:
+            self._cache.set(key, rows, expire=ttl)
+
+    async def fetch_campaigns_many(
+        self,
+        account_ids: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch campaigns for several accounts concurrently.
+
+        Requests from different accounts are interleaved by the shared rate
+        limiter rather than draining one customer at a time.
+
+        Args:
+            account_ids: Google Ads customer IDs.
+            start_date: Start date for data.
+            end_date: End date for data.
+
+        Returns:
+            Mapping of account ID to its campaign dictionaries.
+        """
+        results = await asyncio.gather(
+            *(
+                self.fetch_campaigns(account_id, start_date, end_date)
+                for account_id in account_ids
+            )
+        )
+        return dict(zip(account_ids, results))
 
     async def fetch_campaigns(
         self,
@@ -91,8 +181,6 @@ class GoogleAdsConnector(BaseConnector):
         if not self._client:
             raise AuthenticationError("Not authenticated")
 
-        ga_service = self._client.get_service("GoogleAdsService")
-
         query = """
             SELECT
                 campaign.id,
@@ -106,14 +194,20 @@ class GoogleAdsConnector(BaseConnector):
             WHERE campaign.status != 'REMOVED'
         """
 
+        cache_key = self._cache_key(account_id, query)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         campaigns = []
 
         try:
-            response = ga_service.search(customer_id=account_id, query=query)
+            response = await self._search(account_id, query)
 
             for row in response:
                 campaign = row.campaign
                 budget = row.campaign_budget
+                campaign_id = str(campaign.id)
 
                 # Map status
                 status_map = {
@@ -131,8 +225,8 @@ class GoogleAdsConnector(BaseConnector):
 
                 campaigns.append(
                     {
-                        "id": str(campaign.id),
-                        "external_id": str(campaign.id),
+                        "id": campaign_id,
+                        "external_id": campaign_id,
                         "name": campaign.name,
                         "status": status_map.get(campaign.status, "paused"),
                         "objective": objective_map.get(
@@ -140,7 +234,7 @@ class GoogleAdsConnector(BaseConnector):
                         ),
                         "start_date": campaign.start_date,
                         "end_date": campaign.end_date if campaign.end_date else None,
-                        "budget": budget.amount_micros / 1_000_000
+                        "budget": budget.amount_micros / _MICROS_PER_UNIT
                         if budget.amount_micros
                         else 0,
                         "budget_currency": "USD",  # Default, would need account info
@@ -149,16 +243,18 @@ class GoogleAdsConnector(BaseConnector):
                 )
 
             logger.info(f"Fetched {len(campaigns)} campaigns from Google Ads")
+            self._cache_set(cache_key, campaigns, _ENTITY_CACHE_TTL)
             return campaigns
 
         except Exception as e:
-            error_str = str(e).lower()
+            detail = str(e)
+            error_str = detail.lower()
             if "rate" in error_str or "quota" in error_str:
-                raise RateLimitError(f"Google Ads rate limit: {e}")
+                raise RateLimitError(f"Google Ads rate limit: {detail}") from e
             elif "unauthorized" in error_str or "permission" in error_str:
-                raise AuthenticationError(f"Google Ads auth error: {e}")
+                raise AuthenticationError(f"Google Ads auth error: {detail}") from e
             elif "unavailable" in error_str or "timeout" in error_str:
-                raise TemporaryError(f"Google Ads temporary error: {e}")
+                raise TemporaryError(f"Google Ads temporary error: {detail}") from e
             raise
 
     async def fetch_adsets(
@@ -182,8 +278,6 @@ class GoogleAdsConnector(BaseConnector):
         if not self._client:
             raise AuthenticationError("Not authenticated")
 
-        ga_service = self._client.get_service("GoogleAdsService")
-
         campaign_filter = ", ".join(f"'{cid}'" for cid in campaign_ids)
         query = f"""
             SELECT
@@ -197,27 +291,33 @@ class GoogleAdsConnector(BaseConnector):
                 AND ad_group.campaign IN ({campaign_filter})
         """
 
+        cache_key = self._cache_key(account_id, query)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         adsets = []
 
         try:
-            response = ga_service.search(customer_id=account_id, query=query)
+            response = await self._search(account_id, query)
 
             for row in response:
                 ad_group = row.ad_group
+                adset_id = str(ad_group.id)
 
                 status_map = {2: "active", 3: "paused"}
 
                 # Extract campaign ID from resource name
-                campaign_id = ad_group.campaign.split("/")[-1]
+                campaign_id = ad_group.campaign.rpartition("/")[2]
 
                 adsets.append(
                     {
-                        "id": str(ad_group.id),
-                        "external_id": str(ad_group.id),
+                        "id": adset_id,
+                        "external_id": adset_id,
                         "campaign_id": campaign_id,
                         "name": ad_group.name,
                         "status": status_map.get(ad_group.status, "paused"),
-                        "budget": ad_group.cpc_bid_micros / 1_000_000
+                        "budget": ad_group.cpc_bid_micros / _MICROS_PER_UNIT
                         if ad_group.cpc_bid_micros
                         else 0,
                         "budget_currency": "USD",
@@ -226,13 +326,15 @@ class GoogleAdsConnector(BaseConnector):
                 )
 
             logger.info(f"Fetched {len(adsets)} ad groups from Google Ads")
+            self._cache_set(cache_key, adsets, _ENTITY_CACHE_TTL)
             return adsets
 
         except Exception as e:
-            error_str = str(e).lower()
+            detail = str(e)
+            error_str = detail.lower()
             if "rate" in error_str or "quota" in error_str:
-                raise RateLimitError(f"Google Ads rate limit: {e}")
-            raise TemporaryError(f"Google Ads error: {e}")
+                raise RateLimitError(f"Google Ads rate limit: {detail}") from e
+            raise TemporaryError(f"Google Ads error: {detail}") from e
 
     async def fetch_ads(
         self,
@@ -255,8 +357,6 @@ class GoogleAdsConnector(BaseConnector):
         if not self._client:
             raise AuthenticationError("Not authenticated")
 
-        ga_service = self._client.get_service("GoogleAdsService")
-
         adgroup_filter = ", ".join(f"'{aid}'" for aid in adset_ids)
         query = f"""
             SELECT
@@ -272,17 +372,23 @@ class GoogleAdsConnector(BaseConnector):
                 AND ad_group_ad.ad_group IN ({adgroup_filter})
         """
 
+        cache_key = self._cache_key(account_id, query)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         ads = []
 
         try:
-            response = ga_service.search(customer_id=account_id, query=query)
+            response = await self._search(account_id, query)
 
             for row in response:
                 ad = row.ad_group_ad.ad
+                ad_id = str(ad.id)
                 status_map = {2: "active", 3: "paused"}
 
                 # Extract ad group ID
-                adset_id = row.ad_group_ad.ad_group.split("/")[-1]
+                adset_id = row.ad_group_ad.ad_group.rpartition("/")[2]
 
                 # Get headline and description
                 headline = ""
@@ -302,10 +408,10 @@ class GoogleAdsConnector(BaseConnector):
 
                 ads.append(
                     {
-                        "id": str(ad.id),
-                        "external_id": str(ad.id),
+                        "id": ad_id,
+                        "external_id": ad_id,
                         "adset_id": adset_id,
-                        "name": ad.name or f"Ad {ad.id}",
+                        "name": ad.name or f"Ad {ad_id}",
                         "headline": headline,
                         "description": description,
                         "creative_type": type_map.get(ad.type, "text"),
@@ -314,13 +420,15 @@ class GoogleAdsConnector(BaseConnector):
                 )
 
             logger.info(f"Fetched {len(ads)} ads from Google Ads")
+            self._cache_set(cache_key, ads, _ENTITY_CACHE_TTL)
             return ads
 
         except Exception as e:
-            error_str = str(e).lower()
+            detail = str(e)
+            error_str = detail.lower()
             if "rate" in error_str or "quota" in error_str:
-                raise RateLimitError(f"Google Ads rate limit: {e}")
-            raise TemporaryError(f"Google Ads error: {e}")
+                raise RateLimitError(f"Google Ads rate limit: {detail}") from e
+            raise TemporaryError(f"Google Ads error: {detail}") from e
 
     async def fetch_metrics(
         self,
@@ -329,7 +437,7 @@ class GoogleAdsConnector(BaseConnector):
         entity_ids: list[str],
         start_date: date,
         end_date: date,
-    ) -> list[dict[str, Any]]:
+    ) -> list[MetricRow]:
         """Fetch performance metrics from Google Ads.
 
         Args:
@@ -340,13 +448,11 @@ class GoogleAdsConnector(BaseConnector):
             end_date: End date.
 
         Returns:
-            List of daily metric dictionaries.
+            List of daily metric rows.
         """
         if not self._client or not entity_ids:
             return []
 
-        ga_service = self._client.get_service("GoogleAdsService")
-
         # Map entity types to Google Ads resources
         resource_map = {
             "campaign": "campaign",
@@ -357,6 +463,8 @@ class GoogleAdsConnector(BaseConnector):
 
         id_filter = ", ".join(f"'{eid}'" for eid in entity_ids)
         id_field = f"{resource}.id" if resource != "ad_group_ad" else "ad_group_ad.ad.id"
+        # Resolve the row's ID path once instead of branching per row
+        get_entity_id = attrgetter(id_field)
 
         query = f"""
             SELECT
@@ -372,46 +480,48 @@ class GoogleAdsConnector(BaseConnector):
                 AND segments.date BETWEEN '{start_date}' AND '{end_date}'
         """
 
+        cache_key = self._cache_key(account_id, query)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         metrics = []
 
         try:
-            response = ga_service.search(customer_id=account_id, query=query)
+            response = await self._search(account_id, query)
 
             for row in response:
-                # Get entity ID based on type
-                if entity_type == "campaign":
-                    entity_id = str(row.campaign.id)
-                elif entity_type == "adset":
-                    entity_id = str(row.ad_group.id)
-                else:
-                    entity_id = str(row.ad_group_ad.ad.id)
-
+                entity_id = str(get_entity_id(row))
                 m = row.metrics
                 metrics.append(
-                    {
-                        "entity_id": entity_id,
-                        "entity_type": entity_type,
-                        "date": row.segments.date,
-                        "impressions": m.impressions,
-                        "clicks": m.clicks,
-                        "conversions": int(m.conversions),
-                        "spend": m.cost_micros / 1_000_000,
-                        "spend_currency": "USD",
-                        "revenue": m.conversions_value if m.conversions_value else None,
-                        "revenue_currency": "USD" if m.conversions_value else None,
-                    }
+                    MetricRow(
+                        entity_id=entity_id,
+                        entity_type=entity_type,
+                        date=row.segments.date,
+                        impressions=m.impressions,
+                        clicks=m.clicks,
+                        conversions=int(m.conversions),
+                        spend=m.cost_micros / _MICROS_PER_UNIT,
+                        spend_currency="USD",
+                        revenue=m.conversions_value if m.conversions_value else None,
+                        revenue_currency="USD" if m.conversions_value else None,
+                    )
                 )
 
             logger.info(
                 f"Fetched {len(metrics)} metric records from Google Ads for {entity_type}"
             )
+            # Metrics for fully closed date ranges no longer change
+            ttl = None if end_date < date.today() else _OPEN_METRICS_CACHE_TTL
+            self._cache_set(cache_key, metrics, ttl)
             return metrics
 
         except Exception as e:
-            error_str = str(e).lower()
+            detail = str(e)
+            error_str = detail.lower()
             if "rate" in error_str or "quota" in error_str:
-                raise RateLimitError(f"Google Ads rate limit: {e}")
-            raise TemporaryError(f"Google Ads error: {e}")
+                raise RateLimitError(f"Google Ads rate limit: {detail}") from e
+            raise TemporaryError(f"Google Ads error: {detail}") from e
 
     def transform_to_graph_format(
         self,
@@ -1,9 +1,20 @@
 """Meta Marketing API connector."""
 
+import asyncio
+import json
 import logging
+import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache, partial, wraps
+from itertools import islice
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 
+from aiolimiter import AsyncLimiter
+
 from config.settings import Settings, get_settings
 
 from .base import (
@@ -15,6 +26,425 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> str:
+        # Same compact layout orjson produces
+        return json.dumps(obj, separators=(",", ":"))
+
+
+# Upper bound on Graph API requests in flight per connector instance
+_MAX_CONCURRENT_REQUESTS = 64
+
+# Graph API limit on sub-requests per batch call
+_BATCH_SIZE = 50
+
+
+_CAMPAIGN_STATUS_MAP = MappingProxyType(
+    {
+        "ACTIVE": "active",
+        "PAUSED": "paused",
+        "DELETED": "completed",
+        "ARCHIVED": "completed",
+    }
+)
+
+# Ad sets and ads only distinguish running from not running
+_DELIVERY_STATUS_MAP = MappingProxyType({"ACTIVE": "active", "PAUSED": "paused"})
+
+_OBJECTIVE_MAP = MappingProxyType(
+    {
+        "BRAND_AWARENESS": "awareness",
+        "REACH": "awareness",
+        "TRAFFIC": "traffic",
+        "ENGAGEMENT": "engagement",
+        "APP_INSTALLS": "conversions",
+        "VIDEO_VIEWS": "engagement",
+        "LEAD_GENERATION": "leads",
+        "CONVERSIONS": "conversions",
+        "CATALOG_SALES": "sales",
+        "STORE_TRAFFIC": "traffic",
+        "OUTCOME_AWARENESS": "awareness",
+        "OUTCOME_ENGAGEMENT": "engagement",
+        "OUTCOME_LEADS": "leads",
+        "OUTCOME_SALES": "sales",
+        "OUTCOME_TRAFFIC": "traffic",
+    }
+)
+
+# Rows per page; the Graph API default of 25 costs a round-trip per 25 rows
+_PAGE_SIZE = 500
+
+# Skip deleted objects server-side, matching the Google Ads connector's
+# REMOVED filter
+_LIVE_OBJECTS_PARAMS = MappingProxyType(
+    {"filtering": [{"field": "effective_status", "operator": "NOT_IN", "value": ["DELETED"]}]}
+)
+
+# SDK classes, loaded once by _load_sdk() when the connector authenticates
+_sdk = SimpleNamespace()
+
+# Field lists, built by _load_sdk() from the SDK's field constants
+_CAMPAIGN_FIELDS: list[str] = []
+_ADSET_FIELDS: list[str] = []
+_AD_FIELDS: list[str] = []
+_INSIGHTS_FIELDS: list[str] = []
+_ENTITY_CLASSES: dict[str, Any] = {}
+
+
+def _load_sdk() -> None:
+    """Import the facebook-business SDK once and build the field lists."""
+    global _CAMPAIGN_FIELDS, _ADSET_FIELDS, _AD_FIELDS, _INSIGHTS_FIELDS
+
+    if hasattr(_sdk, "FacebookAdsApi"):
+        return
+
+    from facebook_business.adobjects.ad import Ad
+    from facebook_business.adobjects.adaccount import AdAccount
+    from facebook_business.adobjects.adset import AdSet
+    from facebook_business.adobjects.adsinsights import AdsInsights
+    from facebook_business.adobjects.campaign import Campaign
+    from facebook_business.api import FacebookAdsApi
+
+    _CAMPAIGN_FIELDS = [
+        Campaign.Field.id,
+        Campaign.Field.name,
+        Campaign.Field.status,
+        Campaign.Field.objective,
+        Campaign.Field.start_time,
+        Campaign.Field.stop_time,
+        Campaign.Field.daily_budget,
+        Campaign.Field.lifetime_budget,
+    ]
+    _ADSET_FIELDS = [
+        AdSet.Field.id,
+        AdSet.Field.name,
+        AdSet.Field.status,
+        AdSet.Field.campaign_id,
+        AdSet.Field.daily_budget,
+        AdSet.Field.lifetime_budget,
+        AdSet.Field.targeting,
+    ]
+    _AD_FIELDS = [
+        Ad.Field.id,
+        Ad.Field.name,
+        Ad.Field.status,
+        Ad.Field.adset_id,
+        # Expand the creative so its type can be read from structured fields
+        f"{Ad.Field.creative}{{{','.join(_CREATIVE_DETAIL_FIELDS)}}}",
+    ]
+    _INSIGHTS_FIELDS = [
+        AdsInsights.Field.impressions,
+        AdsInsights.Field.clicks,
+        AdsInsights.Field.conversions,
+        AdsInsights.Field.spend,
+        AdsInsights.Field.purchase_roas,
+    ]
+    _ENTITY_CLASSES.update(campaign=Campaign, adset=AdSet, ad=Ad)
+    _sdk.__dict__.update(
+        Ad=Ad,
+        AdAccount=AdAccount,
+        AdSet=AdSet,
+        AdsInsights=AdsInsights,
+        Campaign=Campaign,
+        FacebookAdsApi=FacebookAdsApi,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _iso_date(timestamp: str | None) -> str | None:
+    """Return the YYYY-MM-DD part of a Graph API timestamp.
+
+    Campaigns in an account tend to share start and stop times, so repeated
+    timestamps reuse the same sliced string.
+    """
+    return timestamp[:10] if timestamp else None
+
+
+def _budget(daily_cents: str | None, lifetime_cents: str | None) -> float:
+    """Convert a Graph API budget (daily, else lifetime) from cents.
+
+    Budgets arrive as integer strings, so they are parsed as int and divided
+    once; unlike multiplying by 0.01, true division gives the correctly
+    rounded amount for every cent value.
+    """
+    return int(daily_cents or lifetime_cents or 0) / 100
+
+
+def _row_from_campaign(campaign: Any) -> dict[str, Any]:
+    """Convert a campaign (SDK object or batch dict) to a connector row."""
+    # Read each field once
+    get = campaign.get
+    campaign_id = campaign[_sdk.Campaign.Field.id]
+
+    return {
+        "id": campaign_id,
+        "external_id": campaign_id,
+        "name": campaign[_sdk.Campaign.Field.name],
+        "status": _CAMPAIGN_STATUS_MAP.get(get(_sdk.Campaign.Field.status), "paused"),
+        "objective": _OBJECTIVE_MAP.get(get(_sdk.Campaign.Field.objective), "conversions"),
+        "start_date": _iso_date(get(_sdk.Campaign.Field.start_time)),
+        "end_date": _iso_date(get(_sdk.Campaign.Field.stop_time)),
+        "budget": _budget(
+            get(_sdk.Campaign.Field.daily_budget), get(_sdk.Campaign.Field.lifetime_budget)
+        ),
+        "budget_currency": "USD",
+        "channel": "meta",
+    }
+
+
+def _row_from_adset(adset: Any, campaign_id: str) -> dict[str, Any]:
+    """Convert an ad set (SDK object or batch dict) to a connector row."""
+    get = adset.get
+    adset_id = adset[_sdk.AdSet.Field.id]
+
+    # Convert targeting to JSON string
+    targeting_spec = get(_sdk.AdSet.Field.targeting)
+    targeting = _json_dumps(targeting_spec) if targeting_spec else "{}"
+
+    return {
+        "id": adset_id,
+        "external_id": adset_id,
+        "campaign_id": campaign_id,
+        "name": adset[_sdk.AdSet.Field.name],
+        "status": _DELIVERY_STATUS_MAP.get(get(_sdk.AdSet.Field.status), "paused"),
+        "budget": _budget(
+            get(_sdk.AdSet.Field.daily_budget), get(_sdk.AdSet.Field.lifetime_budget)
+        ),
+        "budget_currency": "USD",
+        "targeting": targeting,
+    }
+
+
+# Expanded creative fields that _creative_type() classifies from
+_CREATIVE_DETAIL_FIELDS = ("object_type", "video_id", "object_story_spec")
+
+# Fallback for creatives returned without their expanded fields
+_CREATIVE_TYPE_RE = re.compile(r"video|carousel", re.IGNORECASE)
+
+
+def _creative_type(creative: Any) -> str:
+    """Classify an ad creative as video, carousel or image."""
+    if not creative:
+        return "image"
+
+    if not any(field in creative for field in _CREATIVE_DETAIL_FIELDS):
+        found = {match.lower() for match in _CREATIVE_TYPE_RE.findall(repr(creative))}
+        if "video" in found:
+            return "video"
+        return "carousel" if "carousel" in found else "image"
+
+    story_spec = creative.get("object_story_spec") or {}
+    if (
+        creative.get("video_id")
+        or creative.get("object_type") == "VIDEO"
+        or story_spec.get("video_data")
+    ):
+        return "video"
+
+    link_data = story_spec.get("link_data") or {}
+    if link_data.get("child_attachments"):
+        return "carousel"
+
+    return "image"
+
+
+def _row_from_ad(ad: Any, adset_id: str) -> dict[str, Any]:
+    """Convert an ad (SDK object or batch dict) to a connector row."""
+    return {
+        "id": ad[_sdk.Ad.Field.id],
+        "external_id": ad[_sdk.Ad.Field.id],
+        "adset_id": adset_id,
+        "name": ad[_sdk.Ad.Field.name],
+        "headline": "",  # Would need to fetch creative details
+        "description": "",
+        "creative_type": _creative_type(ad.get(_sdk.Ad.Field.creative)),
+        "status": _DELIVERY_STATUS_MAP.get(ad.get(_sdk.Ad.Field.status), "paused"),
+    }
+
+
+def _row_from_insight(insight: Any, entity_id: str, entity_type: str) -> dict[str, Any]:
+    """Convert one daily insights record to a metric row."""
+    spend = float(insight.get(_sdk.AdsInsights.Field.spend, 0))
+
+    # Action stats always carry a "value", so index it directly
+    conversions = sum(
+        int(conv["value"]) for conv in insight.get(_sdk.AdsInsights.Field.conversions) or ()
+    )
+
+    # Get revenue from ROAS
+    roas_data = insight.get(_sdk.AdsInsights.Field.purchase_roas)
+    revenue = spend * float(roas_data[0]["value"]) if roas_data else None
+
+    return {
+        "entity_id": entity_id,
+        "entity_type": entity_type,
+        "date": insight.get("date_start"),
+        "impressions": int(insight.get(_sdk.AdsInsights.Field.impressions, 0)),
+        "clicks": int(insight.get(_sdk.AdsInsights.Field.clicks, 0)),
+        "conversions": conversions,
+        "spend": spend,
+        "spend_currency": "USD",
+        "revenue": revenue,
+        "revenue_currency": "USD" if revenue else None,
+    }
+
+
+# Transient statuses retried by the HTTP adapter before the SDK sees them
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _mount_pooled_adapter(api: Any) -> None:
+    """Size the SDK's HTTP connection pool for concurrent requests.
+
+    The SDK's requests session keeps only 10 connections per host, so with
+    more threads in flight the extras are opened and thrown away, paying a
+    TLS handshake each time. The adapter is mounted on the existing session
+    to keep the SDK's access token params and CA bundle.
+
+    Args:
+        api: Initialized FacebookAdsApi instance.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    adapter = HTTPAdapter(
+        pool_maxsize=_MAX_CONCURRENT_REQUESTS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            raise_on_status=False,
+        ),
+    )
+    api._session.requests.mount("https://", adapter)
+
+
+# Usage percentage above which requests are spread out ahead of throttling
+_USAGE_THRESHOLD = 75
+
+# Longest pause applied for usage alone, at 100% of a quota
+_MAX_USAGE_PAUSE_SECONDS = 60.0
+
+
+def _usage_pause(headers: Mapping[str, str]) -> float:
+    """Work out how long to pause from Graph API usage headers.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Seconds to wait before the next request, 0 if none.
+    """
+    usages = []
+    regain_minutes = 0
+
+    if app_usage := headers.get("x-app-usage"):
+        usages.append(json.loads(app_usage))
+
+    if business_usage := headers.get("x-business-use-case-usage"):
+        for entries in json.loads(business_usage).values():
+            for entry in entries:
+                usages.append(entry)
+                regain_minutes = max(
+                    regain_minutes, entry.get("estimated_time_to_regain_access") or 0
+                )
+
+    if regain_minutes:
+        return regain_minutes * 60.0
+
+    peak = max(
+        (
+            usage.get(key) or 0
+            for usage in usages
+            for key in ("call_count", "total_cputime", "total_time")
+        ),
+        default=0,
+    )
+    if peak <= _USAGE_THRESHOLD:
+        return 0.0
+
+    overshoot = min(peak, 100) - _USAGE_THRESHOLD
+    return _MAX_USAGE_PAUSE_SECONDS * overshoot / (100 - _USAGE_THRESHOLD)
+
+
+class MetaRateLimiter:
+    """Paces Graph API requests for one connector.
+
+    Caps requests in flight and the request rate, and holds new requests
+    back when Meta's usage headers report a quota nearing its limit.
+    """
+
+    def __init__(self, max_rate: float, max_concurrency: int):
+        """Initialize rate limiter.
+
+        Args:
+            max_rate: Requests allowed per second.
+            max_concurrency: Requests allowed in flight at once.
+        """
+        self._rate = AsyncLimiter(max_rate=max_rate, time_period=1)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._resume_at = 0.0
+
+    def on_response(self, response: Any, *args: Any, **kwargs: Any) -> None:
+        """requests response hook recording usage headers.
+
+        Runs on SDK worker threads.
+        """
+        try:
+            pause = _usage_pause(response.headers)
+        except (ValueError, AttributeError) as e:
+            logger.debug(f"Ignoring malformed Meta usage headers: {e}")
+            return
+
+        if pause:
+            logger.warning(f"Meta API usage high, pausing requests for {pause:.0f}s")
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+
+    async def __aenter__(self) -> "MetaRateLimiter":
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._semaphore.acquire()
+        try:
+            await self._rate.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Split items into lists of at most size elements."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _require_auth(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Reject calls made before authenticate() with AuthenticationError.
+
+    The check runs when the method is called, so wrapped async generators
+    fail before their first row is requested.
+    """
+
+    @wraps(func)
+    def wrapper(self: "MetaAdsConnector", *args: Any, **kwargs: Any) -> Any:
+        if not self._api:
+            raise AuthenticationError("Not authenticated")
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
 
 class MetaAdsConnector(BaseConnector):
     """Connector for Meta (Facebook/Instagram) Marketing API."""
@@ -27,6 +457,11 @@ class MetaAdsConnector(BaseConnector):
         """
         super().__init__(settings)
         self._api = None
+        self._limiter = MetaRateLimiter(
+            max_rate=self._settings.META_ADS_REQUESTS_PER_SECOND,
+            max_concurrency=_MAX_CONCURRENT_REQUESTS,
+        )
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def is_configured(self) -> bool:
@@ -46,15 +481,18 @@ class MetaAdsConnector(BaseConnector):
             raise AuthenticationError("Meta Marketing API is not configured")
 
         try:
-            from facebook_business.api import FacebookAdsApi
+            _load_sdk()
 
-            FacebookAdsApi.init(
+            await self._run_blocking(
+                _sdk.FacebookAdsApi.init,
                 app_id=self._settings.META_APP_ID,
                 app_secret=self._settings.META_APP_SECRET,
                 access_token=self._settings.META_ACCESS_TOKEN,
             )
 
-            self._api = FacebookAdsApi.get_default_api()
+            self._api = _sdk.FacebookAdsApi.get_default_api()
+            _mount_pooled_adapter(self._api)
+            self._api._session.requests.hooks["response"].append(self._limiter.on_response)
             self._is_authenticated = True
             logger.info("Meta Marketing API authentication successful")
             return True
@@ -63,6 +501,208 @@ class MetaAdsConnector(BaseConnector):
             logger.error(f"Meta Marketing API authentication failed: {e}")
             raise AuthenticationError(f"Meta authentication failed: {e}")
 
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections, SDK worker threads and the API session."""
+        if self._api is not None:
+            await self._run_blocking(self._api._session.requests.close)
+            self._api = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._is_authenticated = False
+
+    def _run_blocking(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking SDK call on this connector's worker threads.
+
+        A dedicated pool sized to the request limit keeps Meta fan-out from
+        queueing behind other connectors on the loop's default executor.
+
+        Returns:
+            Awaitable resolving to the call's result.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=_MAX_CONCURRENT_REQUESTS, thread_name_prefix="meta-sdk"
+            )
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def _run_in_thread(self, func: Callable[..., Any], /, *args: Any) -> Any:
+        """Run a blocking SDK request in a worker thread, paced by the limiter."""
+        async with self._limiter:
+            return await self._run_blocking(func, *args)
+
+    def _run_batch(
+        self,
+        add_request: Callable[..., Any],
+        entity_ids: list[str],
+    ) -> dict[str, Any]:
+        """Execute one Graph API batch call for a chunk of entities.
+
+        Sub-requests that get no response are re-sent with exponential
+        backoff, up to RETRY_MAX_ATTEMPTS times. Entities still unanswered
+        after that are reported with a TemporaryError.
+
+        Args:
+            add_request: Adds the edge request for one entity to a batch.
+            entity_ids: Entity IDs to include in the batch.
+
+        Returns:
+            Response body or request error keyed by entity ID.
+        """
+        responses: dict[str, Any] = {}
+        batch = self._api.new_batch()
+
+        for entity_id in entity_ids:
+            add_request(
+                entity_id,
+                batch=batch,
+                success=lambda r, eid=entity_id: responses.__setitem__(eid, r.json()),
+                failure=lambda r, eid=entity_id: responses.__setitem__(eid, r.error()),
+            )
+
+        # execute() hands back the sub-requests that got no response
+        batch = batch.execute()
+        for attempt in range(self._settings.RETRY_MAX_ATTEMPTS):
+            if batch is None:
+                break
+            # Runs on an SDK worker thread, so sleeping blocks only this chunk
+            time.sleep(self._settings.RETRY_BASE_DELAY_SECONDS * 2**attempt)
+            batch = batch.execute()
+
+        if batch is not None:
+            unanswered = [eid for eid in entity_ids if eid not in responses]
+            logger.warning(
+                f"Meta batch left {len(unanswered)} sub-requests unanswered after "
+                f"{self._settings.RETRY_MAX_ATTEMPTS} retries: {unanswered}"
+            )
+            for entity_id in unanswered:
+                responses[entity_id] = TemporaryError(
+                    f"No batch response for {entity_id} after "
+                    f"{self._settings.RETRY_MAX_ATTEMPTS} retries"
+                )
+
+        return responses
+
+    def _run_ids_query(
+        self,
+        edge: str,
+        fields: str,
+        entity_ids: list[str],
+    ) -> dict[str, Any]:
+        """Read one edge for a chunk of entities with a single ids= request.
+
+        Args:
+            edge: Edge name, as keyed in each node of the response.
+            fields: Field expansion selecting the edge, e.g. "insights{spend}".
+            entity_ids: Entity IDs to include in the request.
+
+        Returns:
+            Edge response body keyed by entity ID.
+        """
+        response = self._api.call(
+            "GET", ("",), params={"ids": ",".join(entity_ids), "fields": fields}
+        )
+        return {entity_id: node.get(edge, {}) for entity_id, node in response.json().items()}
+
+    async def _iter_edges(
+        self,
+        run_chunk: Callable[[list[str]], dict[str, Any]],
+        fetch_one: Callable[[str], list[Any]],
+        entity_ids: list[str],
+    ) -> AsyncIterator[tuple[str, list[Any] | Exception]]:
+        """Fetch an edge (ad sets, ads, insights) for many entities.
+
+        Entities are fetched in chunks of up to 50, one HTTP call per chunk,
+        through a Graph API batch or an ids= request. Chunks run concurrently
+        and each entity is yielded as soon as its chunk completes. Entities
+        whose edge spans more than one page are re-fetched through the SDK
+        cursor so no rows are lost.
+
+        Args:
+            run_chunk: Fetches the first page of the edge for a chunk of
+                entities, returning response bodies or errors by entity ID.
+            fetch_one: Fetches every row of the edge for one entity.
+            entity_ids: Entity IDs to fetch.
+
+        Yields:
+            Entity ID with its rows, or the exception that prevented
+            fetching them.
+        """
+        # Pending work: a chunk of IDs for batch calls, or a single ID for a
+        # cursor re-fetch
+        pending: dict[asyncio.Future, list[str] | str] = {
+            asyncio.ensure_future(self._run_in_thread(run_chunk, chunk)): chunk
+            for chunk in _chunked(entity_ids, _BATCH_SIZE)
+        }
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    key = pending.pop(task)
+                    error = task.exception()
+
+                    if isinstance(key, str):
+                        yield key, error or task.result()
+                        continue
+
+                    if error is not None:
+                        for entity_id in key:
+                            yield entity_id, error
+                        continue
+
+                    for entity_id, body in task.result().items():
+                        if isinstance(body, Exception):
+                            yield entity_id, body
+                        elif body.get("paging", {}).get("next"):
+                            refetch = self._run_in_thread(fetch_one, entity_id)
+                            pending[asyncio.ensure_future(refetch)] = entity_id
+                        else:
+                            yield entity_id, body.get("data", [])
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @_require_auth
+    async def iter_campaigns(
+        self,
+        account_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream campaigns from Meta.
+
+        Args:
+            account_id: Meta ad account ID.
+            start_date: Start date.
+            end_date: End date.
+
+        Yields:
+            Campaign dictionaries.
+        """
+        try:
+            account = _sdk.AdAccount(f"act_{account_id}")
+
+            # Consume the cursor in the worker thread; later pages are
+            # fetched lazily during iteration
+            params = {**_LIVE_OBJECTS_PARAMS, "limit": _PAGE_SIZE}
+            campaigns_data = await self._run_in_thread(
+                lambda: list(account.get_campaigns(fields=_CAMPAIGN_FIELDS, params=params))
+            )
+
+            for campaign in campaigns_data:
+                yield _row_from_campaign(campaign)
+
+        except Exception as e:
+            error_str = str(e).lower()
+            if "rate" in error_str or "limit" in error_str:
+                raise RateLimitError(f"Meta rate limit: {e}")
+            elif "token" in error_str or "permission" in error_str:
+                raise AuthenticationError(f"Meta auth error: {e}")
+            raise TemporaryError(f"Meta error: {e}")
+
     async def fetch_campaigns(
         self,
         account_id: str,
@@ -79,94 +719,55 @@ class MetaAdsConnector(BaseConnector):
         Returns:
             List of campaign dictionaries.
         """
-        if not self._api:
-            raise AuthenticationError("Not authenticated")
+        campaigns = [row async for row in self.iter_campaigns(account_id, start_date, end_date)]
+        logger.info(f"Fetched {len(campaigns)} campaigns from Meta")
+        return campaigns
+
+    @_require_auth
+    async def iter_adsets(
+        self,
+        account_id: str,
+        campaign_ids: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream ad sets from Meta as each batch of campaigns completes.
+
+        Args:
+            account_id: Meta ad account ID.
+            campaign_ids: Campaign IDs to fetch ad sets for.
+            start_date: Start date.
+            end_date: End date.
 
+        Yields:
+            Ad set dictionaries.
+        """
         try:
-            from facebook_business.adobjects.adaccount import AdAccount
-            from facebook_business.adobjects.campaign import Campaign
-
-            account = AdAccount(f"act_{account_id}")
-
-            fields = [
-                Campaign.Field.id,
-                Campaign.Field.name,
-                Campaign.Field.status,
-                Campaign.Field.objective,
-                Campaign.Field.start_time,
-                Campaign.Field.stop_time,
-                Campaign.Field.daily_budget,
-                Campaign.Field.lifetime_budget,
-            ]
-
-            campaigns_data = account.get_campaigns(fields=fields)
-            campaigns = []
-
-            # Status mapping
-            status_map = {
-                "ACTIVE": "active",
-                "PAUSED": "paused",
-                "DELETED": "completed",
-                "ARCHIVED": "completed",
-            }
 
-            # Objective mapping
-            objective_map = {
-                "BRAND_AWARENESS": "awareness",
-                "REACH": "awareness",
-                "TRAFFIC": "traffic",
-                "ENGAGEMENT": "engagement",
-                "APP_INSTALLS": "conversions",
-                "VIDEO_VIEWS": "engagement",
-                "LEAD_GENERATION": "leads",
-                "CONVERSIONS": "conversions",
-                "CATALOG_SALES": "sales",
-                "STORE_TRAFFIC": "traffic",
-                "OUTCOME_AWARENESS": "awareness",
-                "OUTCOME_ENGAGEMENT": "engagement",
-                "OUTCOME_LEADS": "leads",
-                "OUTCOME_SALES": "sales",
-                "OUTCOME_TRAFFIC": "traffic",
-            }
+            params = {**_LIVE_OBJECTS_PARAMS, "limit": _PAGE_SIZE}
 
-            for campaign in campaigns_data:
-                # Get budget (daily or lifetime)
-                budget = 0
-                if campaign.get(Campaign.Field.daily_budget):
-                    budget = float(campaign[Campaign.Field.daily_budget]) / 100  # Cents
-                elif campaign.get(Campaign.Field.lifetime_budget):
-                    budget = float(campaign[Campaign.Field.lifetime_budget]) / 100
-
-                campaigns.append(
-                    {
-                        "id": campaign[Campaign.Field.id],
-                        "external_id": campaign[Campaign.Field.id],
-                        "name": campaign[Campaign.Field.name],
-                        "status": status_map.get(
-                            campaign.get(Campaign.Field.status), "paused"
-                        ),
-                        "objective": objective_map.get(
-                            campaign.get(Campaign.Field.objective), "conversions"
-                        ),
-                        "start_date": campaign.get(Campaign.Field.start_time, "")[:10],
-                        "end_date": campaign.get(Campaign.Field.stop_time, "")[:10]
-                        if campaign.get(Campaign.Field.stop_time)
-                        else None,
-                        "budget": budget,
-                        "budget_currency": "USD",
-                        "channel": "meta",
-                    }
+            def _add_request(campaign_id: str, **batch_args: Any) -> None:
+                _sdk.Campaign(campaign_id).get_ad_sets(
+                    fields=_ADSET_FIELDS, params=params, **batch_args
                 )
 
-            logger.info(f"Fetched {len(campaigns)} campaigns from Meta")
-            return campaigns
+            def _fetch_one(campaign_id: str) -> list[Any]:
+                campaign = _sdk.Campaign(campaign_id)
+                return list(campaign.get_ad_sets(fields=_ADSET_FIELDS, params=params))
+
+            async for campaign_id, rows in self._iter_edges(
+                partial(self._run_batch, _add_request), _fetch_one, campaign_ids
+            ):
+                if isinstance(rows, Exception):
+                    raise rows
+
+                for adset in rows:
+                    yield _row_from_adset(adset, campaign_id)
 
         except Exception as e:
             error_str = str(e).lower()
             if "rate" in error_str or "limit" in error_str:
                 raise RateLimitError(f"Meta rate limit: {e}")
-            elif "token" in error_str or "permission" in error_str:
-                raise AuthenticationError(f"Meta auth error: {e}")
             raise TemporaryError(f"Meta error: {e}")
 
     async def fetch_adsets(
@@ -187,61 +788,50 @@ class MetaAdsConnector(BaseConnector):
         Returns:
             List of ad set dictionaries.
         """
-        if not self._api:
-            raise AuthenticationError("Not authenticated")
+        adsets = [
+            row
+            async for row in self.iter_adsets(account_id, campaign_ids, start_date, end_date)
+        ]
+        logger.info(f"Fetched {len(adsets)} ad sets from Meta")
+        return adsets
+
+    @_require_auth
+    async def iter_ads(
+        self,
+        account_id: str,
+        adset_ids: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream ads from Meta as each batch of ad sets completes.
+
+        Args:
+            account_id: Meta ad account ID.
+            adset_ids: Ad set IDs to fetch ads for.
+            start_date: Start date.
+            end_date: End date.
 
+        Yields:
+            Ad dictionaries.
+        """
         try:
-            from facebook_business.adobjects.adset import AdSet
-            from facebook_business.adobjects.campaign import Campaign
-
-            adsets = []
-            status_map = {"ACTIVE": "active", "PAUSED": "paused"}
-
-            fields = [
-                AdSet.Field.id,
-                AdSet.Field.name,
-                AdSet.Field.status,
-                AdSet.Field.campaign_id,
-                AdSet.Field.daily_budget,
-                AdSet.Field.lifetime_budget,
-                AdSet.Field.targeting,
-            ]
-
-            for campaign_id in campaign_ids:
-                campaign = Campaign(campaign_id)
-                adsets_data = campaign.get_ad_sets(fields=fields)
-
-                for adset in adsets_data:
-                    budget = 0
-                    if adset.get(AdSet.Field.daily_budget):
-                        budget = float(adset[AdSet.Field.daily_budget]) / 100
-                    elif adset.get(AdSet.Field.lifetime_budget):
-                        budget = float(adset[AdSet.Field.lifetime_budget]) / 100
-
-                    # Convert targeting to JSON string
-                    targeting = "{}"
-                    if adset.get(AdSet.Field.targeting):
-                        import json
-
-                        targeting = json.dumps(adset[AdSet.Field.targeting])
-
-                    adsets.append(
-                        {
-                            "id": adset[AdSet.Field.id],
-                            "external_id": adset[AdSet.Field.id],
-                            "campaign_id": campaign_id,
-                            "name": adset[AdSet.Field.name],
-                            "status": status_map.get(
-                                adset.get(AdSet.Field.status), "paused"
-                            ),
-                            "budget": budget,
-                            "budget_currency": "USD",
-                            "targeting": targeting,
-                        }
-                    )
-
-            logger.info(f"Fetched {len(adsets)} ad sets from Meta")
-            return adsets
+
+            params = {**_LIVE_OBJECTS_PARAMS, "limit": _PAGE_SIZE}
+
+            def _add_request(adset_id: str, **batch_args: Any) -> None:
+                _sdk.AdSet(adset_id).get_ads(fields=_AD_FIELDS, params=params, **batch_args)
+
+            def _fetch_one(adset_id: str) -> list[Any]:
+                return list(_sdk.AdSet(adset_id).get_ads(fields=_AD_FIELDS, params=params))
+
+            async for adset_id, rows in self._iter_edges(
+                partial(self._run_batch, _add_request), _fetch_one, adset_ids
+            ):
+                if isinstance(rows, Exception):
+                    raise rows
+
+                for ad in rows:
+                    yield _row_from_ad(ad, adset_id)
 
         except Exception as e:
             error_str = str(e).lower()
@@ -267,71 +857,19 @@ class MetaAdsConnector(BaseConnector):
         Returns:
             List of ad dictionaries.
         """
-        if not self._api:
-            raise AuthenticationError("Not authenticated")
-
-        try:
-            from facebook_business.adobjects.ad import Ad
-            from facebook_business.adobjects.adset import AdSet
-
-            ads = []
-            status_map = {"ACTIVE": "active", "PAUSED": "paused"}
-
-            fields = [
-                Ad.Field.id,
-                Ad.Field.name,
-                Ad.Field.status,
-                Ad.Field.adset_id,
-                Ad.Field.creative,
-            ]
-
-            for adset_id in adset_ids:
-                adset = AdSet(adset_id)
-                ads_data = adset.get_ads(fields=fields)
-
-                for ad in ads_data:
-                    # Determine creative type from creative object
-                    creative_type = "image"
-                    if ad.get(Ad.Field.creative):
-                        creative = ad[Ad.Field.creative]
-                        if "video" in str(creative).lower():
-                            creative_type = "video"
-                        elif "carousel" in str(creative).lower():
-                            creative_type = "carousel"
-
-                    ads.append(
-                        {
-                            "id": ad[Ad.Field.id],
-                            "external_id": ad[Ad.Field.id],
-                            "adset_id": adset_id,
-                            "name": ad[Ad.Field.name],
-                            "headline": "",  # Would need to fetch creative details
-                            "description": "",
-                            "creative_type": creative_type,
-                            "status": status_map.get(
-                                ad.get(Ad.Field.status), "paused"
-                            ),
-                        }
-                    )
-
-            logger.info(f"Fetched {len(ads)} ads from Meta")
-            return ads
-
-        except Exception as e:
-            error_str = str(e).lower()
-            if "rate" in error_str or "limit" in error_str:
-                raise RateLimitError(f"Meta rate limit: {e}")
-            raise TemporaryError(f"Meta error: {e}")
+        ads = [row async for row in self.iter_ads(account_id, adset_ids, start_date, end_date)]
+        logger.info(f"Fetched {len(ads)} ads from Meta")
+        return ads
 
-    async def fetch_metrics(
+    async def iter_metrics(
         self,
         account_id: str,
         entity_type: str,
         entity_ids: list[str],
         start_date: date,
         end_date: date,
-    ) -> list[dict[str, Any]]:
-        """Fetch performance insights from Meta.
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream daily performance insights from Meta.
 
         Args:
             account_id: Meta ad account ID.
@@ -340,33 +878,14 @@ class MetaAdsConnector(BaseConnector):
             start_date: Start date.
             end_date: End date.
 
-        Returns:
-            List of daily metric dictionaries.
+        Yields:
+            Daily metric dictionaries.
         """
         if not self._api or not entity_ids:
-            return []
+            return
 
         try:
-            from facebook_business.adobjects.ad import Ad
-            from facebook_business.adobjects.adset import AdSet
-            from facebook_business.adobjects.campaign import Campaign
-            from facebook_business.adobjects.adsinsights import AdsInsights
-
-            # Map entity types to classes
-            class_map = {
-                "campaign": Campaign,
-                "adset": AdSet,
-                "ad": Ad,
-            }
-            entity_class = class_map.get(entity_type, Campaign)
-
-            fields = [
-                AdsInsights.Field.impressions,
-                AdsInsights.Field.clicks,
-                AdsInsights.Field.conversions,
-                AdsInsights.Field.spend,
-                AdsInsights.Field.purchase_roas,
-            ]
+            entity_class = _ENTITY_CLASSES.get(entity_type, _sdk.Campaign)
 
             params = {
                 "time_range": {
@@ -374,60 +893,32 @@ class MetaAdsConnector(BaseConnector):
                     "until": end_date.strftime("%Y-%m-%d"),
                 },
                 "time_increment": 1,  # Daily breakdown
+                "limit": _PAGE_SIZE,
             }
 
-            metrics = []
+            # Same request as an insights edge field expansion, so up to 50
+            # entities can share one ids= call
+            insights_expr = (
+                f"insights.time_range({_json_dumps(params['time_range'])})"
+                f".time_increment(1).limit({_PAGE_SIZE})"
+                f"{{{','.join(_INSIGHTS_FIELDS)}}}"
+            )
 
-            for entity_id in entity_ids:
+            def _fetch_one(entity_id: str) -> list[Any]:
                 entity = entity_class(entity_id)
-
-                try:
-                    insights = entity.get_insights(fields=fields, params=params)
-
-                    for insight in insights:
-                        spend = float(insight.get(AdsInsights.Field.spend, 0))
-
-                        # Get conversions count
-                        conversions = 0
-                        if insight.get(AdsInsights.Field.conversions):
-                            for conv in insight[AdsInsights.Field.conversions]:
-                                conversions += int(conv.get("value", 0))
-
-                        # Get revenue from ROAS
-                        revenue = None
-                        if insight.get(AdsInsights.Field.purchase_roas):
-                            roas_data = insight[AdsInsights.Field.purchase_roas]
-                            if roas_data and len(roas_data) > 0:
-                                roas = float(roas_data[0].get("value", 0))
-                                revenue = spend * roas
-
-                        metrics.append(
-                            {
-                                "entity_id": entity_id,
-                                "entity_type": entity_type,
-                                "date": insight.get("date_start"),
-                                "impressions": int(
-                                    insight.get(AdsInsights.Field.impressions, 0)
-                                ),
-                                "clicks": int(
-                                    insight.get(AdsInsights.Field.clicks, 0)
-                                ),
-                                "conversions": conversions,
-                                "spend": spend,
-                                "spend_currency": "USD",
-                                "revenue": revenue,
-                                "revenue_currency": "USD" if revenue else None,
-                            }
-                        )
-
-                except Exception as e:
-                    logger.warning(f"Failed to fetch insights for {entity_id}: {e}")
+                return list(entity.get_insights(fields=_INSIGHTS_FIELDS, params=params))
+
+            async for entity_id, rows in self._iter_edges(
+                partial(self._run_ids_query, "insights", insights_expr),
+                _fetch_one,
+                entity_ids,
+            ):
+                if isinstance(rows, Exception):
+                    logger.warning(f"Failed to fetch insights for {entity_id}: {rows}")
                     continue
 
-            logger.info(
-                f"Fetched {len(metrics)} metric records from Meta for {entity_type}"
-            )
-            return metrics
+                for insight in rows:
+                    yield _row_from_insight(insight, entity_id, entity_type)
 
         except Exception as e:
             error_str = str(e).lower()
@@ -435,29 +926,59 @@ class MetaAdsConnector(BaseConnector):
                 raise RateLimitError(f"Meta rate limit: {e}")
             raise TemporaryError(f"Meta error: {e}")
 
+    async def fetch_metrics(
+        self,
+        account_id: str,
+        entity_type: str,
+        entity_ids: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> list[dict[str, Any]]:
+        """Fetch performance insights from Meta.
+
+        Args:
+            account_id: Meta ad account ID.
+            entity_type: Type of entity (campaign/adset/ad).
+            entity_ids: Entity IDs to fetch metrics for.
+            start_date: Start date.
+            end_date: End date.
+
+        Returns:
+            List of daily metric dictionaries.
+        """
+        metrics = [
+            row
+            async for row in self.iter_metrics(
+                account_id, entity_type, entity_ids, start_date, end_date
+            )
+        ]
+        logger.info(f"Fetched {len(metrics)} metric records from Meta for {entity_type}")
+        return metrics
+
     def transform_to_graph_format(
         self,
         data: dict[str, Any],
         entity_type: str,
         client_id: str,
+        *,
+        copy: bool = False,
     ) -> dict[str, Any]:
         """Transform Meta data to graph schema format.
 
+        The row is updated in place, since rows from fetch_* are not shared.
+
         Args:
             data: Raw Meta data.
             entity_type: Type of entity.
             client_id: Client ID.
+            copy: Leave data untouched and transform a shallow copy.
 
         Returns:
             Transformed data.
         """
-        transformed = {
-            **data,
-            "client_id": client_id,
-            "channel": "meta",
-        }
-
-        if "external_id" not in transformed:
-            transformed["external_id"] = data.get("id")
+        transformed = data.copy() if copy else data
+        transformed["client_id"] = client_id
+        transformed["channel"] = "meta"
+        transformed.setdefault("external_id", transformed.get("id"))
 
         return transformed
@@ -1,9 +1,230 @@
 """Mock data generator for MVP testing."""
 
-import random
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import chain
 from typing import Any
-from uuid import uuid4
+
+import numpy as np
+
+# Valid UUID4 variant nibble (8, 9, a or b) for each random hex digit
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+class _RandomIdPool:
+    """Hands out random IDs carved from one os.urandom buffer.
+
+    Building a UUID object per ID costs a urandom call each; mock datasets
+    need hundreds, so one 4 KiB read is sliced instead.
+    """
+
+    _BUFFER_SIZE = 4096
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self._offset = 0
+
+    def reset(self) -> None:
+        """Discard buffered bytes so a forked child cannot repeat the parent's IDs."""
+        self._buffer = b""
+        self._offset = 0
+
+    def _take(self, size: int) -> bytes:
+        if self._offset + size > len(self._buffer):
+            self._buffer = os.urandom(self._BUFFER_SIZE)
+            self._offset = 0
+        chunk = self._buffer[self._offset : self._offset + size]
+        self._offset += size
+        return chunk
+
+    def uuid(self) -> str:
+        """Return a random UUID4 string."""
+        h = self._take(16).hex()
+        return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
+
+    def short_hex(self, num_bytes: int = 4) -> str:
+        """Return a random hex string of 2 * num_bytes characters."""
+        return self._take(num_bytes).hex()
+
+
+_ids = _RandomIdPool()
+os.register_at_fork(after_in_child=_ids.reset)
+
+
+@lru_cache(maxsize=8)
+def _date_table(days: int, today: date) -> tuple[tuple[str, ...], np.ndarray]:
+    """Build the date strings and weekdays for a metric history.
+
+    Args:
+        days: Number of days of data, ending the day before today.
+        today: Reference date.
+
+    Returns:
+        ISO date strings and a read-only array of their weekdays (Mon=0).
+    """
+    days_since_epoch = np.arange(days) + (np.datetime64(today, "D") - days)
+    dates = tuple(days_since_epoch.astype(str).tolist())
+    # 1970-01-01 was a Thursday (weekday 3)
+    weekdays = (days_since_epoch.astype(np.int64) + 3) % 7
+    weekdays.flags.writeable = False
+    return dates, weekdays
+
+
+# Display titles used in campaign names, keyed by channel
+_CHANNEL_TITLE = {"google_ads": "Google Ads", "meta": "Meta"}
+
+# Status options with cumulative weight cutoffs (the last option takes the rest)
+_CAMPAIGN_STATUSES = (("active", "paused", "completed"), np.array([0.6, 0.8]))
+_ADSET_STATUSES = (("active", "paused"), np.array([0.8]))
+_AD_STATUSES = (("active", "paused"), np.array([0.85]))
+
+
+def _weighted_draws(
+    rng: np.random.Generator,
+    weighted_options: tuple[tuple[str, ...], np.ndarray],
+    count: int,
+) -> list[str]:
+    """Draw weighted options in one batch.
+
+    Args:
+        rng: Random generator.
+        weighted_options: Options and their cumulative weight cutoffs.
+        count: Number of draws.
+
+    Returns:
+        Drawn options.
+    """
+    options, cutoffs = weighted_options
+    picks = np.searchsorted(cutoffs, rng.random(count), side="right")
+    return [options[i] for i in picks.tolist()]
+
+
+# Daily noise ranges for impressions, clicks, conversions, spend and revenue
+_NOISE_LOW = np.array([0.7, 0.8, 0.7, 0.9, 0.8])[:, np.newaxis]
+_NOISE_SPAN = np.array([0.6, 0.4, 0.6, 0.2, 0.4])[:, np.newaxis]
+
+
+def _compute_metrics(
+    base_impressions: int,
+    base_ctr: float,
+    base_cvr: float,
+    base_cpc: float,
+    base_aov: float | None,
+    trend_factor: float,
+    weekdays: np.ndarray,
+    rand_buf: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray | None]:
+    """Compute one entity's daily metric series.
+
+    Args:
+        base_impressions: Typical weekday impressions.
+        base_ctr: Click-through rate in percent.
+        base_cvr: Conversion rate in percent of clicks.
+        base_cpc: Cost per click.
+        base_aov: Average order value, or None to skip revenue.
+        trend_factor: Relative daily growth.
+        weekdays: Weekday of each day (Mon=0).
+        rand_buf: Uniform [0, 1) draws shaped (5, days), one row per metric;
+            (4, days) without revenue.
+
+    Returns:
+        Impressions, clicks, conversions, spend and revenue arrays; revenue
+        is None without a base order value.
+    """
+    metric_rows = len(rand_buf)
+    noise = rand_buf * _NOISE_SPAN[:metric_rows]
+    noise += _NOISE_LOW[:metric_rows]
+
+    # Weekly seasonality, daily variance and trend
+    volume = np.where(weekdays >= 5, 0.7, 1.0)
+    volume *= noise[0]
+    volume *= 1 + trend_factor * np.arange(len(weekdays))
+    volume *= base_impressions
+
+    impressions = np.maximum(volume, 0).astype(np.int64)
+    clicks = (impressions * (base_ctr / 100) * noise[1]).astype(np.int64)
+    conversions = (clicks * (base_cvr / 100) * noise[2]).astype(np.int64)
+    spend = np.round(clicks * base_cpc * noise[3], 2)
+    if base_aov is None:
+        return impressions, clicks, conversions, spend, None
+
+    revenue = np.round(conversions * base_aov * noise[4], 2)
+    return impressions, clicks, conversions, spend, revenue
+
+
+def _metric_rows(columns: dict[str, np.ndarray], currency: str) -> list[dict[str, Any]]:
+    """Materialize metric columns into row dictionaries.
+
+    Revenue is only attached to days with conversions.
+
+    Args:
+        columns: Metric columns as returned by generate_metrics_soa.
+        currency: Spend/revenue currency.
+
+    Returns:
+        List of metric dictionaries.
+    """
+    metrics = [
+        {
+            "id": metric_id,
+            "date": date,
+            "impressions": impressions,
+            "clicks": clicks,
+            "conversions": conversions,
+            "spend": spend,
+            "spend_currency": currency,
+        }
+        for metric_id, date, impressions, clicks, conversions, spend in zip(
+            columns["id"].tolist(),
+            columns["date"].tolist(),
+            columns["impressions"].tolist(),
+            columns["clicks"].tolist(),
+            columns["conversions"].tolist(),
+            columns["spend"].tolist(),
+        )
+    ]
+
+    if "revenue" in columns:
+        for metric, revenue in zip(metrics, columns["revenue"].tolist()):
+            if metric["conversions"] > 0:
+                metric["revenue"] = revenue
+                metric["revenue_currency"] = currency
+
+    return metrics
+
+
+def _metric_batch(
+    columns: dict[str, np.ndarray], currency: str, entity_type: str, entity_id: str, client_id: str
+) -> dict[str, Any]:
+    """Wrap one entity's metric columns for DataIngester.ingest_metric_columns.
+
+    Matches _metric_rows: revenue is only kept on days with conversions.
+
+    Args:
+        columns: Metric columns as returned by generate_metrics_soa.
+        currency: Spend/revenue currency.
+        entity_type: Type of entity (campaign/adset/ad).
+        entity_id: Entity UUID.
+        client_id: Client UUID.
+
+    Returns:
+        Entity keys with the columns, currency columns added, under "columns".
+    """
+    count = len(columns["id"])
+    columns = {**columns, "spend_currency": [currency] * count}
+    if "revenue" in columns:
+        has_revenue = columns["conversions"] > 0
+        columns["revenue"] = np.where(has_revenue, columns["revenue"], np.nan)
+        columns["revenue_currency"] = np.where(has_revenue, currency, None).tolist()
+
+    return {
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "client_id": client_id,
+        "columns": columns,
+    }
 
 
 class MockDataGenerator:
@@ -78,50 +299,60 @@ class MockDataGenerator:
         '{"age": "18-24", "interests": ["gaming", "entertainment"]}',
     ]
 
-    def __init__(self, seed: int | None = None):
+    def __init__(self, seed: int | np.random.BitGenerator | None = None):
         """Initialize the generator.
 
         Args:
-            seed: Random seed for reproducibility.
+            seed: Random seed for reproducibility, or a bit generator to draw from.
         """
-        if seed is not None:
-            random.seed(seed)
+        self._rng = np.random.default_rng(seed)
 
-    def generate_clients(self, count: int = 5) -> list[dict[str, Any]]:
+    def generate_clients(
+        self, count: int = 5, now: datetime | None = None
+    ) -> list[dict[str, Any]]:
         """Generate client data.
 
         Args:
             count: Number of clients to generate.
+            now: Reference time for contract dates. Defaults to the current time.
 
         Returns:
             List of client dictionaries.
         """
         clients = []
-        used_names = set()
-
-        for _ in range(count):
-            # Pick unique company
-            available = [c for c in self.COMPANY_NAMES if c[0] not in used_names]
-            if not available:
-                name = f"Client {uuid4().hex[:6]}"
-                industry = random.choice(self.INDUSTRIES)
-            else:
-                name, industry = random.choice(available)
-                used_names.add(name)
+        rng = self._rng
+        today = (now or datetime.now()).date()
+
+        # Shuffle the company pool once; generated names take over once it runs out
+        companies = [self.COMPANY_NAMES[j] for j in rng.permutation(len(self.COMPANY_NAMES))]
+        extra_industries = iter(
+            rng.choice(self.INDUSTRIES, size=max(0, count - len(companies))).tolist()
+        )
+        companies_left = iter(companies)
+        currencies = rng.choice(self.CURRENCIES, size=count).tolist()
+        contract_offsets = rng.integers(90, 366, size=count).tolist()
+        budgets = rng.integers(10000, 100001, size=count).tolist()
+        retention_days = rng.choice([180, 365, 730], size=count).tolist()
 
-            currency = random.choice(self.CURRENCIES)
-            contract_start = datetime.now() - timedelta(days=random.randint(90, 365))
+        for i in range(count):
+            try:
+                name, industry = next(companies_left)
+            except StopIteration:
+                name = f"Client {_ids.short_hex(3)}"
+                industry = next(extra_industries)
+
+            contract_start = today - timedelta(days=contract_offsets[i])
 
             clients.append(
                 {
-                    "id": str(uuid4()),
+                    "id": _ids.uuid(),
                     "name": name,
                     "industry": industry,
-                    "contract_start": contract_start.strftime("%Y-%m-%d"),
-                    "budget": random.randint(10000, 100000),
-                    "budget_currency": currency,
+                    "contract_start": contract_start.isoformat(),
+                    "budget": budgets[i],
+                    "budget_currency": currencies[i],
                     "status": "active",
-                    "data_retention_days": random.choice([180, 365, 730]),
+                    "data_retention_days": retention_days[i],
                 }
             )
 
@@ -132,6 +363,7 @@ class MockDataGenerator:
         client_id: str,
         count: int = 4,
         currency: str = "USD",
+        now: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """Generate campaign data for a client.
 
@@ -139,38 +371,43 @@ class MockDataGenerator:
             client_id: Parent client ID.
             count: Number of campaigns to generate.
             currency: Budget currency.
+            now: Reference time for flight dates. Defaults to the current time.
 
         Returns:
             List of campaign dictionaries.
         """
         campaigns = []
-        channels = ["google_ads", "meta"]
+        channels = list(_CHANNEL_TITLE)
+        rng = self._rng
+        today = (now or datetime.now()).date()
+
+        prefixes = rng.choice(self.CAMPAIGN_PREFIXES, size=count).tolist()
+        objectives = rng.choice(self.CAMPAIGN_OBJECTIVES, size=count).tolist()
+        start_offsets = rng.integers(30, 91, size=count).tolist()
+        durations = rng.integers(30, 91, size=count).tolist()
+        statuses = _weighted_draws(rng, _CAMPAIGN_STATUSES, count)
+        budgets = rng.integers(1000, 20001, size=count).tolist()
 
         for i in range(count):
-            prefix = random.choice(self.CAMPAIGN_PREFIXES)
-            objective = random.choice(self.CAMPAIGN_OBJECTIVES)
             channel = channels[i % len(channels)]
-            start_date = datetime.now() - timedelta(days=random.randint(30, 90))
-            end_date = start_date + timedelta(days=random.randint(30, 90))
-            status = random.choices(
-                ["active", "paused", "completed"],
-                weights=[0.6, 0.2, 0.2],
-            )[0]
-
-            if end_date < datetime.now():
+            start_date = today - timedelta(days=start_offsets[i])
+            end_date = start_date + timedelta(days=durations[i])
+            status = statuses[i]
+
+            if end_date < today:
                 status = "completed"
 
-            budget = random.randint(1000, 20000)
+            budget = budgets[i]
 
             campaigns.append(
                 {
-                    "id": str(uuid4()),
+                    "id": _ids.uuid(),
                     "client_id": client_id,
-                    "external_id": f"{channel}_{uuid4().hex[:8]}",
-                    "name": f"{prefix} - {channel.replace('_', ' ').title()}",
-                    "objective": objective,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
+                    "external_id": f"{channel}_{_ids.short_hex()}",
+                    "name": f"{prefixes[i]} - {_CHANNEL_TITLE[channel]}",
+                    "objective": objectives[i],
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat(),
                     "budget": budget,
                     "budget_currency": currency,
                     "daily_budget": budget / 30,
@@ -201,24 +438,26 @@ class MockDataGenerator:
         """
         adsets = []
         audiences = ["Broad", "Interest-Based", "Lookalike", "Retargeting", "Custom"]
+        rng = self._rng
+
+        budgets = rng.integers(200, 2001, size=count).tolist()
+        targeting = rng.choice(self.TARGETING_OPTIONS, size=count).tolist()
+        statuses = _weighted_draws(rng, _ADSET_STATUSES, count)
 
         for i in range(count):
             audience = audiences[i % len(audiences)]
-            budget = random.randint(200, 2000)
 
             adsets.append(
                 {
-                    "id": str(uuid4()),
+                    "id": _ids.uuid(),
                     "client_id": client_id,
                     "campaign_id": campaign_id,
-                    "external_id": f"adset_{uuid4().hex[:8]}",
+                    "external_id": f"adset_{_ids.short_hex()}",
                     "name": f"{audience} Audience",
-                    "targeting": random.choice(self.TARGETING_OPTIONS),
-                    "budget": budget,
+                    "targeting": targeting[i],
+                    "budget": budgets[i],
                     "budget_currency": currency,
-                    "status": random.choices(
-                        ["active", "paused"], weights=[0.8, 0.2]
-                    )[0],
+                    "status": statuses[i],
                 }
             )
 
@@ -242,28 +481,92 @@ class MockDataGenerator:
         """
         ads = []
         creative_types = ["image", "video", "carousel"]
+        rng = self._rng
+
+        headlines = rng.choice(self.AD_HEADLINES, size=count).tolist()
+        descriptions = rng.choice(self.AD_DESCRIPTIONS, size=count).tolist()
+        statuses = _weighted_draws(rng, _AD_STATUSES, count)
 
         for i in range(count):
             creative_type = creative_types[i % len(creative_types)]
 
             ads.append(
                 {
-                    "id": str(uuid4()),
+                    "id": _ids.uuid(),
                     "client_id": client_id,
                     "adset_id": adset_id,
-                    "external_id": f"ad_{uuid4().hex[:8]}",
+                    "external_id": f"ad_{_ids.short_hex()}",
                     "name": f"Ad Variant {chr(65 + i)}",
-                    "headline": random.choice(self.AD_HEADLINES),
-                    "description": random.choice(self.AD_DESCRIPTIONS),
+                    "headline": headlines[i],
+                    "description": descriptions[i],
                     "creative_type": creative_type,
-                    "status": random.choices(
-                        ["active", "paused"], weights=[0.85, 0.15]
-                    )[0],
+                    "status": statuses[i],
                 }
             )
 
         return ads
 
+    def generate_metrics_soa(
+        self,
+        entity_id: str,
+        days: int = 90,
+        include_revenue: bool = True,
+        date_table: tuple[tuple[str, ...], np.ndarray] | None = None,
+        now: datetime | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Generate daily metrics for an entity as parallel column arrays.
+
+        Args:
+            entity_id: Entity UUID.
+            days: Number of days of data.
+            include_revenue: Whether to include a revenue column.
+            date_table: Precomputed dates and weekdays for the period, shared
+                across entities. Built from ``now`` when omitted.
+            now: Reference time; the history ends the day before. Defaults to
+                the current time.
+
+        Returns:
+            Mapping of column name to a length-``days`` array: id, date,
+            impressions, clicks, conversions, spend and, when requested,
+            revenue.
+        """
+        rng = self._rng
+        base_impressions = int(rng.integers(1000, 10001))
+        base_ctr = rng.uniform(0.5, 3.0)  # 0.5% to 3%
+        base_cvr = rng.uniform(1.0, 10.0)  # 1% to 10% of clicks
+        base_cpc = rng.uniform(0.5, 5.0)  # $0.50 to $5.00
+        # Average order value; revenue-free series skip it and its noise row
+        base_aov = rng.uniform(50, 200) if include_revenue else None
+
+        # Add some variance and trend
+        trend_factor = rng.uniform(-0.002, 0.005)  # Daily trend
+
+        dates, weekdays = date_table or _date_table(days, (now or datetime.now()).date())
+        impressions, clicks, conversions, spend, revenue = _compute_metrics(
+            base_impressions,
+            base_ctr,
+            base_cvr,
+            base_cpc,
+            base_aov,
+            trend_factor,
+            weekdays,
+            rng.random((len(_NOISE_LOW) if include_revenue else len(_NOISE_LOW) - 1, days)),
+        )
+
+        date_column = np.asarray(dates)
+        columns = {
+            "id": np.char.add(f"{entity_id}_", date_column),
+            "date": date_column,
+            "impressions": impressions,
+            "clicks": clicks,
+            "conversions": conversions,
+            "spend": spend,
+        }
+        if revenue is not None:
+            columns["revenue"] = revenue
+
+        return columns
+
     def generate_metrics(
         self,
         entity_id: str,
@@ -272,6 +575,8 @@ class MockDataGenerator:
         days: int = 90,
         currency: str = "USD",
         include_revenue: bool = True,
+        date_table: tuple[tuple[str, ...], np.ndarray] | None = None,
+        now: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """Generate daily metrics for an entity.
 
@@ -282,58 +587,18 @@ class MockDataGenerator:
             days: Number of days of data.
             currency: Spend/revenue currency.
             include_revenue: Whether to include revenue data.
+            date_table: Precomputed dates and weekdays for the period, shared
+                across entities. Built from ``now`` when omitted.
+            now: Reference time; the history ends the day before. Defaults to
+                the current time.
 
         Returns:
             List of metric dictionaries.
         """
-        metrics = []
-        base_impressions = random.randint(1000, 10000)
-        base_ctr = random.uniform(0.5, 3.0)  # 0.5% to 3%
-        base_cvr = random.uniform(1.0, 10.0)  # 1% to 10% of clicks
-        base_cpc = random.uniform(0.5, 5.0)  # $0.50 to $5.00
-        base_aov = random.uniform(50, 200)  # Average order value
-
-        # Add some variance and trend
-        trend_factor = random.uniform(-0.002, 0.005)  # Daily trend
-
-        for day in range(days):
-            date = (datetime.now() - timedelta(days=days - day)).strftime("%Y-%m-%d")
-
-            # Add daily and weekly seasonality
-            day_of_week = (datetime.now() - timedelta(days=days - day)).weekday()
-            weekend_factor = 0.7 if day_of_week >= 5 else 1.0
-            daily_variance = random.uniform(0.7, 1.3)
-
-            # Calculate metrics with trend
-            trend_multiplier = 1 + (trend_factor * day)
-
-            impressions = int(
-                base_impressions * weekend_factor * daily_variance * trend_multiplier
-            )
-            clicks = int(impressions * (base_ctr / 100) * random.uniform(0.8, 1.2))
-            conversions = int(clicks * (base_cvr / 100) * random.uniform(0.7, 1.3))
-            spend = round(clicks * base_cpc * random.uniform(0.9, 1.1), 2)
-
-            metric = {
-                "id": f"{entity_id}_{date}",
-                "date": date,
-                "impressions": max(0, impressions),
-                "clicks": max(0, clicks),
-                "conversions": max(0, conversions),
-                "spend": max(0, spend),
-                "spend_currency": currency,
-            }
-
-            if include_revenue and conversions > 0:
-                revenue = round(
-                    conversions * base_aov * random.uniform(0.8, 1.2), 2
-                )
-                metric["revenue"] = revenue
-                metric["revenue_currency"] = currency
-
-            metrics.append(metric)
-
-        return metrics
+        columns = self.generate_metrics_soa(
+            entity_id, days, include_revenue, date_table=date_table, now=now
+        )
+        return _metric_rows(columns, currency)
 
     def generate_full_dataset(
         self,
@@ -342,80 +607,143 @@ class MockDataGenerator:
         adsets_per_campaign: int = 3,
         ads_per_adset: int = 5,
         metric_days: int = 90,
+        workers: int | None = None,
+        metric_columns: bool = False,
     ) -> dict[str, Any]:
         """Generate a complete dataset for testing.
 
+        Each client draws from its own child generator spawned from this one,
+        so the dataset is the same for a given seed whether or not it is
+        generated in parallel.
+
         Args:
             num_clients: Number of clients.
             campaigns_per_client: Campaigns per client.
             adsets_per_campaign: Ad sets per campaign.
             ads_per_adset: Ads per ad set.
             metric_days: Days of metric history.
+            workers: Generate clients in this many processes. Runs in-process
+                when None or 1.
+            metric_columns: Keep each entity's metrics as one batch of
+                columns, with entity_type, entity_id and client_id, instead of
+                a dictionary per day. Pass a batch's "columns" straight to
+                DataIngester.ingest_metric_columns.
 
         Returns:
             Dictionary with all generated data.
         """
+        # One clock read for the whole dataset; every entity covers the same period
+        now = datetime.now()
+
+        clients = self.generate_clients(num_clients, now=now)
+        client_rngs = self._rng.bit_generator.spawn(len(clients))
+        generate_client = partial(
+            _generate_client_data,
+            campaigns_per_client=campaigns_per_client,
+            adsets_per_campaign=adsets_per_campaign,
+            ads_per_adset=ads_per_adset,
+            metric_days=metric_days,
+            now=now,
+            metric_columns=metric_columns,
+        )
+
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(generate_client, client_rngs, clients))
+        else:
+            parts = list(map(generate_client, client_rngs, clients))
+
+        data = {"clients": clients}
+        for key in ("campaigns", "adsets", "ads", "metrics"):
+            data[key] = list(chain.from_iterable(part[key] for part in parts))
+
+        return data
+
+    def _generate_client_entities(
+        self,
+        client: dict[str, Any],
+        campaigns_per_client: int,
+        adsets_per_campaign: int,
+        ads_per_adset: int,
+        metric_days: int,
+        now: datetime,
+        metric_columns: bool = False,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Generate one client's campaigns, ad sets, ads and metrics.
+
+        Args:
+            client: Client dictionary.
+            campaigns_per_client: Campaigns per client.
+            adsets_per_campaign: Ad sets per campaign.
+            ads_per_adset: Ads per ad set.
+            metric_days: Days of metric history.
+            now: Reference time shared by the whole dataset.
+            metric_columns: Keep metrics as one column batch per entity.
+
+        Returns:
+            Dictionary of entity lists keyed like generate_full_dataset.
+        """
         data = {
-            "clients": [],
             "campaigns": [],
             "adsets": [],
             "ads": [],
             "metrics": [],
         }
 
-        clients = self.generate_clients(num_clients)
-        data["clients"] = clients
+        client_id = client["id"]
+        currency = client["budget_currency"]
+        date_table = _date_table(metric_days, now.date())
+
+        def add_metrics(columns: dict[str, np.ndarray], entity_type: str, entity_id: str):
+            if metric_columns:
+                data["metrics"].append(
+                    _metric_batch(columns, currency, entity_type, entity_id, client_id)
+                )
+            else:
+                data["metrics"].extend(_metric_rows(columns, currency))
+
+        campaigns = self.generate_campaigns(
+            client_id, campaigns_per_client, currency, now=now
+        )
+        data["campaigns"].extend(campaigns)
+
+        for campaign in campaigns:
+            campaign_id = campaign["id"]
 
-        for client in clients:
-            client_id = client["id"]
-            currency = client["budget_currency"]
+            # Generate campaign-level metrics
+            campaign_metrics = self.generate_metrics_soa(
+                campaign_id,
+                metric_days,
+                include_revenue=campaign["objective"] in ["conversions", "sales"],
+                date_table=date_table,
+            )
+            add_metrics(campaign_metrics, "campaign", campaign_id)
 
-            campaigns = self.generate_campaigns(
-                client_id, campaigns_per_client, currency
+            adsets = self.generate_adsets(
+                campaign_id, client_id, adsets_per_campaign, currency
             )
-            data["campaigns"].extend(campaigns)
+            data["adsets"].extend(adsets)
 
-            for campaign in campaigns:
-                campaign_id = campaign["id"]
+            for adset in adsets:
+                adset_id = adset["id"]
 
-                # Generate campaign-level metrics
-                campaign_metrics = self.generate_metrics(
-                    campaign_id,
-                    "campaign",
-                    client_id,
+                # Generate adset-level metrics (subset of campaign)
+                adset_metrics = self.generate_metrics_soa(
+                    adset_id,
                     metric_days,
-                    currency,
-                    include_revenue=campaign["objective"] in ["conversions", "sales"],
+                    include_revenue=False,
+                    date_table=date_table,
                 )
-                data["metrics"].extend(campaign_metrics)
-
-                adsets = self.generate_adsets(
-                    campaign_id, client_id, adsets_per_campaign, currency
+                # Scale down adset metrics
+                for column in ("impressions", "clicks", "conversions"):
+                    adset_metrics[column] //= adsets_per_campaign
+                adset_metrics["spend"] = np.round(
+                    adset_metrics["spend"] / adsets_per_campaign, 2
                 )
-                data["adsets"].extend(adsets)
-
-                for adset in adsets:
-                    adset_id = adset["id"]
-
-                    # Generate adset-level metrics (subset of campaign)
-                    adset_metrics = self.generate_metrics(
-                        adset_id,
-                        "adset",
-                        client_id,
-                        metric_days,
-                        currency,
-                        include_revenue=False,
-                    )
-                    # Scale down adset metrics
-                    for m in adset_metrics:
-                        m["impressions"] = int(m["impressions"] / adsets_per_campaign)
-                        m["clicks"] = int(m["clicks"] / adsets_per_campaign)
-                        m["conversions"] = int(m["conversions"] / adsets_per_campaign)
-                        m["spend"] = round(m["spend"] / adsets_per_campaign, 2)
-                    data["metrics"].extend(adset_metrics)
-
-                    ads = self.generate_ads(adset_id, client_id, ads_per_adset)
-                    data["ads"].extend(ads)
+                add_metrics(adset_metrics, "adset", adset_id)
+
+                ads = self.generate_ads(adset_id, client_id, ads_per_adset)
+                data["ads"].extend(ads)
 
         return data
 
@@ -436,7 +764,7 @@ class MockDataGenerator:
         # Admin user with access to all clients
         users.append(
             {
-                "id": str(uuid4()),
+                "id": _ids.uuid(),
                 "email": "admin@agency.com",
                 "hashed_password": hashed_password,
                 "name": "Admin User",
@@ -449,7 +777,7 @@ class MockDataGenerator:
         for i, client in enumerate(clients):
             users.append(
                 {
-                    "id": str(uuid4()),
+                    "id": _ids.uuid(),
                     "email": f"manager{i + 1}@agency.com",
                     "hashed_password": hashed_password,
                     "name": f"Account Manager {i + 1}",
@@ -461,7 +789,7 @@ class MockDataGenerator:
         # Analyst with access to first 3 clients
         users.append(
             {
-                "id": str(uuid4()),
+                "id": _ids.uuid(),
                 "email": "analyst@agency.com",
                 "hashed_password": hashed_password,
                 "name": "Data Analyst",
@@ -473,7 +801,7 @@ class MockDataGenerator:
         # Executive with read-only access to all
         users.append(
             {
-                "id": str(uuid4()),
+                "id": _ids.uuid(),
                 "email": "executive@agency.com",
                 "hashed_password": hashed_password,
                 "name": "Executive User",
@@ -483,3 +811,21 @@ class MockDataGenerator:
         )
 
         return users
+
+
+def _generate_client_data(
+    bit_generator: np.random.BitGenerator, client: dict[str, Any], **options: Any
+) -> dict[str, list[dict[str, Any]]]:
+    """Generate one client's data from its own bit generator.
+
+    Module-level so a process pool can pickle it.
+
+    Args:
+        bit_generator: Child bit generator for this client.
+        client: Client dictionary.
+        **options: Sizes and reference time for MockDataGenerator._generate_client_entities.
+
+    Returns:
+        Dictionary of entity lists keyed like generate_full_dataset.
+    """
+    return MockDataGenerator(bit_generator)._generate_client_entities(client, **options)
@@ -1,6 +1,6 @@
 """Neo4j graph database components."""
 
-from .client import Neo4jClient
+from .client import AsyncNeo4jClient, BulkSession, Neo4jClient
 from .schema import GraphSchema
 
-__all__ = ["Neo4jClient", "GraphSchema"]
+__all__ = ["AsyncNeo4jClient", "BulkSession", "Neo4jClient", "GraphSchema"]
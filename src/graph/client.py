@@ -1,18 +1,198 @@
 """Neo4j client wrapper with connection management and schema initialization."""
 
+import asyncio
 import logging
 from contextlib import contextmanager
-from typing import Any, Generator
-
-from neo4j import GraphDatabase, Session
+from functools import cached_property
+from typing import Any, Generator, Iterable, Iterator
+
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    GraphDatabase,
+    Query,
+    RoutingControl,
+    Session,
+)
 from neo4j.exceptions import ServiceUnavailable
 
 from config.settings import Settings, get_settings
 
-from .schema import GraphSchema
+from .schema import CHANNEL_DISPLAY_NAMES, GraphSchema, NodeLabel
 
 logger = logging.getLogger(__name__)
 
+_WRITE_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+)
+
+# Labels whose nodes carry the owning client's id, swept leaf-first on deletion
+_CLIENT_OWNED_LABELS = (
+    NodeLabel.METRIC,
+    NodeLabel.METRIC_WEEKLY,
+    NodeLabel.AD,
+    NodeLabel.AD_SET,
+    NodeLabel.CAMPAIGN,
+    NodeLabel.AUDIT_LOG,
+)
+
+# Client deletion sweeps, one per owned label, then the client itself; the
+# label names are resolved once here rather than on every deletion
+_CLIENT_DELETE_QUERIES = tuple(
+    f"""
+    MATCH (n:{label.value} {{client_id: $client_id}})
+    CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF 5000 ROWS
+    """
+    for label in _CLIENT_OWNED_LABELS
+) + ("MATCH (c:Client {id: $client_id}) DETACH DELETE c",)
+
+# Client data queries; independent of each other, so they can run concurrently
+_CLIENT_QUERY = """
+MATCH (c:Client {id: $client_id})
+RETURN c
+"""
+
+_CAMPAIGNS_QUERY = """
+MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)
+RETURN camp
+ORDER BY camp.start_date DESC
+"""
+
+_ADSETS_QUERY = """
+MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)-[:CONTAINS]->(adset:AdSet)
+RETURN adset, camp.id AS campaign_id
+"""
+
+_ADS_QUERY = """
+MATCH (a:Ad {client_id: $client_id})
+RETURN a
+"""
+
+_METRICS_QUERY = """
+MATCH (m:Metric {client_id: $client_id})
+RETURN m
+ORDER BY m.date DESC
+LIMIT 1000
+"""
+
+# Sums daily metrics per entity and week for weeks without a rollup and
+# writes the rollups in server-side batches
+_BUILD_WEEKLY_ROLLUPS_QUERY = """
+MATCH (d:Metric {client_id: $client_id})
+WITH d.entity_type AS entity_type,
+    d.entity_id AS entity_id,
+    date.truncate('week', d.date) AS week,
+    sum(d.impressions) AS impressions,
+    sum(d.clicks) AS clicks,
+    sum(d.conversions) AS conversions,
+    sum(d.spend) AS spend,
+    sum(d.revenue) AS revenue
+WHERE NOT EXISTS {
+    MATCH (:MetricWeekly {entity_type: entity_type, entity_id: entity_id, week: week})
+}
+CALL {
+    WITH entity_type, entity_id, week, impressions, clicks, conversions, spend, revenue
+    MERGE (w:MetricWeekly {entity_type: entity_type, entity_id: entity_id, week: week})
+    SET w.client_id = $client_id,
+        w.impressions = impressions,
+        w.clicks = clicks,
+        w.conversions = conversions,
+        w.spend = spend,
+        w.revenue = revenue
+} IN TRANSACTIONS OF 1000 ROWS
+RETURN count(*) AS built
+"""
+
+
+def _client_data_result(
+    client: Iterable[dict[str, Any]],
+    campaigns: Iterable[dict[str, Any]],
+    adsets: Iterable[dict[str, Any]],
+    ads: Iterable[dict[str, Any]],
+    metrics: Iterable[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    """Shape client data query records into the get_client_data result."""
+    clients = [r["c"] for r in client]
+    result = {
+        "client": clients[0] if clients else None,
+        "campaigns": [r["camp"] for r in campaigns],
+        "ad_sets": list(adsets),
+        "ads": [r["a"] for r in ads],
+    }
+    if metrics is not None:
+        result["metrics"] = [r["m"] for r in metrics]
+    return result
+
+
+class BulkSession:
+    """Runs queries and writes over one long-lived Neo4j session."""
+
+    def __init__(self, session: Session):
+        """Initialize bulk session.
+
+        Args:
+            session: Open Neo4j session to run statements on.
+        """
+        self._session = session
+
+    def query(self, query: str, parameters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """Execute a Cypher query and return results.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+
+        Returns:
+            List of result records as dictionaries.
+        """
+        result = self._session.run(query, parameters or {})
+        return [record.data() for record in result]
+
+    def write(self, query: str, parameters: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute a write query and return summary.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+
+        Returns:
+            Query summary with counters.
+        """
+        summary = self._session.run(query, parameters or {}).consume()
+        return {name: getattr(summary.counters, name) for name in _WRITE_COUNTERS}
+
+    def write_many(
+        self,
+        query_template: str,
+        rows: list[dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> dict[str, Any]:
+        """Execute a write query over many rows in batched transactions.
+
+        Args:
+            query_template: Cypher query string consuming ``$rows``.
+            rows: Parameter maps, one per row.
+            batch_size: Rows per transaction.
+
+        Returns:
+            Query summary with counters summed across batches.
+        """
+        totals = dict.fromkeys(_WRITE_COUNTERS, 0)
+
+        def write_batch(tx, batch):
+            return tx.run(query_template, rows=batch).consume()
+
+        for start in range(0, len(rows), batch_size):
+            summary = self._session.execute_write(write_batch, rows[start : start + batch_size])
+            for name in _WRITE_COUNTERS:
+                totals[name] += getattr(summary.counters, name)
+
+        return totals
+
 
 class Neo4jClient:
     """Neo4j database client with connection pooling and schema management."""
@@ -24,27 +204,25 @@ class Neo4jClient:
             settings: Application settings. Uses default if not provided.
         """
         self._settings = settings or get_settings()
-        self._driver = None
         self._schema = GraphSchema()
 
-    @property
+    @cached_property
     def driver(self):
-        """Get or create the Neo4j driver."""
-        if self._driver is None:
-            self._driver = GraphDatabase.driver(
-                self._settings.NEO4J_URI,
-                auth=(self._settings.NEO4J_USER, self._settings.NEO4J_PASSWORD),
-                max_connection_lifetime=3600,
-                max_connection_pool_size=50,
-                connection_acquisition_timeout=60,
-            )
-        return self._driver
+        """Get the Neo4j driver, created on first access."""
+        return GraphDatabase.driver(
+            self._settings.NEO4J_URI,
+            auth=(self._settings.NEO4J_USER, self._settings.NEO4J_PASSWORD),
+            max_connection_lifetime=3600,
+            max_connection_pool_size=50,
+            connection_acquisition_timeout=60,
+        )
 
     def close(self):
         """Close the driver connection."""
-        if self._driver is not None:
-            self._driver.close()
-            self._driver = None
+        # Dropping the cached driver lets the next access reconnect
+        driver = self.__dict__.pop("driver", None)
+        if driver is not None:
+            driver.close()
 
     def verify_connectivity(self) -> bool:
         """Verify database connectivity."""
@@ -73,38 +251,43 @@ class Neo4jClient:
             session.close()
 
     def initialize_schema(self) -> None:
-        """Initialize database schema with constraints and indexes."""
-        logger.info("Initializing Neo4j schema...")
-        statements = self._schema.get_all_statements()
+        """Initialize database schema with constraints and indexes.
 
-        with self.session() as session:
-            for statement in statements:
-                try:
-                    session.run(statement)
-                    logger.debug(f"Executed: {statement}")
-                except Exception as e:
-                    logger.warning(f"Schema statement failed (may already exist): {e}")
+        Existing schema objects are listed with SHOW INDEXES and SHOW
+        CONSTRAINTS and only the missing ones are created, together in a
+        single write transaction. Once verified, later calls in the same
+        process skip the schema queries entirely.
+        """
+        logger.info("Initializing Neo4j schema...")
+        if self._schema.is_verified:
+            logger.debug("Schema already verified, skipping schema queries")
+        else:
+            with self.session() as session:
+                self._schema.apply(session)
 
         # Create channel nodes
         self._create_channels()
         logger.info("Schema initialization complete")
 
     def _create_channels(self) -> None:
-        """Create default channel nodes."""
+        """Create default channel nodes.
+
+        Display names are always set, correcting any channel that campaign
+        ingestion created first.
+        """
         channels = [
-            {"name": "google_ads", "display_name": "Google Ads"},
-            {"name": "meta", "display_name": "Meta (Facebook/Instagram)"},
+            {"name": name, "display_name": display_name}
+            for name, display_name in CHANNEL_DISPLAY_NAMES.items()
         ]
 
-        with self.session() as session:
-            for channel in channels:
-                session.run(
-                    """
-                    MERGE (c:Channel {name: $name})
-                    ON CREATE SET c.display_name = $display_name
-                    """,
-                    **channel,
-                )
+        self.execute_write_many(
+            """
+            UNWIND $rows AS row
+            MERGE (c:Channel {name: row.name})
+            SET c.display_name = row.display_name
+            """,
+            channels,
+        )
         logger.info("Channel nodes created/verified")
 
     def execute_query(
@@ -123,9 +306,81 @@ class Neo4jClient:
         Returns:
             List of result records as dictionaries.
         """
+        return list(self.iter_query(query, parameters, database))
+
+    def execute_scalar(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        key: str | int = 0,
+        database: str = "neo4j",
+    ) -> Any:
+        """Execute a Cypher query and return one value from its first record.
+
+        Only that value is decoded; no record dicts or result list are built.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            key: Name or index of the value to return.
+            database: Database name.
+
+        Returns:
+            The value, or None when the query returns no records.
+        """
+        with self.session(database=database) as session:
+            record = session.run(query, parameters or {}).single(strict=False)
+            return None if record is None else record.value(key)
+
+    def execute_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> list[dict[str, Any]]:
+        """Execute a read-only query and return results.
+
+        The query is routed to a reader, so in a cluster it runs on a
+        follower rather than the leader, and it is cancelled by the server
+        once it exceeds QUERY_TIMEOUT_SECONDS.
+
+        Args:
+            query: Read-only Cypher query string.
+            parameters: Query parameters.
+            database: Database name.
+
+        Returns:
+            List of result records as dictionaries.
+        """
+        records, _, _ = self.driver.execute_query(
+            Query(query, timeout=self._settings.QUERY_TIMEOUT_SECONDS),
+            parameters or {},
+            routing_=RoutingControl.READ,
+            database_=database,
+        )
+        return [record.data() for record in records]
+
+    def iter_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> Iterator[dict[str, Any]]:
+        """Execute a Cypher query and yield result records as they stream in.
+
+        The session stays open until the iterator is exhausted or closed.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            database: Database name.
+
+        Yields:
+            Result records as dictionaries.
+        """
         with self.session(database=database) as session:
             result = session.run(query, parameters or {})
-            return [record.data() for record in result]
+            yield from (record.data() for record in result)
 
     def execute_write(
         self,
@@ -143,16 +398,50 @@ class Neo4jClient:
         Returns:
             Query summary with counters.
         """
+        with self.bulk_session(database=database) as bulk:
+            return bulk.write(query, parameters)
+
+    def execute_write_many(
+        self,
+        query_template: str,
+        rows: list[dict[str, Any]],
+        batch_size: int = 1000,
+        database: str = "neo4j",
+    ) -> dict[str, Any]:
+        """Execute a write query over many rows in batched transactions.
+
+        The query receives each batch as ``$rows`` and should ``UNWIND`` it,
+        e.g. ``UNWIND $rows AS r MERGE (m:Metric {id: r.id}) SET m += r``.
+
+        Args:
+            query_template: Cypher query string consuming ``$rows``.
+            rows: Parameter maps, one per row.
+            batch_size: Rows per transaction.
+            database: Database name.
+
+        Returns:
+            Query summary with counters summed across batches.
+        """
+        with self.bulk_session(database=database) as bulk:
+            return bulk.write_many(query_template, rows, batch_size)
+
+    @contextmanager
+    def bulk_session(self, database: str = "neo4j") -> Generator["BulkSession", None, None]:
+        """Hold one session open for a run of queries and writes.
+
+        Use for bulk loads so every statement reuses the same session::
+
+            with client.bulk_session() as bulk:
+                bulk.write_many(metric_query, metrics, batch_size=1000)
+
+        Args:
+            database: Database name to connect to.
+
+        Yields:
+            Bulk session bound to the open session.
+        """
         with self.session(database=database) as session:
-            result = session.run(query, parameters or {})
-            summary = result.consume()
-            return {
-                "nodes_created": summary.counters.nodes_created,
-                "nodes_deleted": summary.counters.nodes_deleted,
-                "relationships_created": summary.counters.relationships_created,
-                "relationships_deleted": summary.counters.relationships_deleted,
-                "properties_set": summary.counters.properties_set,
-            }
+            yield BulkSession(session)
 
     def get_client_data(
         self,
@@ -168,80 +457,46 @@ class Neo4jClient:
         Returns:
             Dictionary with client, campaigns, ad sets, ads, and optionally metrics.
         """
-        # Get client
-        client_query = """
-        MATCH (c:Client {id: $client_id})
-        RETURN c
-        """
-
-        # Get campaigns
-        campaigns_query = """
-        MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)
-        RETURN camp
-        ORDER BY camp.start_date DESC
-        """
-
-        # Get ad sets
-        adsets_query = """
-        MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)-[:CONTAINS]->(adset:AdSet)
-        RETURN adset, camp.id AS campaign_id
-        """
-
-        # Get ads
-        ads_query = """
-        MATCH (a:Ad {client_id: $client_id})
-        RETURN a
-        """
-
         params = {"client_id": client_id}
 
-        client = self.execute_query(client_query, params)
-        campaigns = self.execute_query(campaigns_query, params)
-        adsets = self.execute_query(adsets_query, params)
-        ads = self.execute_query(ads_query, params)
+        # Lazy record streams; each query runs as the result consumes it
+        client = self.iter_query(_CLIENT_QUERY, params)
+        campaigns = self.iter_query(_CAMPAIGNS_QUERY, params)
+        adsets = self.iter_query(_ADSETS_QUERY, params)
+        ads = self.iter_query(_ADS_QUERY, params)
+        metrics = self.iter_query(_METRICS_QUERY, params) if include_metrics else None
 
-        result = {
-            "client": client[0]["c"] if client else None,
-            "campaigns": [r["camp"] for r in campaigns],
-            "ad_sets": adsets,
-            "ads": [r["a"] for r in ads],
-        }
-
-        if include_metrics:
-            metrics_query = """
-            MATCH (m:Metric {client_id: $client_id})
-            RETURN m
-            ORDER BY m.date DESC
-            LIMIT 1000
-            """
-            metrics = self.execute_query(metrics_query, params)
-            result["metrics"] = [r["m"] for r in metrics]
-
-        return result
+        return _client_data_result(client, campaigns, adsets, ads, metrics)
 
     def delete_client_data(self, client_id: str) -> dict[str, Any]:
         """Delete all data for a client (GDPR compliance).
 
+        Each owned label is swept through its client_id index in batched
+        server-side transactions, so work grows with the number of nodes
+        rather than with the product of the hierarchy's levels.
+
         Args:
             client_id: Client UUID.
 
         Returns:
             Deletion summary.
         """
-        query = """
-        MATCH (c:Client {id: $client_id})
-        OPTIONAL MATCH (c)-[r1]->(camp:Campaign)
-        OPTIONAL MATCH (camp)-[r2]->(adset:AdSet)
-        OPTIONAL MATCH (adset)-[r3]->(ad:Ad)
-        OPTIONAL MATCH (m:Metric {client_id: $client_id})
-        OPTIONAL MATCH (a:AuditLog {client_id: $client_id})
-        DETACH DELETE c, camp, adset, ad, m, a
-        """
-        return self.execute_write(query, {"client_id": client_id})
+        params = {"client_id": client_id}
+        totals = dict.fromkeys(_WRITE_COUNTERS, 0)
+        for query in _CLIENT_DELETE_QUERIES:
+            summary = self.execute_write(query, params)
+            for name in _WRITE_COUNTERS:
+                totals[name] += summary[name]
+
+        return totals
 
     def cleanup_old_metrics(self, client_id: str, retention_days: int) -> int:
         """Delete metrics older than retention period.
 
+        The server deletes in batches of 10,000 rows, each committed in its
+        own transaction, so one call clears the whole backlog. Weekly
+        rollups are dropped once their whole week is past retention.
+
         Args:
             client_id: Client UUID.
             retention_days: Number of days to retain.
@@ -249,21 +504,128 @@ class Neo4jClient:
         Returns:
             Number of deleted metrics.
         """
+        params = {"client_id": client_id, "retention_days": retention_days}
+
+        # CALL ... IN TRANSACTIONS needs an auto-commit transaction (session.run)
         query = """
         MATCH (m:Metric {client_id: $client_id})
         WHERE m.date < date() - duration({days: $retention_days})
-        WITH m LIMIT 10000
-        DETACH DELETE m
+        CALL { WITH m DETACH DELETE m } IN TRANSACTIONS OF 10000 ROWS
         RETURN count(*) AS deleted
         """
-        result = self.execute_query(
-            query, {"client_id": client_id, "retention_days": retention_days}
+        deleted = self.execute_scalar(query, params, "deleted")
+
+        self.execute_write(
+            """
+            MATCH (w:MetricWeekly {client_id: $client_id})
+            WHERE w.week <= date() - duration({days: $retention_days + 7})
+            DETACH DELETE w
+            """,
+            params,
         )
-        return result[0]["deleted"] if result else 0
+        return deleted or 0
+
+    def build_weekly_rollups(self, client_id: str) -> int:
+        """Build the MetricWeekly rollups missing for a client's daily metrics.
+
+        Ingest keeps rollups current, but metrics loaded before rollups
+        existed have none, and reports would skip those weeks. Weeks that
+        already have a rollup are left alone, since ingest re-sums the whole
+        week, so the call is safe to repeat.
+
+        Args:
+            client_id: Client UUID.
+
+        Returns:
+            Number of rollups built.
+        """
+        # CALL ... IN TRANSACTIONS needs an auto-commit transaction (session.run)
+        built = self.execute_scalar(_BUILD_WEEKLY_ROLLUPS_QUERY, {"client_id": client_id}, "built")
+        logger.info(f"Built {built or 0} weekly metric rollups for client {client_id}")
+        return built or 0
+
+
+class AsyncNeo4jClient:
+    """Asyncio Neo4j client for running independent queries concurrently."""
+
+    def __init__(self, settings: Settings | None = None):
+        """Initialize async Neo4j client.
+
+        Args:
+            settings: Application settings. Uses default if not provided.
+        """
+        self._settings = settings or get_settings()
+
+    @cached_property
+    def driver(self) -> AsyncDriver:
+        """Get the async Neo4j driver, created on first access."""
+        return AsyncGraphDatabase.driver(
+            self._settings.NEO4J_URI,
+            auth=(self._settings.NEO4J_USER, self._settings.NEO4J_PASSWORD),
+            max_connection_lifetime=3600,
+            max_connection_pool_size=50,
+            connection_acquisition_timeout=60,
+        )
+
+    async def close(self) -> None:
+        """Close the driver connection."""
+        # Dropping the cached driver lets the next access reconnect
+        driver = self.__dict__.pop("driver", None)
+        if driver is not None:
+            await driver.close()
+
+    async def execute_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        database: str = "neo4j",
+    ) -> list[dict[str, Any]]:
+        """Execute a Cypher query in its own session and return results.
+
+        Args:
+            query: Cypher query string.
+            parameters: Query parameters.
+            database: Database name.
+
+        Returns:
+            List of result records as dictionaries.
+        """
+        async with self.driver.session(database=database) as session:
+            result = await session.run(query, parameters or {})
+            return [record.data() async for record in result]
+
+    async def get_client_data(
+        self,
+        client_id: str,
+        include_metrics: bool = True,
+    ) -> dict[str, Any]:
+        """Get all data for a specific client (with isolation).
+
+        The per-entity queries share no data, so they run concurrently.
+
+        Args:
+            client_id: Client UUID.
+            include_metrics: Whether to include metrics data.
+
+        Returns:
+            Dictionary with client, campaigns, ad sets, ads, and optionally metrics.
+        """
+        params = {"client_id": client_id}
+        queries = [_CLIENT_QUERY, _CAMPAIGNS_QUERY, _ADSETS_QUERY, _ADS_QUERY]
+        if include_metrics:
+            queries.append(_METRICS_QUERY)
+
+        results = await asyncio.gather(
+            *(self.execute_query(query, params) for query in queries)
+        )
+        metrics = results[4] if include_metrics else None
+
+        return _client_data_result(*results[:4], metrics)
 
 
 # Singleton instance
 _client: Neo4jClient | None = None
+_async_client: AsyncNeo4jClient | None = None
 
 
 def get_neo4j_client() -> Neo4jClient:
@@ -272,3 +634,11 @@ def get_neo4j_client() -> Neo4jClient:
     if _client is None:
         _client = Neo4jClient()
     return _client
+
+
+def get_async_neo4j_client() -> AsyncNeo4jClient:
+    """Get the async Neo4j client singleton."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncNeo4jClient()
+    return _async_client
@@ -1,26 +1,383 @@
 """Data ingestion pipeline for loading data into Neo4j."""
 
 import logging
-from datetime import datetime
-from typing import Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Final
 from uuid import uuid4
 
-from .client import Neo4jClient, get_neo4j_client
-from .schema import CampaignStatus, NodeLabel, RelationType
+import numpy as np
+from neo4j.exceptions import DriverError, Neo4jError
+
+from .client import BulkSession, Neo4jClient, get_neo4j_client
+from .schema import CHANNEL_DISPLAY_NAMES, CampaignStatus, NodeLabel, RelationType
 
 logger = logging.getLogger(__name__)
 
+# Concurrent ingest writes; well under the driver's connection pool of 50
+_MAX_CONCURRENT_WRITES = 10
+
+# Metric batches larger than this are coerced with pandas rather than per row
+_VECTORIZE_MIN_ROWS = 1000
+
+# Row defaults, merged under each input dict in one step; the ingest queries
+# read only the keys they need, so extra input keys are harmless. Enum values
+# are resolved here, once, rather than per row
+_CLIENT_DEFAULTS = MappingProxyType(
+    {
+        "industry": "Unknown",
+        "contract_start": None,
+        "budget": 0.0,
+        "budget_currency": "USD",
+        "status": "active",
+        "data_retention_days": 365,
+    }
+)
+_CAMPAIGN_DEFAULTS = MappingProxyType(
+    {
+        "external_id": None,
+        "objective": "conversions",
+        "end_date": None,
+        "budget": 0.0,
+        "budget_currency": "USD",
+        "daily_budget": None,
+        "status": CampaignStatus.ACTIVE.value,
+        "channel": "google_ads",
+    }
+)
+_ADSET_DEFAULTS = MappingProxyType(
+    {
+        "external_id": None,
+        "targeting": "{}",
+        "budget": 0.0,
+        "budget_currency": "USD",
+        "status": "active",
+    }
+)
+_AD_DEFAULTS = MappingProxyType(
+    {
+        "external_id": None,
+        "headline": "",
+        "description": "",
+        "creative_type": "image",
+        "status": "active",
+    }
+)
+
+
+def _build_upsert(
+    label: NodeLabel,
+    always: tuple[str, ...],
+    create_only: tuple[str, ...] = (),
+    expressions: dict[str, str] | None = None,
+    parent: tuple[NodeLabel, str, RelationType] | None = None,
+    tail: str = "",
+) -> str:
+    """Generate an UNWIND upsert query over ``$rows``.
+
+    Nodes are merged on ``row.id``. Both property groups are set on create;
+    only ``always`` is refreshed on match. Timestamps are stamped by the
+    server.
+
+    Args:
+        label: Label of the upserted node, bound as ``n``.
+        always: Properties set on create and on match.
+        create_only: Properties set only on create.
+        expressions: Cypher expression per property. Defaults to ``row.<prop>``.
+        parent: Parent label, row key holding the parent ID, and relationship
+            from parent to node. The parent is bound as ``parent``.
+        tail: Extra clauses appended after the upsert.
+
+    Returns:
+        Query text. With a parent, the query returns one record whose ``ids``
+        lists the rows written; rows whose parent does not exist are dropped
+        by the parent MATCH.
+    """
+    expressions = expressions or {}
+
+    def assignments(props: tuple[str, ...], *timestamps: str) -> str:
+        lines = [f"n.{prop} = {expressions.get(prop, f'row.{prop}')}" for prop in props]
+        lines += [f"n.{prop} = datetime()" for prop in timestamps]
+        return ",\n".join(f"    {line}" for line in lines)
+
+    clauses = ["UNWIND $rows AS row"]
+    if parent:
+        parent_label, parent_key, _ = parent
+        clauses.append(f"MATCH (parent:{parent_label.value} {{id: row.{parent_key}}})")
+    clauses += [
+        f"MERGE (n:{label.value} {{id: row.id}})",
+        "ON CREATE SET",
+        assignments(create_only + always, "created_at", "updated_at"),
+        "ON MATCH SET",
+        assignments(always, "updated_at"),
+    ]
+    if parent:
+        clauses.append(f"MERGE (parent)-[:{parent[2].value}]->(n)")
+    if tail:
+        clauses.append(tail.strip())
+    if parent:
+        clauses.append("RETURN collect(n.id) AS ids")
+    return "\n".join(clauses) + "\n"
+
+
+# Built once at import so every call sends the same parameterized text and
+# the server reuses its cached plan. IDs are assigned client-side, so the
+# queries return no records beyond the written IDs of child rows
+_CLIENTS_QUERY: Final = _build_upsert(
+    NodeLabel.CLIENT,
+    always=(
+        "name",
+        "industry",
+        "budget",
+        "budget_currency",
+        "status",
+        "data_retention_days",
+    ),
+    create_only=("contract_start",),
+    expressions={"contract_start": "coalesce(date(row.contract_start), date())"},
+)
+
+_CAMPAIGNS_QUERY: Final = _build_upsert(
+    NodeLabel.CAMPAIGN,
+    always=("name", "objective", "budget", "budget_currency", "daily_budget", "status"),
+    create_only=("client_id", "external_id", "start_date", "end_date", "channel"),
+    expressions={"start_date": "date(row.start_date)", "end_date": "date(row.end_date)"},
+    parent=(NodeLabel.CLIENT, "client_id", RelationType.OWNS),
+    # A unit subquery, so campaigns without a channel are still upserted
+    tail="""
+CALL {
+    WITH n, row
+    WITH n, row WHERE row.channel IS NOT NULL
+    MERGE (ch:Channel {name: row.channel})
+    ON CREATE SET ch.display_name = row.channel_display_name
+    MERGE (n)-[:RUNS_ON]->(ch)
+}
+""",
+)
+
+_ADSETS_QUERY: Final = _build_upsert(
+    NodeLabel.AD_SET,
+    always=("name", "targeting", "budget", "budget_currency", "status"),
+    create_only=("client_id", "campaign_id", "external_id"),
+    parent=(NodeLabel.CAMPAIGN, "campaign_id", RelationType.CONTAINS),
+)
+
+_ADS_QUERY: Final = _build_upsert(
+    NodeLabel.AD,
+    always=("name", "headline", "description", "status"),
+    create_only=("client_id", "adset_id", "external_id", "creative_type"),
+    parent=(NodeLabel.AD_SET, "adset_id", RelationType.CONTAINS),
+)
+
+_METRICS_QUERY: Final = """
+UNWIND range(0, size($ids) - 1) AS i
+MERGE (m:Metric {id: $ids[i]})
+ON CREATE SET
+    m.client_id = $client_id,
+    m.entity_type = $entity_type,
+    m.entity_id = $entity_id,
+    m.date = date($dates[i]),
+    m.impressions = $impressions[i],
+    m.clicks = $clicks[i],
+    m.conversions = $conversions[i],
+    m.spend = $spend[i],
+    m.spend_currency = $spend_currency[i],
+    m.revenue = $revenue[i],
+    m.revenue_currency = $revenue_currency[i],
+    m.ctr = $ctr[i],
+    m.cpc = $cpc[i],
+    m.cpm = $cpm[i],
+    m.roas = $roas[i],
+    m.created_at = datetime()
+ON MATCH SET
+    m.impressions = $impressions[i],
+    m.clicks = $clicks[i],
+    m.conversions = $conversions[i],
+    m.spend = $spend[i],
+    m.revenue = $revenue[i],
+    m.ctr = $ctr[i],
+    m.cpc = $cpc[i],
+    m.cpm = $cpm[i],
+    m.roas = $roas[i]
+WITH DISTINCT date.truncate('week', m.date) AS week
+MERGE (w:MetricWeekly {entity_type: $entity_type, entity_id: $entity_id, week: week})
+ON CREATE SET w.client_id = $client_id
+WITH w
+MATCH (d:Metric {entity_type: $entity_type, entity_id: $entity_id})
+USING INDEX d:Metric(entity_type, entity_id, date)
+WHERE d.date >= w.week AND d.date < w.week + duration({days: 7})
+WITH w,
+    sum(d.impressions) AS impressions,
+    sum(d.clicks) AS clicks,
+    sum(d.conversions) AS conversions,
+    sum(d.spend) AS spend,
+    sum(d.revenue) AS revenue
+SET w.impressions = impressions,
+    w.clicks = clicks,
+    w.conversions = conversions,
+    w.spend = spend,
+    w.revenue = revenue
+"""
+
+_USER_QUERY: Final = """
+MERGE (u:User {id: $id})
+ON CREATE SET
+    u.email = $email,
+    u.hashed_password = $hashed_password,
+    u.name = $name,
+    u.role = $role,
+    u.client_ids = $client_ids,
+    u.created_at = datetime(),
+    u.updated_at = datetime()
+ON MATCH SET
+    u.name = $name,
+    u.role = $role,
+    u.client_ids = $client_ids,
+    u.updated_at = datetime()
+"""
+
+
+def _derived_metric_columns(
+    impressions: np.ndarray, clicks: np.ndarray, spend: np.ndarray, revenue: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Compute CTR, CPC, CPM and ROAS columns.
+
+    Ratios with a zero denominator are 0, except ROAS, which is NaN when
+    there is no spend or no revenue.
+
+    Args:
+        impressions: Impressions per row.
+        clicks: Clicks per row.
+        spend: Spend per row.
+        revenue: Revenue per row, NaN where unknown.
+
+    Returns:
+        Mapping of ratio name to a float column.
+    """
+    impressions = impressions.astype(np.float64)
+    clicks = clicks.astype(np.float64)
+
+    # np.where evaluates both branches; the masked-out divisions are discarded
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "ctr": np.where(impressions > 0, clicks / impressions * 100, 0.0),
+            "cpc": np.where(clicks > 0, spend / clicks, 0.0),
+            "cpm": np.where(impressions > 0, spend / impressions * 1000, 0.0),
+            "roas": np.where((spend > 0) & ~np.isnan(revenue), revenue / spend, np.nan),
+        }
+
+
+def _metric_columns(metrics_data: list[dict[str, Any]], entity_id: str) -> dict[str, Any]:
+    """Transpose metric records into columns, applying defaults.
+
+    Large batches are coerced column-wise through pandas; small ones stay on
+    plain comprehensions, where building a DataFrame would cost more than it
+    saves.
+
+    Args:
+        metrics_data: Metric records.
+        entity_id: Entity UUID, used for records without an ID.
+
+    Returns:
+        Columns accepted by ``DataIngester.ingest_metric_columns``.
+    """
+    if len(metrics_data) > _VECTORIZE_MIN_ROWS:
+        return _metric_frame_columns(metrics_data, entity_id)
+
+    return {
+        "id": [m.get("id") or f"{entity_id}_{m['date']}" for m in metrics_data],
+        "date": [m["date"] for m in metrics_data],
+        "impressions": np.array([m.get("impressions", 0) for m in metrics_data], np.int64),
+        "clicks": np.array([m.get("clicks", 0) for m in metrics_data], np.int64),
+        "conversions": np.array([m.get("conversions", 0) for m in metrics_data], np.int64),
+        "spend": np.array([m.get("spend", 0) for m in metrics_data], np.float64),
+        "revenue": np.array(
+            [np.nan if m.get("revenue") is None else m["revenue"] for m in metrics_data],
+            np.float64,
+        ),
+        "spend_currency": [m.get("spend_currency", "USD") for m in metrics_data],
+        "revenue_currency": [m.get("revenue_currency") for m in metrics_data],
+    }
+
+
+def _metric_frame_columns(metrics_data: list[dict[str, Any]], entity_id: str) -> dict[str, Any]:
+    """Transpose metric records into columns with vectorized pandas coercion.
+
+    Args:
+        metrics_data: Metric records.
+        entity_id: Entity UUID, used for records without an ID.
+
+    Returns:
+        Columns accepted by ``DataIngester.ingest_metric_columns``.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame.from_records(metrics_data)
+    count = len(frame)
+
+    def numeric(name: str, dtype: type) -> np.ndarray:
+        if name not in frame:
+            return np.zeros(count, dtype)
+        return frame[name].fillna(0).to_numpy(dtype)
+
+    def nullable(name: str, default: Any = None) -> list[Any]:
+        if name not in frame:
+            return [default] * count
+        column = frame[name].astype(object)
+        return column.where(column.notna(), default).tolist()
+
+    fallback_ids = f"{entity_id}_" + frame["date"].astype(str)
+    if "id" in frame:
+        ids = frame["id"].astype(object)
+        ids = ids.where(ids.notna() & (ids != ""), fallback_ids)
+    else:
+        ids = fallback_ids
+
+    return {
+        "id": ids.astype(str).tolist(),
+        "date": frame["date"].astype(object).tolist(),
+        "impressions": numeric("impressions", np.int64),
+        "clicks": numeric("clicks", np.int64),
+        "conversions": numeric("conversions", np.int64),
+        "spend": numeric("spend", np.float64),
+        "revenue": (
+            frame["revenue"].to_numpy(np.float64, na_value=np.nan)
+            if "revenue" in frame
+            else np.full(count, np.nan)
+        ),
+        "spend_currency": nullable("spend_currency", "USD"),
+        "revenue_currency": nullable("revenue_currency"),
+    }
+
+
+def _to_list(column: Any) -> list[Any]:
+    """Convert a column slice to a list of native Python values for the driver."""
+    return column.tolist() if isinstance(column, np.ndarray) else list(column)
+
+
+def _nullable(column: np.ndarray) -> list[float | None]:
+    """Convert a float column to a list with None in place of NaN."""
+    # Mask in NumPy rather than testing each value in a Python loop
+    values = column.astype(object)
+    values[np.isnan(column)] = None
+    return values.tolist()
+
 
 class DataIngester:
     """Handles ingestion of marketing data into Neo4j graph."""
 
-    def __init__(self, client: Neo4jClient | None = None):
+    __slots__ = ("_client", "_chunk_size")
+
+    def __init__(self, client: Neo4jClient | None = None, chunk_size: int = 10_000):
         """Initialize data ingester.
 
         Args:
             client: Neo4j client instance. Uses default if not provided.
+            chunk_size: Maximum metric rows written per transaction.
         """
         self._client = client or get_neo4j_client()
+        self._chunk_size = chunk_size
 
     def ingest_client(self, client_data: dict[str, Any]) -> str:
         """Create or update a client node.
@@ -31,47 +388,31 @@ class DataIngester:
         Returns:
             Client ID.
         """
-        client_id = client_data.get("id") or str(uuid4())
-        now = datetime.utcnow().isoformat()
-
-        query = """
-        MERGE (c:Client {id: $id})
-        ON CREATE SET
-            c.name = $name,
-            c.industry = $industry,
-            c.contract_start = date($contract_start),
-            c.budget = $budget,
-            c.budget_currency = $budget_currency,
-            c.status = $status,
-            c.data_retention_days = $data_retention_days,
-            c.created_at = datetime($now),
-            c.updated_at = datetime($now)
-        ON MATCH SET
-            c.name = $name,
-            c.industry = $industry,
-            c.budget = $budget,
-            c.budget_currency = $budget_currency,
-            c.status = $status,
-            c.data_retention_days = $data_retention_days,
-            c.updated_at = datetime($now)
-        RETURN c.id AS id
+        return self.ingest_clients([client_data])[0]
+
+    def ingest_clients(self, clients: list[dict[str, Any]]) -> list[str]:
+        """Create or update client nodes in one round-trip.
+
+        Args:
+            clients: Client properties, one dict per client.
+
+        Returns:
+            Client IDs.
         """
+        if not clients:
+            return []
 
-        params = {
-            "id": client_id,
-            "name": client_data["name"],
-            "industry": client_data.get("industry", "Unknown"),
-            "contract_start": client_data.get("contract_start", now[:10]),
-            "budget": float(client_data.get("budget", 0)),
-            "budget_currency": client_data.get("budget_currency", "USD"),
-            "status": client_data.get("status", "active"),
-            "data_retention_days": int(client_data.get("data_retention_days", 365)),
-            "now": now,
-        }
+        rows = []
+        for client_data in clients:
+            row = {**_CLIENT_DEFAULTS, **client_data}
+            row["id"] = row.get("id") or str(uuid4())
+            row["budget"] = float(row["budget"])
+            row["data_retention_days"] = int(row["data_retention_days"])
+            rows.append(row)
 
-        result = self._client.execute_query(query, params)
-        logger.info(f"Ingested client: {client_data['name']} ({client_id})")
-        return result[0]["id"]
+        self._client.execute_write(_CLIENTS_QUERY, {"rows": rows})
+        logger.info(f"Ingested {len(rows)} clients")
+        return [row["id"] for row in rows]
 
     def ingest_campaign(self, campaign_data: dict[str, Any], client_id: str) -> str:
         """Create or update a campaign node.
@@ -82,61 +423,46 @@ class DataIngester:
 
         Returns:
             Campaign ID.
+
+        Raises:
+            ValueError: If the parent client does not exist.
         """
-        campaign_id = campaign_data.get("id") or str(uuid4())
-        now = datetime.utcnow().isoformat()
-
-        query = """
-        MATCH (client:Client {id: $client_id})
-        MERGE (c:Campaign {id: $id})
-        ON CREATE SET
-            c.client_id = $client_id,
-            c.external_id = $external_id,
-            c.name = $name,
-            c.objective = $objective,
-            c.start_date = date($start_date),
-            c.end_date = CASE WHEN $end_date IS NOT NULL THEN date($end_date) ELSE null END,
-            c.budget = $budget,
-            c.budget_currency = $budget_currency,
-            c.daily_budget = $daily_budget,
-            c.status = $status,
-            c.channel = $channel,
-            c.created_at = datetime($now),
-            c.updated_at = datetime($now)
-        ON MATCH SET
-            c.name = $name,
-            c.objective = $objective,
-            c.budget = $budget,
-            c.budget_currency = $budget_currency,
-            c.daily_budget = $daily_budget,
-            c.status = $status,
-            c.updated_at = datetime($now)
-        MERGE (client)-[:OWNS]->(c)
-        WITH c
-        MATCH (ch:Channel {name: $channel})
-        MERGE (c)-[:RUNS_ON]->(ch)
-        RETURN c.id AS id
+        ids = self.ingest_campaigns([campaign_data], client_id)
+        if not ids:
+            raise ValueError(f"Client {client_id} does not exist")
+        return ids[0]
+
+    def ingest_campaigns(
+        self, campaigns: list[dict[str, Any]], client_id: str | None = None
+    ) -> list[str]:
+        """Create or update campaign nodes in one round-trip.
+
+        Args:
+            campaigns: Campaign properties, one dict per campaign.
+            client_id: Parent client ID for every campaign. Defaults to each
+                campaign's own ``client_id``.
+
+        Returns:
+            Campaign IDs that were written. Rows whose client does not exist
+            are skipped and logged.
         """
+        if not campaigns:
+            return []
 
-        params = {
-            "id": campaign_id,
-            "client_id": client_id,
-            "external_id": campaign_data.get("external_id"),
-            "name": campaign_data["name"],
-            "objective": campaign_data.get("objective", "conversions"),
-            "start_date": campaign_data["start_date"],
-            "end_date": campaign_data.get("end_date"),
-            "budget": float(campaign_data.get("budget", 0)),
-            "budget_currency": campaign_data.get("budget_currency", "USD"),
-            "daily_budget": campaign_data.get("daily_budget"),
-            "status": campaign_data.get("status", CampaignStatus.ACTIVE.value),
-            "channel": campaign_data.get("channel", "google_ads"),
-            "now": now,
-        }
+        rows = []
+        for campaign_data in campaigns:
+            row = {**_CAMPAIGN_DEFAULTS, **campaign_data}
+            row["id"] = row.get("id") or str(uuid4())
+            row["client_id"] = client_id or row["client_id"]
+            row["budget"] = float(row["budget"])
+            row["channel_display_name"] = CHANNEL_DISPLAY_NAMES.get(row["channel"], row["channel"])
+            rows.append(row)
+
+        unknown = {row["channel"] for row in rows} - CHANNEL_DISPLAY_NAMES.keys() - {None}
+        if unknown:
+            logger.warning(f"Ingesting campaigns on unknown channels: {sorted(unknown)}")
 
-        result = self._client.execute_query(query, params)
-        logger.info(f"Ingested campaign: {campaign_data['name']} ({campaign_id})")
-        return result[0]["id"]
+        return self._upsert_children(_CAMPAIGNS_QUERY, rows, "campaigns", "client_id")
 
     def ingest_adset(
         self, adset_data: dict[str, Any], campaign_id: str, client_id: str
@@ -150,51 +476,43 @@ class DataIngester:
 
         Returns:
             Ad set ID.
+
+        Raises:
+            ValueError: If the parent campaign does not exist.
         """
-        adset_id = adset_data.get("id") or str(uuid4())
-        now = datetime.utcnow().isoformat()
-
-        query = """
-        MATCH (camp:Campaign {id: $campaign_id})
-        MERGE (a:AdSet {id: $id})
-        ON CREATE SET
-            a.client_id = $client_id,
-            a.campaign_id = $campaign_id,
-            a.external_id = $external_id,
-            a.name = $name,
-            a.targeting = $targeting,
-            a.budget = $budget,
-            a.budget_currency = $budget_currency,
-            a.status = $status,
-            a.created_at = datetime($now),
-            a.updated_at = datetime($now)
-        ON MATCH SET
-            a.name = $name,
-            a.targeting = $targeting,
-            a.budget = $budget,
-            a.budget_currency = $budget_currency,
-            a.status = $status,
-            a.updated_at = datetime($now)
-        MERGE (camp)-[:CONTAINS]->(a)
-        RETURN a.id AS id
+        ids = self.ingest_adsets([{**adset_data, "campaign_id": campaign_id}], client_id)
+        if not ids:
+            raise ValueError(f"Campaign {campaign_id} does not exist")
+        return ids[0]
+
+    def ingest_adsets(
+        self, adsets: list[dict[str, Any]], client_id: str | None = None
+    ) -> list[str]:
+        """Create or update ad set nodes in one round-trip.
+
+        Each ad set is attached to the campaign named by its ``campaign_id``.
+
+        Args:
+            adsets: Ad set properties, one dict per ad set.
+            client_id: Parent client ID for every ad set. Defaults to each
+                ad set's own ``client_id``.
+
+        Returns:
+            Ad set IDs that were written. Rows whose campaign does not exist
+            are skipped and logged.
         """
+        if not adsets:
+            return []
 
-        params = {
-            "id": adset_id,
-            "client_id": client_id,
-            "campaign_id": campaign_id,
-            "external_id": adset_data.get("external_id"),
-            "name": adset_data["name"],
-            "targeting": adset_data.get("targeting", "{}"),
-            "budget": float(adset_data.get("budget", 0)),
-            "budget_currency": adset_data.get("budget_currency", "USD"),
-            "status": adset_data.get("status", "active"),
-            "now": now,
-        }
+        rows = []
+        for adset_data in adsets:
+            row = {**_ADSET_DEFAULTS, **adset_data}
+            row["id"] = row.get("id") or str(uuid4())
+            row["client_id"] = client_id or row["client_id"]
+            row["budget"] = float(row["budget"])
+            rows.append(row)
 
-        result = self._client.execute_query(query, params)
-        logger.info(f"Ingested ad set: {adset_data['name']} ({adset_id})")
-        return result[0]["id"]
+        return self._upsert_children(_ADSETS_QUERY, rows, "ad sets", "campaign_id")
 
     def ingest_ad(self, ad_data: dict[str, Any], adset_id: str, client_id: str) -> str:
         """Create or update an ad node.
@@ -206,50 +524,66 @@ class DataIngester:
 
         Returns:
             Ad ID.
+
+        Raises:
+            ValueError: If the parent ad set does not exist.
+        """
+        ids = self.ingest_ads([{**ad_data, "adset_id": adset_id}], client_id)
+        if not ids:
+            raise ValueError(f"Ad set {adset_id} does not exist")
+        return ids[0]
+
+    def ingest_ads(self, ads: list[dict[str, Any]], client_id: str | None = None) -> list[str]:
+        """Create or update ad nodes in one round-trip.
+
+        Each ad is attached to the ad set named by its ``adset_id``.
+
+        Args:
+            ads: Ad properties, one dict per ad.
+            client_id: Parent client ID for every ad. Defaults to each ad's
+                own ``client_id``.
+
+        Returns:
+            Ad IDs that were written. Rows whose ad set does not exist
+            are skipped and logged.
         """
-        ad_id = ad_data.get("id") or str(uuid4())
-        now = datetime.utcnow().isoformat()
-
-        query = """
-        MATCH (adset:AdSet {id: $adset_id})
-        MERGE (a:Ad {id: $id})
-        ON CREATE SET
-            a.client_id = $client_id,
-            a.adset_id = $adset_id,
-            a.external_id = $external_id,
-            a.name = $name,
-            a.headline = $headline,
-            a.description = $description,
-            a.creative_type = $creative_type,
-            a.status = $status,
-            a.created_at = datetime($now),
-            a.updated_at = datetime($now)
-        ON MATCH SET
-            a.name = $name,
-            a.headline = $headline,
-            a.description = $description,
-            a.status = $status,
-            a.updated_at = datetime($now)
-        MERGE (adset)-[:CONTAINS]->(a)
-        RETURN a.id AS id
+        if not ads:
+            return []
+
+        rows = []
+        for ad_data in ads:
+            row = {**_AD_DEFAULTS, **ad_data}
+            row["id"] = row.get("id") or str(uuid4())
+            row["client_id"] = client_id or row["client_id"]
+            rows.append(row)
+
+        return self._upsert_children(_ADS_QUERY, rows, "ads", "adset_id")
+
+    def _upsert_children(
+        self, query: str, rows: list[dict[str, Any]], noun: str, parent_key: str
+    ) -> list[str]:
+        """Run a child upsert and report only the rows actually written.
+
+        Args:
+            query: Upsert query returning the written IDs as ``ids``.
+            rows: Query rows.
+            noun: Plural entity name for log messages.
+            parent_key: Row key holding the parent ID.
+
+        Returns:
+            IDs of the written rows, in input order.
         """
+        written = set(self._client.execute_scalar(query, {"rows": rows}, "ids") or ())
+        ids = [row["id"] for row in rows if row["id"] in written]
 
-        params = {
-            "id": ad_id,
-            "client_id": client_id,
-            "adset_id": adset_id,
-            "external_id": ad_data.get("external_id"),
-            "name": ad_data["name"],
-            "headline": ad_data.get("headline", ""),
-            "description": ad_data.get("description", ""),
-            "creative_type": ad_data.get("creative_type", "image"),
-            "status": ad_data.get("status", "active"),
-            "now": now,
-        }
+        if len(ids) < len(rows):
+            orphans = sorted({str(row[parent_key]) for row in rows if row["id"] not in written})
+            logger.error(
+                f"Skipped {len(rows) - len(ids)} {noun} whose parent does not exist: {orphans}"
+            )
 
-        result = self._client.execute_query(query, params)
-        logger.info(f"Ingested ad: {ad_data['name']} ({ad_id})")
-        return result[0]["id"]
+        logger.info(f"Ingested {len(ids)} {noun}")
+        return ids
 
     def ingest_metrics(
         self,
@@ -257,6 +591,7 @@ class DataIngester:
         entity_type: str,
         entity_id: str,
         client_id: str,
+        bulk: BulkSession | None = None,
     ) -> int:
         """Bulk ingest metrics for an entity.
 
@@ -265,88 +600,163 @@ class DataIngester:
             entity_type: Type of entity (campaign/adset/ad).
             entity_id: Entity UUID.
             client_id: Client UUID.
+            bulk: Open bulk session to write on, so a load spanning many
+                entities reuses one session. Opens its own when omitted.
 
         Returns:
-            Number of metrics ingested.
-        """
-        query = """
-        UNWIND $metrics AS metric
-        MERGE (m:Metric {id: metric.id})
-        ON CREATE SET
-            m.client_id = $client_id,
-            m.entity_type = $entity_type,
-            m.entity_id = $entity_id,
-            m.date = date(metric.date),
-            m.impressions = metric.impressions,
-            m.clicks = metric.clicks,
-            m.conversions = metric.conversions,
-            m.spend = metric.spend,
-            m.spend_currency = metric.spend_currency,
-            m.revenue = metric.revenue,
-            m.revenue_currency = metric.revenue_currency,
-            m.ctr = CASE WHEN metric.impressions > 0
-                THEN toFloat(metric.clicks) / metric.impressions * 100
-                ELSE 0 END,
-            m.cpc = CASE WHEN metric.clicks > 0
-                THEN metric.spend / metric.clicks
-                ELSE 0 END,
-            m.cpm = CASE WHEN metric.impressions > 0
-                THEN metric.spend / metric.impressions * 1000
-                ELSE 0 END,
-            m.roas = CASE WHEN metric.spend > 0 AND metric.revenue IS NOT NULL
-                THEN metric.revenue / metric.spend
-                ELSE null END,
-            m.created_at = datetime()
-        ON MATCH SET
-            m.impressions = metric.impressions,
-            m.clicks = metric.clicks,
-            m.conversions = metric.conversions,
-            m.spend = metric.spend,
-            m.revenue = metric.revenue,
-            m.ctr = CASE WHEN metric.impressions > 0
-                THEN toFloat(metric.clicks) / metric.impressions * 100
-                ELSE 0 END,
-            m.cpc = CASE WHEN metric.clicks > 0
-                THEN metric.spend / metric.clicks
-                ELSE 0 END,
-            m.cpm = CASE WHEN metric.impressions > 0
-                THEN metric.spend / metric.impressions * 1000
-                ELSE 0 END,
-            m.roas = CASE WHEN metric.spend > 0 AND metric.revenue IS NOT NULL
-                THEN metric.revenue / metric.spend
-                ELSE null END
+            Number of metrics ingested, excluding chunks that failed.
         """
+        return self.ingest_metric_columns(
+            _metric_columns(metrics_data, entity_id), entity_type, entity_id, client_id, bulk
+        )
 
-        # Prepare metrics with IDs
-        prepared_metrics = []
-        for m in metrics_data:
-            metric_id = m.get("id") or f"{entity_id}_{m['date']}"
-            prepared_metrics.append(
-                {
-                    "id": metric_id,
-                    "date": m["date"],
-                    "impressions": int(m.get("impressions", 0)),
-                    "clicks": int(m.get("clicks", 0)),
-                    "conversions": int(m.get("conversions", 0)),
-                    "spend": float(m.get("spend", 0)),
-                    "spend_currency": m.get("spend_currency", "USD"),
-                    "revenue": m.get("revenue"),
-                    "revenue_currency": m.get("revenue_currency"),
-                }
-            )
+    def ingest_metric_columns(
+        self,
+        columns: dict[str, Any],
+        entity_type: str,
+        entity_id: str,
+        client_id: str,
+        bulk: BulkSession | None = None,
+    ) -> int:
+        """Bulk ingest metrics for an entity from parallel columns.
+
+        Columns stay as arrays until each chunk is sent, so a large load
+        holds one Python object per value only for the chunk in flight, not
+        a dict per row for the whole load.
+
+        Args:
+            columns: Equal-length columns: id, date, impressions, clicks,
+                conversions and spend, plus optional revenue (NaN where
+                unknown), spend_currency and revenue_currency. The output of
+                ``MockDataGenerator.generate_metrics_soa`` is accepted as is.
+            entity_type: Type of entity (campaign/adset/ad).
+            entity_id: Entity UUID.
+            client_id: Client UUID.
+            bulk: Open bulk session to write on. Opens its own when omitted.
+
+        Returns:
+            Number of metrics ingested, excluding chunks that failed.
+        """
+        if bulk is None:
+            with self._client.bulk_session() as bulk:
+                return self.ingest_metric_columns(
+                    columns, entity_type, entity_id, client_id, bulk
+                )
+
+        count = len(columns["id"])
+        impressions = np.asarray(columns["impressions"], dtype=np.int64)
+        clicks = np.asarray(columns["clicks"], dtype=np.int64)
+        conversions = np.asarray(columns["conversions"], dtype=np.int64)
+        spend = np.asarray(columns["spend"], dtype=np.float64)
+        revenue = np.asarray(columns.get("revenue", np.full(count, np.nan)), dtype=np.float64)
+        spend_currency = columns.get("spend_currency", ["USD"] * count)
+        revenue_currency = columns.get("revenue_currency", [None] * count)
+
+        # Derived ratios are computed here rather than per row in Cypher
+        derived = _derived_metric_columns(impressions, clicks, spend, revenue)
 
         params = {
-            "metrics": prepared_metrics,
             "client_id": client_id,
             "entity_type": entity_type,
             "entity_id": entity_id,
         }
 
-        self._client.execute_query(query, params)
-        logger.info(
-            f"Ingested {len(prepared_metrics)} metrics for {entity_type} {entity_id}"
+        # One transaction per chunk bounds server memory; a failed chunk is
+        # logged and skipped rather than rolling back the whole load. Each
+        # chunk re-sums the MetricWeekly rollups of the weeks it touched in
+        # the same transaction, so re-ingesting a day never double counts.
+        # Every chunk runs on the same session
+        ingested = 0
+        for start in range(0, count, self._chunk_size):
+            end = min(start + self._chunk_size, count)
+            chunk = {
+                "ids": _to_list(columns["id"][start:end]),
+                "dates": _to_list(columns["date"][start:end]),
+                "impressions": impressions[start:end].tolist(),
+                "clicks": clicks[start:end].tolist(),
+                "conversions": conversions[start:end].tolist(),
+                "spend": spend[start:end].tolist(),
+                "spend_currency": _to_list(spend_currency[start:end]),
+                "revenue": _nullable(revenue[start:end]),
+                "revenue_currency": _to_list(revenue_currency[start:end]),
+                "ctr": derived["ctr"][start:end].tolist(),
+                "cpc": derived["cpc"][start:end].tolist(),
+                "cpm": derived["cpm"][start:end].tolist(),
+                "roas": _nullable(derived["roas"][start:end]),
+            }
+            try:
+                bulk.write(_METRICS_QUERY, {**params, **chunk})
+            except (Neo4jError, DriverError) as e:
+                logger.error(
+                    f"Failed to ingest metrics {start}-{end - 1} "
+                    f"for {entity_type} {entity_id}: {e}"
+                )
+                continue
+            ingested += end - start
+
+        logger.info(f"Ingested {ingested} metrics for {entity_type} {entity_id}")
+        return ingested
+
+    def ingest_all(
+        self,
+        data: dict[str, list[dict[str, Any]]],
+        client_id: str,
+        max_workers: int = _MAX_CONCURRENT_WRITES,
+    ) -> dict[str, int]:
+        """Ingest a synced payload, running independent writes concurrently.
+
+        Campaigns, ad sets and ads are written level by level because each
+        level matches its parents, but the chunks within a level run in
+        parallel. Metric batches do not depend on the hierarchy, so every
+        entity's metrics run alongside it on a separate pool; the hierarchy
+        never queues behind the metric backlog.
+
+        Args:
+            data: Payload with optional "campaigns", "adsets", "ads" and
+                "metrics" lists; metrics carry entity_type and entity_id.
+            client_id: Client ID owning every entity.
+            max_workers: Maximum concurrent writes, split between the
+                hierarchy and metrics with at least one worker each.
+
+        Returns:
+            Number of ingested rows per payload key.
+        """
+        metrics_by_entity: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for m in data.get("metrics", []):
+            metrics_by_entity[(m["entity_type"], m["entity_id"])].append(m)
+
+        levels = (
+            ("campaigns", self.ingest_campaigns),
+            ("adsets", self.ingest_adsets),
+            ("ads", self.ingest_ads),
         )
-        return len(prepared_metrics)
+        counts = {}
+        metric_workers = max(1, max_workers // 2)
+        hierarchy_workers = max(1, max_workers - metric_workers)
+
+        with (
+            ThreadPoolExecutor(max_workers=metric_workers) as metric_pool,
+            ThreadPoolExecutor(max_workers=hierarchy_workers) as pool,
+        ):
+            metric_futures = [
+                metric_pool.submit(
+                    self.ingest_metrics, metrics, entity_type, entity_id, client_id
+                )
+                for (entity_type, entity_id), metrics in metrics_by_entity.items()
+            ]
+
+            for key, ingest in levels:
+                rows = data.get(key, [])
+                chunks = [
+                    rows[start : start + self._chunk_size]
+                    for start in range(0, len(rows), self._chunk_size)
+                ]
+                ids = pool.map(lambda chunk: ingest(chunk, client_id), chunks)
+                counts[key] = sum(len(chunk_ids) for chunk_ids in ids)
+
+            counts["metrics"] = sum(future.result() for future in metric_futures)
+
+        return counts
 
     def ingest_user(self, user_data: dict[str, Any]) -> str:
         """Create or update a user node.
@@ -358,25 +768,6 @@ class DataIngester:
             User ID.
         """
         user_id = user_data.get("id") or str(uuid4())
-        now = datetime.utcnow().isoformat()
-
-        query = """
-        MERGE (u:User {id: $id})
-        ON CREATE SET
-            u.email = $email,
-            u.hashed_password = $hashed_password,
-            u.name = $name,
-            u.role = $role,
-            u.client_ids = $client_ids,
-            u.created_at = datetime($now),
-            u.updated_at = datetime($now)
-        ON MATCH SET
-            u.name = $name,
-            u.role = $role,
-            u.client_ids = $client_ids,
-            u.updated_at = datetime($now)
-        RETURN u.id AS id
-        """
 
         params = {
             "id": user_id,
@@ -385,9 +776,8 @@ class DataIngester:
             "name": user_data.get("name", ""),
             "role": user_data.get("role", "manager"),
             "client_ids": user_data.get("client_ids", []),
-            "now": now,
         }
 
-        result = self._client.execute_query(query, params)
+        self._client.execute_write(_USER_QUERY, params)
         logger.info(f"Ingested user: {user_data['email']} ({user_id})")
-        return result[0]["id"]
+        return user_id
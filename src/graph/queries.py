@@ -1,14 +1,60 @@
 """Cypher query templates for common operations."""
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+# Characters with meaning in Lucene query syntax, used by full-text search
+_LUCENE_SPECIAL = re.compile(r'[+\-&|!(){}\[\]^"~*?:\\/]')
+
+# Campaign metrics between $start_date and $end_date, one map per row as `m`.
+# Whole weeks inside the range come from the MetricWeekly rollups and only the
+# partial weeks at either end from daily Metric nodes, so each day is counted
+# once while far fewer nodes are read. The week bounds are the first Monday on
+# or after $start_date and the Monday after the last Sunday on or before
+# $end_date. OPTIONAL MATCH keeps campaigns that have no metrics. Rollups for
+# metrics ingested before rollups existed come from
+# Neo4jClient.build_weekly_rollups (scripts/backfill_weekly_rollups.py).
+_CAMPAIGN_METRICS = """
+    CALL {
+        WITH camp
+        OPTIONAL MATCH (w:MetricWeekly {entity_type: 'campaign', entity_id: camp.id})
+        USING INDEX w:MetricWeekly(entity_type, entity_id, week)
+        WHERE w.week >= date.truncate('week', $start_date + duration({days: 6}))
+            AND w.week < date.truncate('week', $end_date + duration({days: 1}))
+        RETURN {
+            impressions: w.impressions,
+            clicks: w.clicks,
+            conversions: w.conversions,
+            spend: w.spend,
+            revenue: w.revenue
+        } AS m
+        UNION ALL
+        WITH camp
+        OPTIONAL MATCH (d:Metric {entity_type: 'campaign', entity_id: camp.id})
+        USING INDEX d:Metric(entity_type, entity_id, date)
+        WHERE d.date >= $start_date AND d.date <= $end_date
+            AND (d.date < date.truncate('week', $start_date + duration({days: 6}))
+                OR d.date >= date.truncate('week', $end_date + duration({days: 1})))
+        RETURN {
+            impressions: d.impressions,
+            clicks: d.clicks,
+            conversions: d.conversions,
+            spend: d.spend,
+            revenue: d.revenue
+        } AS m
+    }
+"""
+
 
 @dataclass
 class CypherQueries:
     """Collection of Cypher query templates.
 
     All queries include client_id filtering for strict tenant isolation.
+    Date parameters are passed as ``datetime.date`` values, so the server
+    compares them against stored dates without parsing strings.
     """
 
     # Client Queries
@@ -38,10 +84,12 @@ class CypherQueries:
     ORDER BY camp.start_date DESC
     """
 
-    GET_CAMPAIGN_PERFORMANCE = """
+    GET_CAMPAIGN_PERFORMANCE = (
+        """
     MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign {id: $campaign_id})
-    OPTIONAL MATCH (m:Metric {entity_type: 'campaign', entity_id: camp.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    """
+        + _CAMPAIGN_METRICS
+        + """
     WITH camp, m
     RETURN camp,
         sum(m.impressions) AS total_impressions,
@@ -59,14 +107,40 @@ class CypherQueries:
             THEN sum(m.revenue) / sum(m.spend)
             ELSE null END AS roas
     """
+    )
 
     # Aggregate Performance Queries
     GET_CLIENT_SUMMARY = """
     MATCH (c:Client {id: $client_id})
     OPTIONAL MATCH (c)-[:OWNS]->(camp:Campaign)
-    OPTIONAL MATCH (m:Metric {client_id: $client_id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
-    WITH c, count(DISTINCT camp) AS campaign_count, m
+    WITH c, count(camp) AS campaign_count
+    CALL {
+        OPTIONAL MATCH (w:MetricWeekly {client_id: $client_id})
+        USING INDEX w:MetricWeekly(client_id, week)
+        WHERE w.week >= date.truncate('week', $start_date + duration({days: 6}))
+            AND w.week < date.truncate('week', $end_date + duration({days: 1}))
+        RETURN {
+            impressions: w.impressions,
+            clicks: w.clicks,
+            conversions: w.conversions,
+            spend: w.spend,
+            revenue: w.revenue
+        } AS m
+        UNION ALL
+        OPTIONAL MATCH (d:Metric {client_id: $client_id})
+        USING INDEX d:Metric(client_id, date)
+        WHERE d.date >= $start_date AND d.date <= $end_date
+            AND (d.date < date.truncate('week', $start_date + duration({days: 6}))
+                OR d.date >= date.truncate('week', $end_date + duration({days: 1})))
+        RETURN {
+            impressions: d.impressions,
+            clicks: d.clicks,
+            conversions: d.conversions,
+            spend: d.spend,
+            revenue: d.revenue
+        } AS m
+    }
+    WITH c, campaign_count, m
     RETURN c.name AS client_name,
         campaign_count,
         sum(m.impressions) AS total_impressions,
@@ -84,7 +158,7 @@ class CypherQueries:
 
     GET_DAILY_METRICS = """
     MATCH (m:Metric {client_id: $client_id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    WHERE m.date >= $start_date AND m.date <= $end_date
     RETURN m.date AS date,
         sum(m.impressions) AS impressions,
         sum(m.clicks) AS clicks,
@@ -94,11 +168,13 @@ class CypherQueries:
     ORDER BY date
     """
 
-    GET_CAMPAIGN_COMPARISON = """
+    GET_CAMPAIGN_COMPARISON = (
+        """
     MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)
     WHERE camp.status IN $statuses
-    OPTIONAL MATCH (m:Metric {entity_type: 'campaign', entity_id: camp.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    """
+        + _CAMPAIGN_METRICS
+        + """
     WITH camp, m
     RETURN camp.id AS campaign_id,
         camp.name AS campaign_name,
@@ -118,13 +194,16 @@ class CypherQueries:
             ELSE null END AS roas
     ORDER BY spend DESC
     """
+    )
 
     # Top/Bottom Performers
-    GET_TOP_CAMPAIGNS = """
+    GET_TOP_CAMPAIGNS = (
+        """
     MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)
     WHERE camp.status = 'active'
-    OPTIONAL MATCH (m:Metric {entity_type: 'campaign', entity_id: camp.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    """
+        + _CAMPAIGN_METRICS
+        + """
     WITH camp, sum(m.revenue) AS revenue, sum(m.spend) AS spend
     WHERE spend > 0 AND revenue IS NOT NULL
     RETURN camp.id AS campaign_id,
@@ -135,12 +214,15 @@ class CypherQueries:
     ORDER BY roas DESC
     LIMIT $limit
     """
+    )
 
-    GET_UNDERPERFORMING_CAMPAIGNS = """
+    GET_UNDERPERFORMING_CAMPAIGNS = (
+        """
     MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)
     WHERE camp.status = 'active'
-    OPTIONAL MATCH (m:Metric {entity_type: 'campaign', entity_id: camp.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    """
+        + _CAMPAIGN_METRICS
+        + """
     WITH camp, sum(m.revenue) AS revenue, sum(m.spend) AS spend, sum(m.conversions) AS conversions
     WHERE spend > $min_spend
     RETURN camp.id AS campaign_id,
@@ -154,12 +236,15 @@ class CypherQueries:
     ORDER BY roas ASC
     LIMIT $limit
     """
+    )
 
     # Channel Analysis
-    GET_CHANNEL_BREAKDOWN = """
+    GET_CHANNEL_BREAKDOWN = (
+        """
     MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)-[:RUNS_ON]->(ch:Channel)
-    OPTIONAL MATCH (m:Metric {entity_type: 'campaign', entity_id: camp.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    """
+        + _CAMPAIGN_METRICS
+        + """
     WITH ch.name AS channel, m
     RETURN channel,
         sum(m.impressions) AS impressions,
@@ -172,12 +257,14 @@ class CypherQueries:
             ELSE null END AS roas
     ORDER BY spend DESC
     """
+    )
 
     # Ad Set and Ad Queries
     GET_ADSETS_BY_CAMPAIGN = """
     MATCH (camp:Campaign {id: $campaign_id, client_id: $client_id})-[:CONTAINS]->(adset:AdSet)
     OPTIONAL MATCH (m:Metric {entity_type: 'adset', entity_id: adset.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    USING INDEX m:Metric(entity_type, entity_id, date)
+    WHERE m.date >= $start_date AND m.date <= $end_date
     WITH adset, m
     RETURN adset.id AS adset_id,
         adset.name AS adset_name,
@@ -192,7 +279,8 @@ class CypherQueries:
     GET_ADS_BY_ADSET = """
     MATCH (adset:AdSet {id: $adset_id, client_id: $client_id})-[:CONTAINS]->(ad:Ad)
     OPTIONAL MATCH (m:Metric {entity_type: 'ad', entity_id: ad.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+    USING INDEX m:Metric(entity_type, entity_id, date)
+    WHERE m.date >= $start_date AND m.date <= $end_date
     WITH ad, m
     RETURN ad.id AS ad_id,
         ad.name AS ad_name,
@@ -235,47 +323,92 @@ class CypherQueries:
     """
 
     # Search Queries (for RAG context retrieval)
+    # $search_term is Lucene query syntax; escape user input with escape_fulltext()
     SEARCH_CAMPAIGNS_BY_NAME = """
-    MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)
-    WHERE toLower(camp.name) CONTAINS toLower($search_term)
-    RETURN camp
+    CALL db.index.fulltext.queryNodes('entity_name_ft', $search_term) YIELD node, score
+    WHERE node:Campaign AND node.client_id = $client_id
+    RETURN node AS camp
+    ORDER BY score DESC
     LIMIT 10
     """
 
     SEARCH_ALL_ENTITIES = """
-    MATCH (c:Client {id: $client_id})
-    OPTIONAL MATCH (c)-[:OWNS]->(camp:Campaign)
-    WHERE toLower(camp.name) CONTAINS toLower($search_term)
-    OPTIONAL MATCH (camp)-[:CONTAINS]->(adset:AdSet)
-    WHERE toLower(adset.name) CONTAINS toLower($search_term)
-    OPTIONAL MATCH (adset)-[:CONTAINS]->(ad:Ad)
-    WHERE toLower(ad.name) CONTAINS toLower($search_term)
-        OR toLower(ad.headline) CONTAINS toLower($search_term)
-    RETURN collect(DISTINCT camp) AS campaigns,
-        collect(DISTINCT adset) AS adsets,
-        collect(DISTINCT ad) AS ads
+    CALL db.index.fulltext.queryNodes('entity_name_ft', $search_term) YIELD node, score
+    WHERE node.client_id = $client_id
+    WITH node ORDER BY score DESC
+    WITH collect(node) AS nodes
+    RETURN [n IN nodes WHERE n:Campaign] AS campaigns,
+        [n IN nodes WHERE n:AdSet] AS adsets,
+        [n IN nodes WHERE n:Ad] AS ads
     """
 
     # Graph Context for RAG
-    GET_CAMPAIGN_FULL_CONTEXT = """
+    GET_CAMPAIGN_FULL_CONTEXT = (
+        """
     MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign {id: $campaign_id})
-    OPTIONAL MATCH (camp)-[:RUNS_ON]->(ch:Channel)
-    OPTIONAL MATCH (camp)-[:CONTAINS]->(adset:AdSet)
-    OPTIONAL MATCH (adset)-[:CONTAINS]->(ad:Ad)
-    OPTIONAL MATCH (m:Metric {entity_type: 'campaign', entity_id: camp.id})
-    WHERE m.date >= date($start_date) AND m.date <= date($end_date)
-    RETURN camp,
-        ch.display_name AS channel_name,
-        collect(DISTINCT {id: adset.id, name: adset.name, status: adset.status}) AS adsets,
-        collect(DISTINCT {id: ad.id, name: ad.name, headline: ad.headline}) AS ads,
-        {
+    """
+        + _CAMPAIGN_METRICS
+        + """
+    WITH camp, {
             impressions: sum(m.impressions),
             clicks: sum(m.clicks),
             conversions: sum(m.conversions),
             spend: sum(m.spend),
             revenue: sum(m.revenue)
         } AS metrics
+    OPTIONAL MATCH (camp)-[:RUNS_ON]->(ch:Channel)
+    RETURN camp,
+        ch.display_name AS channel_name,
+        [(camp)-[:CONTAINS]->(adset:AdSet)
+            | {id: adset.id, name: adset.name, status: adset.status}] AS adsets,
+        [(camp)-[:CONTAINS]->(:AdSet)-[:CONTAINS]->(ad:Ad)
+            | {id: ad.id, name: ad.name, headline: ad.headline}] AS ads,
+        metrics
+    """
+    )
+
+
+def escape_fulltext(term: str) -> str:
+    """Escape Lucene query syntax so a search term matches literally.
+
+    The term is lowercased so AND/OR/NOT are not read as operators; the
+    full-text index is case-insensitive, so matches are unchanged.
+
+    Args:
+        term: Raw user search term.
+
+    Returns:
+        Term safe to pass to a full-text index query.
     """
+    return _LUCENE_SPECIAL.sub(r"\\\g<0>", term.lower())
+
+
+@lru_cache(maxsize=256)
+def _dynamic_query_text(
+    base_query: str,
+    filter_keys: tuple[str, ...],
+    order_by: str | None,
+    limit: int | None,
+) -> str:
+    """Build the query text for a dynamic query shape.
+
+    Args:
+        base_query: Base Cypher query template.
+        filter_keys: Filtered properties, sorted.
+        order_by: Optional ORDER BY clause.
+        limit: Optional result limit.
+
+    Returns:
+        Query string.
+    """
+    query = base_query
+    if filter_keys:
+        query += " WHERE " + " AND ".join(f"n.{key} = $filter_{key}" for key in filter_keys)
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    if limit:
+        query += f" LIMIT {limit}"
+    return query
 
 
 def build_dynamic_query(
@@ -286,6 +419,9 @@ def build_dynamic_query(
 ) -> tuple[str, dict[str, Any]]:
     """Build a dynamic Cypher query with optional filters.
 
+    Filters are applied in key order, so the same filter set always yields
+    the same query text and the server's plan cache is hit.
+
     Args:
         base_query: Base Cypher query template.
         filters: Dictionary of filter conditions.
@@ -295,21 +431,7 @@ def build_dynamic_query(
     Returns:
         Tuple of (query_string, parameters).
     """
-    params = {}
-    where_clauses = []
-
-    for key, value in filters.items():
-        if value is not None:
-            param_name = f"filter_{key}"
-            where_clauses.append(f"n.{key} = ${param_name}")
-            params[param_name] = value
-
-    query = base_query
-    if where_clauses:
-        query += f" WHERE {' AND '.join(where_clauses)}"
-    if order_by:
-        query += f" ORDER BY {order_by}"
-    if limit:
-        query += f" LIMIT {limit}"
+    filter_keys = tuple(sorted(key for key, value in filters.items() if value is not None))
+    params = {f"filter_{key}": filters[key] for key in filter_keys}
 
-    return query, params
+    return _dynamic_query_text(base_query, filter_keys, order_by, limit), params
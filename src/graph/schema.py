@@ -1,11 +1,28 @@
 """Neo4j graph schema definitions and initialization."""
 
-from dataclasses import dataclass
-from enum import Enum
+import logging
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
+from neo4j import Session
 
-class NodeLabel(str, Enum):
+logger = logging.getLogger(__name__)
+
+_SCHEMA_OBJECT_NAME = re.compile(r"\b(?:CONSTRAINT|INDEX)\s+(\w+)")
+
+
+def _run_statements(tx, statements: list[str]) -> None:
+    """Queue statements in a managed transaction; results drain at commit."""
+    for statement in statements:
+        tx.run(statement)
+
+
+class NodeLabel(StrEnum):
     """Node labels in the graph."""
 
     CLIENT = "Client"
@@ -14,11 +31,12 @@ class NodeLabel(str, Enum):
     AD = "Ad"
     CHANNEL = "Channel"
     METRIC = "Metric"
+    METRIC_WEEKLY = "MetricWeekly"
     USER = "User"
     AUDIT_LOG = "AuditLog"
 
 
-class RelationType(str, Enum):
+class RelationType(StrEnum):
     """Relationship types in the graph."""
 
     OWNS = "OWNS"  # Client -> Campaign
@@ -29,7 +47,7 @@ class RelationType(str, Enum):
     QUERIED = "QUERIED"  # User -> AuditLog
 
 
-class CampaignStatus(str, Enum):
+class CampaignStatus(StrEnum):
     """Campaign status values."""
 
     ACTIVE = "active"
@@ -38,7 +56,7 @@ class CampaignStatus(str, Enum):
     DRAFT = "draft"
 
 
-class CampaignObjective(str, Enum):
+class CampaignObjective(StrEnum):
     """Campaign objective types."""
 
     AWARENESS = "awareness"
@@ -49,7 +67,16 @@ class CampaignObjective(str, Enum):
     SALES = "sales"
 
 
-@dataclass
+# Display name per advertising channel; Channel nodes are keyed by name
+CHANNEL_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType(
+    {
+        "google_ads": "Google Ads",
+        "meta": "Meta (Facebook/Instagram)",
+    }
+)
+
+
+@dataclass(slots=True)
 class GraphSchema:
     """Neo4j schema management."""
 
@@ -59,6 +86,12 @@ class GraphSchema:
     # Indexes for query performance
     INDEXES: list[str] = None
 
+    # Full-text indexes for entity search
+    FULLTEXT_INDEXES: list[str] = None
+
+    # Set once the database is known to hold every schema object
+    _indices_verified: bool = field(default=False, init=False, repr=False)
+
     def __post_init__(self):
         self.CONSTRAINTS = [
             # Uniqueness constraints
@@ -82,6 +115,8 @@ class GraphSchema:
             "CREATE INDEX campaign_status IF NOT EXISTS FOR (c:Campaign) ON (c.status)",
             "CREATE INDEX campaign_objective IF NOT EXISTS FOR (c:Campaign) ON (c.objective)",
             "CREATE INDEX campaign_dates IF NOT EXISTS FOR (c:Campaign) ON (c.start_date, c.end_date)",
+            "CREATE INDEX campaign_client_status IF NOT EXISTS FOR (c:Campaign) "
+            "ON (c.client_id, c.status)",
             # AdSet indexes
             "CREATE INDEX adset_client IF NOT EXISTS FOR (a:AdSet) ON (a.client_id)",
             "CREATE INDEX adset_campaign IF NOT EXISTS FOR (a:AdSet) ON (a.campaign_id)",
@@ -91,119 +126,224 @@ class GraphSchema:
             # Metric indexes (optimized for query speed)
             "CREATE INDEX metric_client IF NOT EXISTS FOR (m:Metric) ON (m.client_id)",
             "CREATE INDEX metric_date IF NOT EXISTS FOR (m:Metric) ON (m.date)",
+            "CREATE INDEX metric_client_date IF NOT EXISTS FOR (m:Metric) ON (m.client_id, m.date)",
             "CREATE INDEX metric_entity IF NOT EXISTS FOR (m:Metric) ON (m.entity_type, m.entity_id)",
+            "CREATE INDEX metric_etype_eid_date IF NOT EXISTS FOR (m:Metric) "
+            "ON (m.entity_type, m.entity_id, m.date)",
+            "CREATE INDEX metric_client_entity IF NOT EXISTS FOR (m:Metric) "
+            "ON (m.client_id, m.entity_type, m.entity_id)",
+            # Weekly metric rollups, maintained at ingest
+            "CREATE INDEX metric_weekly_entity IF NOT EXISTS FOR (w:MetricWeekly) "
+            "ON (w.entity_type, w.entity_id, w.week)",
+            "CREATE INDEX metric_weekly_client IF NOT EXISTS FOR (w:MetricWeekly) "
+            "ON (w.client_id, w.week)",
             # Audit log indexes
             "CREATE INDEX audit_user IF NOT EXISTS FOR (a:AuditLog) ON (a.user_id)",
             "CREATE INDEX audit_client IF NOT EXISTS FOR (a:AuditLog) ON (a.client_id)",
             "CREATE INDEX audit_timestamp IF NOT EXISTS FOR (a:AuditLog) ON (a.timestamp)",
+            "CREATE INDEX audit_client_ts IF NOT EXISTS FOR (a:AuditLog) "
+            "ON (a.client_id, a.timestamp)",
             # User indexes
             "CREATE INDEX user_role IF NOT EXISTS FOR (u:User) ON (u.role)",
         ]
 
+        self.FULLTEXT_INDEXES = [
+            "CREATE FULLTEXT INDEX entity_name_ft IF NOT EXISTS "
+            "FOR (n:Campaign|AdSet|Ad) ON EACH [n.name, n.headline]",
+        ]
+
+    @property
+    def is_verified(self) -> bool:
+        """Whether the database is known to hold every schema object."""
+        return self._indices_verified
+
     def get_all_statements(self) -> list[str]:
         """Get all schema creation statements."""
-        return self.CONSTRAINTS + self.INDEXES
-
-
-# Node property definitions for reference
-NODE_PROPERTIES: dict[str, dict[str, Any]] = {
-    NodeLabel.CLIENT: {
-        "id": "string (UUID)",
-        "name": "string",
-        "industry": "string",
-        "contract_start": "date",
-        "contract_end": "date (optional)",
-        "budget": "float",
-        "budget_currency": "string (ISO 4217)",
-        "status": "string (active/inactive)",
-        "data_retention_days": "integer",
-        "created_at": "datetime",
-        "updated_at": "datetime",
-    },
-    NodeLabel.CAMPAIGN: {
-        "id": "string (UUID)",
-        "client_id": "string (UUID, for isolation)",
-        "external_id": "string (platform ID)",
-        "name": "string",
-        "objective": "string (CampaignObjective)",
-        "start_date": "date",
-        "end_date": "date (optional)",
-        "budget": "float",
-        "budget_currency": "string (ISO 4217)",
-        "daily_budget": "float (optional)",
-        "status": "string (CampaignStatus)",
-        "channel": "string (google_ads/meta)",
-        "created_at": "datetime",
-        "updated_at": "datetime",
-    },
-    NodeLabel.AD_SET: {
-        "id": "string (UUID)",
-        "client_id": "string (UUID, for isolation)",
-        "campaign_id": "string (UUID)",
-        "external_id": "string (platform ID)",
-        "name": "string",
-        "targeting": "string (JSON)",
-        "budget": "float",
-        "budget_currency": "string (ISO 4217)",
-        "status": "string",
-        "created_at": "datetime",
-        "updated_at": "datetime",
-    },
-    NodeLabel.AD: {
-        "id": "string (UUID)",
-        "client_id": "string (UUID, for isolation)",
-        "adset_id": "string (UUID)",
-        "external_id": "string (platform ID)",
-        "name": "string",
-        "headline": "string",
-        "description": "string",
-        "creative_type": "string (image/video/carousel)",
-        "status": "string",
-        "created_at": "datetime",
-        "updated_at": "datetime",
-    },
-    NodeLabel.CHANNEL: {
-        "name": "string (google_ads/meta)",
-        "display_name": "string",
-    },
-    NodeLabel.METRIC: {
-        "id": "string (UUID)",
-        "client_id": "string (UUID, for isolation)",
-        "entity_type": "string (campaign/adset/ad)",
-        "entity_id": "string (UUID)",
-        "date": "date",
-        "impressions": "integer",
-        "clicks": "integer",
-        "conversions": "integer",
-        "spend": "float",
-        "spend_currency": "string (ISO 4217)",
-        "revenue": "float (optional)",
-        "revenue_currency": "string (ISO 4217, optional)",
-        "ctr": "float (calculated)",
-        "cpc": "float (calculated)",
-        "cpm": "float (calculated)",
-        "roas": "float (calculated, optional)",
-        "created_at": "datetime",
-    },
-    NodeLabel.USER: {
-        "id": "string (UUID)",
-        "email": "string",
-        "hashed_password": "string",
-        "name": "string",
-        "role": "string (admin/analyst/manager/executive)",
-        "client_ids": "list[string] (accessible clients)",
-        "created_at": "datetime",
-        "updated_at": "datetime",
-    },
-    NodeLabel.AUDIT_LOG: {
-        "id": "string (UUID)",
-        "user_id": "string (UUID)",
-        "client_id": "string (UUID)",
-        "query_text": "string",
-        "response_text": "string (truncated)",
-        "confidence_score": "float",
-        "response_time_ms": "integer",
-        "timestamp": "datetime",
-        "session_id": "string (optional)",
-    },
-}
+        return self.CONSTRAINTS + self.INDEXES + self.FULLTEXT_INDEXES
+
+    @staticmethod
+    def object_name(statement: str) -> str:
+        """Get the constraint or index name from a CREATE statement.
+
+        Args:
+            statement: CREATE CONSTRAINT/INDEX statement.
+
+        Returns:
+            Name of the schema object the statement creates.
+        """
+        return _SCHEMA_OBJECT_NAME.search(statement).group(1)
+
+    def expected_constraint_names(self) -> set[str]:
+        """Get the names of all constraints the schema defines."""
+        return {self.object_name(s) for s in self.CONSTRAINTS}
+
+    def expected_index_names(self) -> set[str]:
+        """Get the names of all indexes, including full-text, the schema defines."""
+        return {self.object_name(s) for s in self.INDEXES + self.FULLTEXT_INDEXES}
+
+    def missing_statements(self, existing_names: set[str]) -> list[str]:
+        """Get the creation statements for schema objects not in the database.
+
+        Args:
+            existing_names: Names reported by SHOW INDEXES and SHOW CONSTRAINTS.
+
+        Returns:
+            Statements whose object name is not in existing_names, in order.
+        """
+        return [s for s in self.get_all_statements() if self.object_name(s) not in existing_names]
+
+    def apply(self, session: Session) -> int:
+        """Create the schema objects missing from the database.
+
+        Existing names are read with SHOW INDEXES and SHOW CONSTRAINTS, and
+        the missing statements run together in one write transaction. If
+        that fails they are retried one by one.
+
+        Args:
+            session: Open Neo4j session.
+
+        Returns:
+            Number of statements that were missing.
+        """
+        existing = {record["name"] for record in session.run("SHOW INDEXES YIELD name")}
+        existing |= {record["name"] for record in session.run("SHOW CONSTRAINTS YIELD name")}
+        missing = self.missing_statements(existing)
+
+        if not missing:
+            self._indices_verified = True
+            return 0
+
+        try:
+            session.execute_write(_run_statements, missing)
+            self._indices_verified = True
+            logger.debug(f"Created {len(missing)} schema objects")
+        except Exception as e:
+            logger.warning(f"Schema batch failed, applying statements one by one: {e}")
+            for statement in missing:
+                try:
+                    session.run(statement)
+                    logger.debug(f"Executed: {statement}")
+                except Exception as e:
+                    logger.warning(f"Schema statement failed (may already exist): {e}")
+        return len(missing)
+
+
+@cache
+def get_node_properties() -> Mapping[str, Mapping[str, str]]:
+    """Get the read-only node property definitions, built on first use.
+
+    The definitions are reference documentation only, so they are not
+    materialized at import.
+
+    Returns:
+        Property descriptions keyed by node label, then property name.
+    """
+    properties = {
+        NodeLabel.CLIENT: {
+            "id": "string (UUID)",
+            "name": "string",
+            "industry": "string",
+            "contract_start": "date",
+            "contract_end": "date (optional)",
+            "budget": "float",
+            "budget_currency": "string (ISO 4217)",
+            "status": "string (active/inactive)",
+            "data_retention_days": "integer",
+            "created_at": "datetime",
+            "updated_at": "datetime",
+        },
+        NodeLabel.CAMPAIGN: {
+            "id": "string (UUID)",
+            "client_id": "string (UUID, for isolation)",
+            "external_id": "string (platform ID)",
+            "name": "string",
+            "objective": "string (CampaignObjective)",
+            "start_date": "date",
+            "end_date": "date (optional)",
+            "budget": "float",
+            "budget_currency": "string (ISO 4217)",
+            "daily_budget": "float (optional)",
+            "status": "string (CampaignStatus)",
+            "channel": "string (google_ads/meta)",
+            "created_at": "datetime",
+            "updated_at": "datetime",
+        },
+        NodeLabel.AD_SET: {
+            "id": "string (UUID)",
+            "client_id": "string (UUID, for isolation)",
+            "campaign_id": "string (UUID)",
+            "external_id": "string (platform ID)",
+            "name": "string",
+            "targeting": "string (JSON)",
+            "budget": "float",
+            "budget_currency": "string (ISO 4217)",
+            "status": "string",
+            "created_at": "datetime",
+            "updated_at": "datetime",
+        },
+        NodeLabel.AD: {
+            "id": "string (UUID)",
+            "client_id": "string (UUID, for isolation)",
+            "adset_id": "string (UUID)",
+            "external_id": "string (platform ID)",
+            "name": "string",
+            "headline": "string",
+            "description": "string",
+            "creative_type": "string (image/video/carousel)",
+            "status": "string",
+            "created_at": "datetime",
+            "updated_at": "datetime",
+        },
+        NodeLabel.CHANNEL: {
+            "name": "string (google_ads/meta)",
+            "display_name": "string",
+        },
+        NodeLabel.METRIC: {
+            "id": "string (UUID)",
+            "client_id": "string (UUID, for isolation)",
+            "entity_type": "string (campaign/adset/ad)",
+            "entity_id": "string (UUID)",
+            "date": "date",
+            "impressions": "integer",
+            "clicks": "integer",
+            "conversions": "integer",
+            "spend": "float",
+            "spend_currency": "string (ISO 4217)",
+            "revenue": "float (optional)",
+            "revenue_currency": "string (ISO 4217, optional)",
+            "ctr": "float (calculated)",
+            "cpc": "float (calculated)",
+            "cpm": "float (calculated)",
+            "roas": "float (calculated, optional)",
+            "created_at": "datetime",
+        },
+        NodeLabel.USER: {
+            "id": "string (UUID)",
+            "email": "string",
+            "hashed_password": "string",
+            "name": "string",
+            "role": "string (admin/analyst/manager/executive)",
+            "client_ids": "list[string] (accessible clients)",
+            "created_at": "datetime",
+            "updated_at": "datetime",
+        },
+        NodeLabel.AUDIT_LOG: {
+            "id": "string (UUID)",
+            "user_id": "string (UUID)",
+            "client_id": "string (UUID)",
+            "query_text": "string",
+            "response_text": "string (truncated)",
+            "confidence_score": "float",
+            "response_time_ms": "integer",
+            "timestamp": "datetime",
+            "session_id": "string (optional)",
+        },
+    }
+    return MappingProxyType({label: MappingProxyType(props) for label, props in properties.items()})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve NODE_PROPERTIES lazily for existing importers."""
+    if name == "NODE_PROPERTIES":
+        return get_node_properties()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,11 @@
 """GraphRAG engine components."""
 
-from .confidence import ConfidenceLevel, ConfidenceScore, ConfidenceScorer
+from .confidence import (
+    ConfidenceLevel,
+    ConfidenceScore,
+    ConfidenceScorer,
+    get_confidence_scorer,
+)
 from .engine import GraphRAGEngine, QueryResult, Source, get_graphrag_engine
 from .retrieval import HybridRetriever, RetrievalContext
 
@@ -13,5 +18,6 @@ __all__ = [
     "QueryResult",
     "RetrievalContext",
     "Source",
+    "get_confidence_scorer",
     "get_graphrag_engine",
 ]
@@ -1,8 +1,12 @@
 """Confidence scoring for RAG answers."""
 
+import bisect
 import logging
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 from config.settings import Settings, get_settings
@@ -10,7 +14,7 @@ from config.settings import Settings, get_settings
 logger = logging.getLogger(__name__)
 
 
-class ConfidenceLevel(str, Enum):
+class ConfidenceLevel(StrEnum):
     """Confidence level categories."""
 
     HIGH = "high"
@@ -19,7 +23,135 @@ class ConfidenceLevel(str, Enum):
     INSUFFICIENT = "insufficient"
 
 
-@dataclass
+# Expected fields for different entity types
+_EXPECTED_FIELDS: dict[str, frozenset[str]] = {
+    "campaign": frozenset({"name", "status", "budget", "objective"}),
+    "metric": frozenset({"impressions", "clicks", "spend", "date"}),
+    "client": frozenset({"name", "industry", "budget"}),
+}
+
+# Date fields checked for recency, as ISO strings
+_DATE_KEYS = ("date", "created_at", "updated_at", "start_date")
+
+# Filler words ignored when matching query terms against context
+_QUERY_STOPWORDS = frozenset({"what", "show", "give", "tell"})
+
+# Entity types counted towards source diversity
+_SOURCE_TYPES = frozenset({"campaign", "adset", "ad", "metric"})
+
+_FACTOR_NAMES = (
+    "data_quantity",
+    "data_recency",
+    "query_match",
+    "data_completeness",
+    "source_diversity",
+)
+
+# Minimum overall score for the fixed levels; LOW starts at the configured threshold
+_LEVEL_CUTOFFS = ((0.6, ConfidenceLevel.MEDIUM), (0.8, ConfidenceLevel.HIGH))
+
+_EXPLANATIONS: dict[ConfidenceLevel, str] = {
+    ConfidenceLevel.HIGH: "High confidence based on comprehensive data coverage.",
+    ConfidenceLevel.MEDIUM: "Medium confidence. Some data points may be missing.",
+    ConfidenceLevel.LOW: "Low confidence. Limited data available for this query.",
+    ConfidenceLevel.INSUFFICIENT: "Insufficient data to provide a reliable answer.",
+}
+
+_LEVEL_INDICATORS: dict[ConfidenceLevel, str] = {
+    ConfidenceLevel.HIGH: "High",
+    ConfidenceLevel.MEDIUM: "Medium",
+    ConfidenceLevel.LOW: "Low",
+    ConfidenceLevel.INSUFFICIENT: "Insufficient",
+}
+
+
+def _entity_type(item: dict[str, Any]) -> str | None:
+    """Classify a context item from its type fields or signature keys.
+
+    Metric nodes carry the entity_type of the entity they measure, so the
+    metric signature is checked first.
+
+    Args:
+        item: Context item.
+
+    Returns:
+        Lowercase entity type, or None if it cannot be determined.
+    """
+    if "impressions" in item:
+        return "metric"
+    etype = item.get("entity_type") or item.get("label")
+    if etype:
+        return str(etype).lower()
+    if "objective" in item:
+        return "campaign"
+    if "adset_id" in item:
+        return "adset"
+    return None
+
+
+def _context_fingerprint(context: list[dict[str, Any]]) -> int:
+    """Hash the context by entity id and version instead of its full contents.
+
+    Items without an id fall back to their repr.
+
+    Args:
+        context: Retrieved context.
+
+    Returns:
+        Order-independent fingerprint of the context.
+    """
+    keys = []
+    for item in context:
+        if isinstance(item, dict) and item.get("id"):
+            keys.append((str(item["id"]), str(item.get("updated_at", ""))))
+        else:
+            keys.append(("", repr(item)))
+    return hash(tuple(sorted(keys)))
+
+
+def _searchable_text(context: list[dict[str, Any]]) -> str:
+    """Lowercase the keys and values of the context for term search.
+
+    Every value is stringified, numbers included, so a term matches exactly
+    when it occurs in ``str(context)``.
+
+    Args:
+        context: Retrieved context.
+
+    Returns:
+        Newline-separated text to search.
+    """
+    parts = []
+    for item in context:
+        if not isinstance(item, dict):
+            parts.append(str(item))
+            continue
+        for key, value in item.items():
+            parts.append(str(key))
+            parts.append(str(value))
+    return "\n".join(parts).lower()
+
+
+def _matched_terms(terms: set[str], text: str) -> set[str]:
+    """Find which terms occur in text with a single regex pass.
+
+    The lookahead reports the longest term starting at every position;
+    shorter terms that are prefixes of a match are then added back, so the
+    result equals checking each term with ``in``.
+
+    Args:
+        terms: Lowercase search terms.
+        text: Lowercase text to search.
+
+    Returns:
+        Subset of terms found in text.
+    """
+    alternation = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    found = set(re.findall(f"(?=({alternation}))", text))
+    return found | {t for t in terms - found if any(t in f for f in found)}
+
+
+@dataclass(slots=True, frozen=True)
 class ConfidenceScore:
     """Confidence score with breakdown."""
 
@@ -41,6 +173,42 @@ class ConfidenceScorer:
         """
         self._settings = settings or get_settings()
         self._threshold = self._settings.CONFIDENCE_THRESHOLD
+        self._level_thresholds, self._levels = self._level_table(self._threshold)
+        self._cache_size = self._settings.CONFIDENCE_CACHE_SIZE
+        self._cache: OrderedDict[tuple, ConfidenceScore] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _level_table(
+        threshold: float,
+    ) -> tuple[tuple[float, ...], tuple[ConfidenceLevel, ...]]:
+        """Build the sorted cutoffs for mapping an overall score to a level.
+
+        A level whose cutoff is not below every higher level's cutoff can
+        never be reached, so it is left out to keep the cutoffs sorted.
+
+        Args:
+            threshold: Minimum score for a LOW (answerable) result.
+
+        Returns:
+            Ascending cutoffs and the levels, where levels[i] applies to scores
+            with exactly i cutoffs at or below them.
+        """
+        cutoffs = ((threshold, ConfidenceLevel.LOW), *_LEVEL_CUTOFFS)
+        reachable = [
+            (cutoff, level)
+            for i, (cutoff, level) in enumerate(cutoffs)
+            if all(cutoff < higher for higher, _ in cutoffs[i + 1 :])
+        ]
+        return (
+            tuple(cutoff for cutoff, _ in reachable),
+            (ConfidenceLevel.INSUFFICIENT, *(level for _, level in reachable)),
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached scores, e.g. after settings are reloaded."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def score(
         self,
@@ -50,6 +218,56 @@ class ConfidenceScorer:
     ) -> ConfidenceScore:
         """Calculate confidence score for a query with given context.
 
+        Scores are cached by query, context fingerprint and date range, so a
+        repeated question over the same entities skips the factor scoring.
+
+        Args:
+            query: User's query.
+            context: Retrieved context documents/nodes.
+            date_range: Optional date range for the query.
+
+        Returns:
+            ConfidenceScore with overall score and factors.
+        """
+        if not context:
+            # Every factor scores zero without context
+            level = ConfidenceLevel.INSUFFICIENT
+            factors = dict.fromkeys(_FACTOR_NAMES, 0.0)
+            missing_data = ["No context retrieved"]
+            return ConfidenceScore(
+                overall=0.0,
+                level=level,
+                factors=factors,
+                explanation=self._generate_explanation(level, factors, missing_data),
+                missing_data=missing_data,
+            )
+
+        if self._cache_size <= 0:
+            return self._compute_score(query, context, date_range)
+
+        key = (query, _context_fingerprint(context), tuple(date_range or ()))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                logger.debug(f"Confidence score cache hit for query: {query[:50]}...")
+                return cached
+
+        score = self._compute_score(query, context, date_range)
+        with self._cache_lock:
+            self._cache[key] = score
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return score
+
+    def _compute_score(
+        self,
+        query: str,
+        context: list[dict[str, Any]],
+        date_range: tuple[str, str] | None,
+    ) -> ConfidenceScore:
+        """Calculate the confidence factors and level without the cache.
+
         Args:
             query: User's query.
             context: Retrieved context documents/nodes.
@@ -58,56 +276,57 @@ class ConfidenceScorer:
         Returns:
             ConfidenceScore with overall score and factors.
         """
-        factors = {}
         missing_data = []
 
         # Factor 1: Data quantity (0-0.3)
         quantity_score = self._score_data_quantity(context)
-        factors["data_quantity"] = quantity_score
         if quantity_score < 0.15:
             missing_data.append("Limited data points available")
 
         # Factor 2: Data recency (0-0.2)
         recency_score = self._score_data_recency(context, date_range)
-        factors["data_recency"] = recency_score
         if recency_score < 0.1:
             missing_data.append("Data may be outdated or missing recent metrics")
 
         # Factor 3: Query specificity match (0-0.2)
         specificity_score = self._score_query_specificity(query, context)
-        factors["query_match"] = specificity_score
         if specificity_score < 0.1:
             missing_data.append("Query terms not well matched in available data")
 
         # Factor 4: Data completeness (0-0.2)
         completeness_score = self._score_data_completeness(context)
-        factors["data_completeness"] = completeness_score
         if completeness_score < 0.1:
             missing_data.append("Some expected fields are missing")
 
         # Factor 5: Source diversity (0-0.1)
         diversity_score = self._score_source_diversity(context)
-        factors["source_diversity"] = diversity_score
 
         # Calculate overall score
-        overall = sum(factors.values())
+        overall = (
+            quantity_score
+            + recency_score
+            + specificity_score
+            + completeness_score
+            + diversity_score
+        )
+        factors = {
+            "data_quantity": quantity_score,
+            "data_recency": recency_score,
+            "query_match": specificity_score,
+            "data_completeness": completeness_score,
+            "source_diversity": diversity_score,
+        }
 
         # Determine confidence level
-        if overall >= 0.8:
-            level = ConfidenceLevel.HIGH
-        elif overall >= 0.6:
-            level = ConfidenceLevel.MEDIUM
-        elif overall >= self._threshold:
-            level = ConfidenceLevel.LOW
-        else:
-            level = ConfidenceLevel.INSUFFICIENT
+        level = self._levels[bisect.bisect_right(self._level_thresholds, overall)]
 
         # Generate explanation
         explanation = self._generate_explanation(level, factors, missing_data)
 
-        logger.info(
-            f"Confidence score: {overall:.2f} ({level.value}) for query: {query[:50]}..."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Confidence score: {overall:.2f} ({level.value}) for query: {query[:50]}..."
+            )
 
         return ConfidenceScore(
             overall=overall,
@@ -161,22 +380,28 @@ class ConfidenceScorer:
         if not context:
             return 0.0
 
-        # Look for date fields in context
-        dates_found = []
+        # Track the earliest and latest date fields in context
+        earliest = latest = None
         for item in context:
-            if isinstance(item, dict):
-                for key in ["date", "created_at", "updated_at", "start_date"]:
-                    if key in item and item[key]:
-                        dates_found.append(str(item[key]))
-
-        if not dates_found:
+            if not isinstance(item, dict):
+                continue
+            for key in _DATE_KEYS:
+                value = item.get(key)
+                if value:
+                    value = str(value)
+                    if earliest is None or value < earliest:
+                        earliest = value
+                    if latest is None or value > latest:
+                        latest = value
+
+        if earliest is None:
             return 0.1  # Partial score if no dates but has data
 
         # If we have a date range, check coverage
         if date_range:
             start, end = date_range
-            has_start = any(start <= d for d in dates_found)
-            has_end = any(d <= end for d in dates_found)
+            has_start = latest >= start
+            has_end = earliest <= end
             if has_start and has_end:
                 return 0.2
             elif has_start or has_end:
@@ -204,17 +429,16 @@ class ConfidenceScorer:
         query_terms = set(
             word.lower()
             for word in query.split()
-            if len(word) > 3 and word.lower() not in {"what", "show", "give", "tell"}
+            if len(word) > 3 and word.lower() not in _QUERY_STOPWORDS
         )
 
         if not query_terms:
             return 0.1
 
         # Check context for matching terms
-        context_text = str(context).lower()
-        matches = sum(1 for term in query_terms if term in context_text)
+        matches = len(_matched_terms(query_terms, _searchable_text(context)))
 
-        match_ratio = matches / len(query_terms) if query_terms else 0
+        match_ratio = matches / len(query_terms)
         return min(0.2, match_ratio * 0.25)
 
     def _score_data_completeness(self, context: list[dict[str, Any]]) -> float:
@@ -229,31 +453,17 @@ class ConfidenceScorer:
         if not context:
             return 0.0
 
-        # Expected fields for different entity types
-        expected_fields = {
-            "campaign": {"name", "status", "budget", "objective"},
-            "metric": {"impressions", "clicks", "spend", "date"},
-            "client": {"name", "industry", "budget"},
-        }
-
         completeness_scores = []
 
         for item in context:
             if not isinstance(item, dict):
                 continue
 
-            # Determine entity type
-            item_type = item.get("entity_type", "")
-            if "campaign" in str(item).lower():
-                expected = expected_fields.get("campaign", set())
-            elif "metric" in str(item).lower() or "impressions" in item:
-                expected = expected_fields.get("metric", set())
-            else:
-                expected = expected_fields.get("client", set())
+            etype = _entity_type(item)
+            expected = _EXPECTED_FIELDS.get(etype, _EXPECTED_FIELDS["client"])
 
-            if expected:
-                present = sum(1 for f in expected if f in item and item[f] is not None)
-                completeness_scores.append(present / len(expected))
+            present = sum(1 for f in expected if item.get(f) is not None)
+            completeness_scores.append(present / len(expected))
 
         if not completeness_scores:
             return 0.1
@@ -274,17 +484,10 @@ class ConfidenceScorer:
             return 0.0
 
         # Look for different entity types
-        entity_types = set()
-        for item in context:
-            if isinstance(item, dict):
-                if "campaign" in str(item).lower():
-                    entity_types.add("campaign")
-                if "adset" in str(item).lower() or "ad_set" in str(item).lower():
-                    entity_types.add("adset")
-                if "metric" in str(item).lower() or "impressions" in item:
-                    entity_types.add("metric")
-
-        diversity_ratio = len(entity_types) / 4  # Max expected types
+        entity_types = {_entity_type(item) for item in context if isinstance(item, dict)}
+        entity_types &= _SOURCE_TYPES
+
+        diversity_ratio = len(entity_types) / len(_SOURCE_TYPES)
         return min(0.1, diversity_ratio * 0.1)
 
     def _generate_explanation(
@@ -303,14 +506,7 @@ class ConfidenceScorer:
         Returns:
             Explanation string.
         """
-        explanations = {
-            ConfidenceLevel.HIGH: "High confidence based on comprehensive data coverage.",
-            ConfidenceLevel.MEDIUM: "Medium confidence. Some data points may be missing.",
-            ConfidenceLevel.LOW: "Low confidence. Limited data available for this query.",
-            ConfidenceLevel.INSUFFICIENT: "Insufficient data to provide a reliable answer.",
-        }
-
-        explanation = explanations[level]
+        explanation = _EXPLANATIONS[level]
 
         if missing_data:
             explanation += " Missing: " + "; ".join(missing_data[:2])
@@ -337,15 +533,19 @@ class ConfidenceScorer:
         Returns:
             Formatted string.
         """
-        level_indicators = {
-            ConfidenceLevel.HIGH: "High",
-            ConfidenceLevel.MEDIUM: "Medium",
-            ConfidenceLevel.LOW: "Low",
-            ConfidenceLevel.INSUFFICIENT: "Insufficient",
-        }
-
-        result = f"**Confidence**: {level_indicators[score.level]}"
+        result = f"**Confidence**: {_LEVEL_INDICATORS[score.level]}"
         if score.missing_data:
             result += f" ({score.explanation})"
 
         return result
+
+
+_scorer: ConfidenceScorer | None = None
+
+
+def get_confidence_scorer() -> ConfidenceScorer:
+    """Get the confidence scorer singleton."""
+    global _scorer
+    if _scorer is None:
+        _scorer = ConfidenceScorer()
+    return _scorer
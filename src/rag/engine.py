@@ -1,17 +1,23 @@
 """GraphRAG engine combining graph retrieval with Claude LLM."""
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from config.settings import Settings, get_settings
 from src.graph.client import Neo4jClient, get_neo4j_client
 
-from .confidence import ConfidenceScore, ConfidenceScorer
+from .confidence import ConfidenceScore, ConfidenceScorer, get_confidence_scorer
 from .prompts import (
     FOLLOW_UP_PROMPT,
     LOW_CONFIDENCE_PROMPT,
@@ -20,8 +26,67 @@ from .prompts import (
 )
 from .retrieval import HybridRetriever, RetrievalContext
 
+if TYPE_CHECKING:
+    from src.api.models import QueryRequest
+
 logger = logging.getLogger(__name__)
 
+# Words that suggest a query builds on the previous turn
+_FOLLOW_UP_INDICATORS = (
+    "more",
+    "detail",
+    "explain",
+    "why",
+    "how",
+    "what about",
+    "and",
+    "also",
+    "that",
+    "this",
+    "these",
+    "those",
+    "it",
+    "they",
+    "them",
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# Static system prompt, marked for Anthropic prompt caching
+_SYSTEM_BLOCKS = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+_FOLLOW_UP_PATTERN = re.compile(
+    rf"\b(?:{'|'.join(_FOLLOW_UP_INDICATORS)})\b", re.IGNORECASE
+)
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Check whether text has a regex word character at index."""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == "_")
+
+
+try:
+    import ahocorasick
+
+    _FOLLOW_UP_AUTOMATON = ahocorasick.Automaton()
+    for _indicator in _FOLLOW_UP_INDICATORS:
+        _FOLLOW_UP_AUTOMATON.add_word(_indicator, len(_indicator))
+    _FOLLOW_UP_AUTOMATON.make_automaton()
+
+    def _has_follow_up_indicator(query: str) -> bool:
+        # One automaton pass; matches count only on word boundaries, as in the regex
+        text = query.lower()
+        for end, length in _FOLLOW_UP_AUTOMATON.iter(text):
+            if not _is_word_char(text, end - length) and not _is_word_char(text, end + 1):
+                return True
+        return False
+
+except ImportError:
+
+    def _has_follow_up_indicator(query: str) -> bool:
+        return _FOLLOW_UP_PATTERN.search(query) is not None
+
 
 @dataclass
 class Source:
@@ -47,17 +112,65 @@ class QueryResult:
     recommendations: list[str] | None = None
 
 
+_MAX_RECOMMENDATIONS = 3
+
+
+def _is_recommendation(line: str) -> bool:
+    """Check whether a response line is a bulleted or numbered recommendation."""
+    line = line.strip()
+    return bool(line) and (line.startswith("-") or line[0].isdigit())
+
+
+def _parse_recommendations(text: str) -> list[str]:
+    """Parse recommendation bullets from a Claude response.
+
+    Args:
+        text: Response text.
+
+    Returns:
+        Up to three bulleted or numbered recommendations.
+    """
+    recommendations = [line.strip() for line in text.split("\n") if _is_recommendation(line)]
+
+    return recommendations[:_MAX_RECOMMENDATIONS]
+
+
+def _answer_cache_key(
+    query: str,
+    client_id: str,
+    user_role: str,
+    date_range: tuple[str, str] | None,
+) -> tuple:
+    """Build the answer cache key, ignoring case and spacing in the query."""
+    normalized = _WHITESPACE.sub(" ", query.strip().lower())
+    return (client_id, normalized, tuple(date_range or ()), user_role)
+
+
+def _log_cache_usage(response: Any) -> None:
+    """Log how many input tokens were read from or written to the prompt cache."""
+    usage = getattr(response, "usage", None)
+    if usage is not None and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Prompt cache: {getattr(usage, 'cache_read_input_tokens', 0)} read, "
+            f"{getattr(usage, 'cache_creation_input_tokens', 0)} written"
+        )
+
+
 class ConversationMemory:
     """Manages conversation history for follow-up questions."""
 
-    def __init__(self, max_turns: int = 10):
+    def __init__(self, max_turns: int = 10, max_sessions: int = 10000):
         """Initialize conversation memory.
 
         Args:
             max_turns: Maximum conversation turns to remember.
+            max_sessions: Maximum sessions to keep; the least recently
+                active are forgotten first.
         """
         self._max_turns = max_turns
-        self._sessions: dict[str, list[dict[str, Any]]] = {}
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[str, deque[dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
 
     def add_turn(
         self,
@@ -74,21 +187,25 @@ class ConversationMemory:
             answer: System answer.
             context: Retrieved context.
         """
-        if session_id not in self._sessions:
-            self._sessions[session_id] = []
-
-        self._sessions[session_id].append(
-            {
-                "query": query,
-                "answer": answer,
-                "context": context,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-        )
-
-        # Trim to max turns
-        if len(self._sessions[session_id]) > self._max_turns:
-            self._sessions[session_id] = self._sessions[session_id][-self._max_turns:]
+        turn = {
+            "query": query,
+            "answer": answer,
+            "context": context,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+        with self._lock:
+            turns = self._sessions.get(session_id)
+            if turns is None:
+                # Oldest turns fall off the bounded deque
+                turns = self._sessions[session_id] = deque(maxlen=self._max_turns)
+            else:
+                self._sessions.move_to_end(session_id)
+            turns.append(turn)
+
+            # Forget the least recently active sessions
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
 
     def get_history(self, session_id: str) -> list[dict[str, Any]]:
         """Get conversation history.
@@ -99,7 +216,7 @@ class ConversationMemory:
         Returns:
             List of conversation turns.
         """
-        return self._sessions.get(session_id, [])
+        return list(self._sessions.get(session_id, ()))
 
     def get_last_context(self, session_id: str) -> RetrievalContext | None:
         """Get the last retrieval context.
@@ -110,9 +227,9 @@ class ConversationMemory:
         Returns:
             Last context or None.
         """
-        history = self.get_history(session_id)
-        if history:
-            return history[-1].get("context")
+        turns = self._sessions.get(session_id)
+        if turns:
+            return turns[-1].get("context")
         return None
 
     def clear(self, session_id: str) -> None:
@@ -121,8 +238,64 @@ class ConversationMemory:
         Args:
             session_id: Session identifier.
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+class AnswerCache:
+    """Caches query results for repeat questions within a time window."""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300):
+        """Initialize answer cache.
+
+        Args:
+            max_size: Maximum results to keep; 0 disables the cache.
+            ttl_seconds: Seconds a result stays valid.
+        """
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, QueryResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> QueryResult | None:
+        """Get a cached result.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached result, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: tuple, result: QueryResult) -> None:
+        """Cache a result, evicting the least recently used when full.
+
+        Args:
+            key: Cache key.
+            result: Query result.
+        """
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
 
 
 class GraphRAGEngine:
@@ -142,9 +315,16 @@ class GraphRAGEngine:
         self._settings = settings or get_settings()
         self._neo4j = neo4j_client or get_neo4j_client()
         self._retriever = HybridRetriever(self._neo4j, self._settings)
-        self._confidence_scorer = ConfidenceScorer(self._settings)
+        self._confidence_scorer = (
+            ConfidenceScorer(settings) if settings else get_confidence_scorer()
+        )
         self._memory = ConversationMemory()
+        self._answer_cache = AnswerCache(
+            self._settings.ANSWER_CACHE_SIZE, self._settings.ANSWER_CACHE_TTL_SECONDS
+        )
         self._anthropic = Anthropic(api_key=self._settings.ANTHROPIC_API_KEY)
+        self._async_anthropic = AsyncAnthropic(api_key=self._settings.ANTHROPIC_API_KEY)
+        self._semaphore = asyncio.Semaphore(self._settings.ANTHROPIC_MAX_CONCURRENCY)
 
     def query(
         self,
@@ -171,6 +351,246 @@ class GraphRAGEngine:
 
         logger.info(f"Processing query {query_id}: {query[:50]}...")
 
+        # Sessionless answers are reusable; follow-ups depend on the conversation
+        cache_key = None
+        if not session_id:
+            cache_key = _answer_cache_key(query, client_id, user_role, date_range)
+            cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Answer cache hit for query {query_id}")
+                return replace(cached, query_id=query_id, timestamp=timestamp)
+
+        context, is_follow_up, previous_context = self._retrieve_context(
+            query, client_id, session_id, date_range
+        )
+        context_str = self._retriever.format_context_for_llm(context)
+        confidence = self._score_confidence(query, context)
+
+        # Check if we should refuse to answer
+        sources = []
+        recommendations = None
+        if self._confidence_scorer.should_refuse(confidence):
+            answer = self._complete(
+                self._low_confidence_request(query, context_str, confidence)
+            )
+        else:
+            # Generate answer with LLM
+            answer = self._complete(
+                self._answer_request(
+                    query, context, context_str, is_follow_up, previous_context
+                )
+            )
+            logger.info(f"Generated answer with {len(answer)} characters")
+
+            # Extract sources
+            sources = self._extract_sources(context)
+
+            # Generate recommendations if appropriate
+            if self._should_include_recommendations(query, context):
+                recommendations = _parse_recommendations(
+                    self._complete(self._recommendations_request(context, context_str))
+                )
+
+        result = self._build_result(
+            query=query,
+            query_id=query_id,
+            timestamp=timestamp,
+            context=context,
+            context_str=context_str,
+            confidence=confidence,
+            answer=answer,
+            sources=sources,
+            recommendations=recommendations,
+            user_role=user_role,
+            session_id=session_id,
+        )
+        if cache_key is not None:
+            self._answer_cache.set(cache_key, result)
+        return result
+
+    async def aquery(
+        self,
+        query: str,
+        client_id: str,
+        user_role: str = "manager",
+        session_id: str | None = None,
+        date_range: tuple[str, str] | None = None,
+    ) -> QueryResult:
+        """Process a natural language query without blocking the event loop.
+
+        Retrieval runs in a worker thread, and the answer and recommendation
+        calls to Claude are issued concurrently.
+
+        Args:
+            query: User's query.
+            client_id: Client ID for data isolation.
+            user_role: User's role (affects drill-down access).
+            session_id: Session ID for conversation memory.
+            date_range: Optional date range override.
+
+        Returns:
+            QueryResult with answer, sources, and confidence.
+        """
+        query_id = str(uuid4())
+        timestamp = datetime.utcnow().isoformat()
+
+        logger.info(f"Processing query {query_id}: {query[:50]}...")
+
+        cache_key = None
+        if not session_id:
+            cache_key = _answer_cache_key(query, client_id, user_role, date_range)
+            cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Answer cache hit for query {query_id}")
+                return replace(cached, query_id=query_id, timestamp=timestamp)
+
+        context, is_follow_up, previous_context = await asyncio.to_thread(
+            self._retrieve_context, query, client_id, session_id, date_range
+        )
+        context_str = self._retriever.format_context_for_llm(context)
+        confidence = self._score_confidence(query, context)
+
+        sources = []
+        recommendations = None
+        if self._confidence_scorer.should_refuse(confidence):
+            answer = await self._acomplete(
+                self._low_confidence_request(query, context_str, confidence)
+            )
+        else:
+            answer_call = self._acollect(
+                self._answer_request(
+                    query, context, context_str, is_follow_up, previous_context
+                )
+            )
+            if self._should_include_recommendations(query, context):
+                answer, recommendations = await asyncio.gather(
+                    answer_call,
+                    self._astream_recommendations(
+                        self._recommendations_request(context, context_str)
+                    ),
+                )
+            else:
+                answer = await answer_call
+            logger.info(f"Generated answer with {len(answer)} characters")
+            sources = self._extract_sources(context)
+
+        result = self._build_result(
+            query=query,
+            query_id=query_id,
+            timestamp=timestamp,
+            context=context,
+            context_str=context_str,
+            confidence=confidence,
+            answer=answer,
+            sources=sources,
+            recommendations=recommendations,
+            user_role=user_role,
+            session_id=session_id,
+        )
+        if cache_key is not None:
+            self._answer_cache.set(cache_key, result)
+        return result
+
+    async def query_batch(
+        self,
+        requests: list["QueryRequest"],
+        user_role: str = "manager",
+    ) -> list[QueryResult]:
+        """Process independent queries in bulk, e.g. for report generation.
+
+        Context is retrieved and scored per query as in aquery. With
+        ANTHROPIC_USE_BATCH_API set, the Claude prompts are submitted through
+        the Message Batches API, which is cheaper but can take minutes;
+        otherwise they are sent concurrently. Conversation memory is neither
+        read nor updated.
+
+        Args:
+            requests: Queries to process.
+            user_role: User's role (affects drill-down access).
+
+        Returns:
+            QueryResults in the order of requests.
+        """
+        contexts = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._retrieve_context, r.query, r.client_id, None, r.date_range
+                )
+                for r in requests
+            )
+        )
+
+        prepared = []
+        calls: dict[str, dict[str, Any]] = {}
+        for request, (context, _, _) in zip(requests, contexts):
+            query_id = str(uuid4())
+            context_str = self._retriever.format_context_for_llm(context)
+            confidence = self._score_confidence(request.query, context)
+            refused = self._confidence_scorer.should_refuse(confidence)
+            if refused:
+                calls[f"{query_id}_answer"] = self._low_confidence_request(
+                    request.query, context_str, confidence
+                )
+            else:
+                calls[f"{query_id}_answer"] = self._answer_request(
+                    request.query, context, context_str, False, None
+                )
+                if self._should_include_recommendations(request.query, context):
+                    calls[f"{query_id}_recommendations"] = self._recommendations_request(
+                        context, context_str
+                    )
+            prepared.append((request, query_id, context, context_str, confidence, refused))
+
+        if self._settings.ANTHROPIC_USE_BATCH_API:
+            texts = await self._complete_batch(calls)
+        else:
+            texts = dict(
+                zip(calls, await asyncio.gather(*(self._acomplete(c) for c in calls.values())))
+            )
+
+        results = []
+        for request, query_id, context, context_str, confidence, refused in prepared:
+            recommendations_text = texts.get(f"{query_id}_recommendations")
+            results.append(
+                self._build_result(
+                    query=request.query,
+                    query_id=query_id,
+                    timestamp=datetime.utcnow().isoformat(),
+                    context=context,
+                    context_str=context_str,
+                    confidence=confidence,
+                    answer=texts[f"{query_id}_answer"],
+                    sources=[] if refused else self._extract_sources(context),
+                    recommendations=(
+                        _parse_recommendations(recommendations_text)
+                        if recommendations_text is not None
+                        else None
+                    ),
+                    user_role=user_role,
+                    session_id=None,
+                )
+            )
+        return results
+
+    def _retrieve_context(
+        self,
+        query: str,
+        client_id: str,
+        session_id: str | None,
+        date_range: tuple[str, str] | None,
+    ) -> tuple[RetrievalContext, bool, RetrievalContext | None]:
+        """Retrieve context, reusing the previous turn's for follow-ups.
+
+        Args:
+            query: User's query.
+            client_id: Client ID for data isolation.
+            session_id: Session ID for conversation memory.
+            date_range: Optional date range override.
+
+        Returns:
+            Retrieved context, whether the query is a follow-up, and the
+            previous context if any.
+        """
         # Check for follow-up context
         is_follow_up = False
         previous_context = None
@@ -187,30 +607,56 @@ class GraphRAGEngine:
         else:
             context = self._retriever.retrieve(query, client_id, date_range)
 
-        # Score confidence
-        confidence = self._confidence_scorer.score(
+        return context, is_follow_up, previous_context
+
+    def _score_confidence(self, query: str, context: RetrievalContext) -> ConfidenceScore:
+        """Score confidence for the retrieved context.
+
+        Args:
+            query: User's query.
+            context: Retrieved context.
+
+        Returns:
+            Confidence score.
+        """
+        return self._confidence_scorer.score(
             query,
             context.entities + context.metrics,
             context.date_range,
         )
 
-        # Check if we should refuse to answer
-        if self._confidence_scorer.should_refuse(confidence):
-            answer = self._generate_low_confidence_response(query, context, confidence)
-            sources = []
-            recommendations = None
-        else:
-            # Generate answer with LLM
-            answer = self._generate_answer(query, context, is_follow_up, previous_context)
-
-            # Extract sources
-            sources = self._extract_sources(context)
+    def _build_result(
+        self,
+        query: str,
+        query_id: str,
+        timestamp: str,
+        context: RetrievalContext,
+        context_str: str,
+        confidence: ConfidenceScore,
+        answer: str,
+        sources: list[Source],
+        recommendations: list[str] | None,
+        user_role: str,
+        session_id: str | None,
+    ) -> QueryResult:
+        """Record the turn and assemble the query result.
 
-            # Generate recommendations if appropriate
-            recommendations = None
-            if self._should_include_recommendations(query, context):
-                recommendations = self._generate_recommendations(context)
+        Args:
+            query: User's query.
+            query_id: Query identifier.
+            timestamp: Query start time (ISO format).
+            context: Retrieved context.
+            context_str: Context formatted for the LLM, used as the summary.
+            confidence: Confidence score.
+            answer: Generated answer.
+            sources: Cited sources.
+            recommendations: Generated recommendations, if any.
+            user_role: User's role (affects drill-down access).
+            session_id: Session ID for conversation memory.
 
+        Returns:
+            QueryResult with answer, sources, and confidence.
+        """
         # Store in conversation memory
         if session_id:
             self._memory.add_turn(session_id, query, answer, context)
@@ -220,16 +666,13 @@ class GraphRAGEngine:
             context.relationships
         ) > 0
 
-        # Format context summary
-        context_summary = self._retriever.format_context_for_llm(context)
-
         return QueryResult(
             answer=answer,
             confidence=confidence,
             sources=sources,
             query_id=query_id,
             timestamp=timestamp,
-            context_summary=context_summary,
+            context_summary=context_str,
             drill_down_available=drill_down_available,
             recommendations=recommendations,
         )
@@ -243,47 +686,157 @@ class GraphRAGEngine:
         Returns:
             True if likely a follow-up.
         """
-        follow_up_indicators = [
-            "more",
-            "detail",
-            "explain",
-            "why",
-            "how",
-            "what about",
-            "and",
-            "also",
-            "that",
-            "this",
-            "these",
-            "those",
-            "it",
-            "they",
-            "them",
-        ]
-        query_lower = query.lower()
-        return any(ind in query_lower for ind in follow_up_indicators)
-
-    def _generate_answer(
+        return _has_follow_up_indicator(query)
+
+    def _complete(self, request: dict[str, Any]) -> str:
+        """Send a message request to Claude and return the response text.
+
+        Args:
+            request: Keyword arguments for messages.create.
+
+        Returns:
+            Text of the first content block.
+        """
+        response = self._anthropic.messages.create(**request)
+        _log_cache_usage(response)
+        return response.content[0].text
+
+    async def _acomplete(self, request: dict[str, Any]) -> str:
+        """Send a message request to Claude within the concurrency limit.
+
+        Args:
+            request: Keyword arguments for messages.create.
+
+        Returns:
+            Text of the first content block.
+        """
+        async with self._semaphore:
+            response = await self._async_anthropic.messages.create(**request)
+        _log_cache_usage(response)
+        return response.content[0].text
+
+    async def _astream(self, request: dict[str, Any]) -> AsyncIterator[str]:
+        """Stream response text from Claude within the concurrency limit.
+
+        Args:
+            request: Keyword arguments for messages.stream.
+
+        Yields:
+            Text chunks as they arrive.
+        """
+        async with self._semaphore:
+            async with self._async_anthropic.messages.stream(**request) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                _log_cache_usage(await stream.get_final_message())
+
+    async def _acollect(self, request: dict[str, Any]) -> str:
+        """Stream a response from Claude and join it into one string.
+
+        Args:
+            request: Keyword arguments for messages.stream.
+
+        Returns:
+            Full response text.
+        """
+        return "".join([text async for text in self._astream(request)])
+
+    async def _astream_recommendations(self, request: dict[str, Any]) -> list[str]:
+        """Parse recommendations while they stream, stopping once enough arrive.
+
+        Leaving the stream early aborts the rest of the generation.
+
+        Args:
+            request: Keyword arguments for messages.stream.
+
+        Returns:
+            Up to three bulleted or numbered recommendations.
+        """
+        recommendations = []
+        partial = ""
+        async with self._semaphore:
+            async with self._async_anthropic.messages.stream(**request) as stream:
+                async for text in stream.text_stream:
+                    *lines, partial = (partial + text).split("\n")
+                    recommendations.extend(
+                        line.strip() for line in lines if _is_recommendation(line)
+                    )
+                    if len(recommendations) >= _MAX_RECOMMENDATIONS:
+                        break
+
+        if _is_recommendation(partial):
+            recommendations.append(partial.strip())
+        return recommendations[:_MAX_RECOMMENDATIONS]
+
+    async def _complete_batch(self, calls: dict[str, dict[str, Any]]) -> dict[str, str]:
+        """Run message requests through the Message Batches API.
+
+        Requests that do not succeed in the batch are retried directly. A
+        batch still running after ANTHROPIC_BATCH_MAX_WAIT_SECONDS is
+        cancelled and every request is retried directly.
+
+        Args:
+            calls: messages.create keyword arguments keyed by custom ID.
+
+        Returns:
+            Response text keyed by custom ID.
+        """
+        batches = self._async_anthropic.messages.batches
+        batch = await batches.create(
+            requests=[{"custom_id": c, "params": params} for c, params in calls.items()]
+        )
+        logger.info(f"Submitted message batch {batch.id} with {len(calls)} requests")
+
+        deadline = time.monotonic() + self._settings.ANTHROPIC_BATCH_MAX_WAIT_SECONDS
+        while batch.processing_status != "ended":
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Message batch {batch.id} still {batch.processing_status} after "
+                    f"{self._settings.ANTHROPIC_BATCH_MAX_WAIT_SECONDS}s, cancelling"
+                )
+                await batches.cancel(batch.id)
+                break
+            await asyncio.sleep(min(self._settings.ANTHROPIC_BATCH_POLL_SECONDS, remaining))
+            batch = await batches.retrieve(batch.id)
+
+        texts = {}
+        if batch.processing_status == "ended":
+            async for entry in await batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    texts[entry.custom_id] = entry.result.message.content[0].text
+
+        failed = [custom_id for custom_id in calls if custom_id not in texts]
+        if failed:
+            logger.warning(
+                f"Message batch {batch.id}: {len(failed)} requests did not succeed, "
+                f"retrying directly"
+            )
+            retried = await asyncio.gather(*(self._acomplete(calls[c]) for c in failed))
+            texts.update(zip(failed, retried))
+
+        return texts
+
+    def _answer_request(
         self,
         query: str,
         context: RetrievalContext,
+        context_str: str,
         is_follow_up: bool,
         previous_context: RetrievalContext | None,
-    ) -> str:
-        """Generate answer using Claude.
+    ) -> dict[str, Any]:
+        """Build the Claude request for answering a query.
 
         Args:
             query: User query.
             context: Retrieved context.
+            context_str: Context formatted for the LLM.
             is_follow_up: Whether this is a follow-up query.
             previous_context: Previous context if follow-up.
 
         Returns:
-            Generated answer.
+            Keyword arguments for messages.create.
         """
-        # Format context for the prompt
-        context_str = self._retriever.format_context_for_llm(context)
-
         # Build messages
         messages = []
 
@@ -309,48 +862,41 @@ Provide a detailed answer with specific metrics and dates. Always cite your sour
 
         messages.append({"role": "user", "content": user_message})
 
-        # Call Claude
-        response = self._anthropic.messages.create(
-            model=self._settings.ANTHROPIC_MODEL,
-            max_tokens=2048,
-            system=SYSTEM_PROMPT,
-            messages=messages,
-        )
-
-        answer = response.content[0].text
-        logger.info(f"Generated answer with {len(answer)} characters")
-        return answer
+        return {
+            "model": self._settings.ANTHROPIC_MODEL,
+            "max_tokens": 2048,
+            "system": _SYSTEM_BLOCKS,
+            "messages": messages,
+        }
 
-    def _generate_low_confidence_response(
+    def _low_confidence_request(
         self,
         query: str,
-        context: RetrievalContext,
+        context_str: str,
         confidence: ConfidenceScore,
-    ) -> str:
-        """Generate response when confidence is too low.
+    ) -> dict[str, Any]:
+        """Build the Claude request for a response when confidence is too low.
 
         Args:
             query: User query.
-            context: Retrieved context.
+            context_str: Context formatted for the LLM.
             confidence: Confidence score.
 
         Returns:
-            Low-confidence response.
+            Keyword arguments for messages.create.
         """
         prompt = LOW_CONFIDENCE_PROMPT.format(
             question=query,
-            context=self._retriever.format_context_for_llm(context),
+            context=context_str,
             missing=", ".join(confidence.missing_data),
         )
 
-        response = self._anthropic.messages.create(
-            model=self._settings.ANTHROPIC_MODEL,
-            max_tokens=1024,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        return response.content[0].text
+        return {
+            "model": self._settings.ANTHROPIC_MODEL,
+            "max_tokens": 1024,
+            "system": _SYSTEM_BLOCKS,
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
     def _extract_sources(self, context: RetrievalContext) -> list[Source]:
         """Extract source references from context.
@@ -401,37 +947,30 @@ Provide a detailed answer with specific metrics and dates. Always cite your sour
             and len(context.metrics) >= 10
         )
 
-    def _generate_recommendations(self, context: RetrievalContext) -> list[str]:
-        """Generate proactive recommendations.
+    def _recommendations_request(
+        self, context: RetrievalContext, context_str: str
+    ) -> dict[str, Any]:
+        """Build the Claude request for proactive recommendations.
 
         Args:
             context: Retrieved context.
+            context_str: Context formatted for the LLM.
 
         Returns:
-            List of recommendations.
+            Keyword arguments for messages.create.
         """
         prompt = RECOMMENDATION_PROMPT.format(
             campaign_data=str(context.entities[:5]),
-            metrics=self._retriever.format_context_for_llm(context),
+            metrics=context_str,
             benchmarks="Industry average CTR: 2%, CPC: $1.50, ROAS: 3x (typical for e-commerce)",
         )
 
-        response = self._anthropic.messages.create(
-            model=self._settings.ANTHROPIC_MODEL,
-            max_tokens=1024,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        # Parse recommendations from response
-        recommendations_text = response.content[0].text
-        recommendations = [
-            line.strip()
-            for line in recommendations_text.split("\n")
-            if line.strip() and (line.strip().startswith("-") or line.strip()[0].isdigit())
-        ]
-
-        return recommendations[:3]  # Limit to 3 recommendations
+        return {
+            "model": self._settings.ANTHROPIC_MODEL,
+            "max_tokens": 1024,
+            "system": _SYSTEM_BLOCKS,
+            "messages": [{"role": "user", "content": prompt}],
+        }
 
     def clear_session(self, session_id: str) -> None:
         """Clear conversation memory for a session.
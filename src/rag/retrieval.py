@@ -1,6 +1,7 @@
 """Hybrid retrieval combining graph traversal and vector search."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
@@ -70,25 +71,24 @@ class HybridRetriever:
         if not date_range:
             date_range = self._get_default_date_range(query_intent)
 
-        entities = []
-        metrics = []
-        relationships = []
-
-        # Step 1: Entity retrieval based on query terms
-        entities = self._retrieve_entities(query, client_id, query_intent)
-
-        # Step 2: Metrics retrieval
-        metrics = self._retrieve_metrics(
-            client_id,
-            date_range,
-            query_intent,
-            [e.get("id") for e in entities if e.get("id")],
-        )
+        # The metric scan only needs the client and date range, so it runs
+        # alongside entity retrieval and is narrowed to the matched entities
+        # afterwards; the hierarchy lookup then overlaps with that filtering.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            metrics_future = pool.submit(self._fetch_metrics, client_id, date_range)
 
-        # Step 3: Relationship context
-        relationships = self._retrieve_relationships(
-            client_id, [e.get("id") for e in entities if e.get("id")]
-        )
+            # Step 1: Entity retrieval based on query terms
+            entities = self._retrieve_entities(query, client_id, query_intent)
+            entity_ids = [e.get("id") for e in entities if e.get("id")]
+
+            # Step 2: Relationship context
+            relationships_future = pool.submit(
+                self._retrieve_relationships, client_id, entity_ids
+            )
+
+            # Step 3: Metrics for the matched entities
+            metrics = self._filter_metrics(metrics_future.result(), entity_ids)
+            relationships = relationships_future.result()
 
         logger.info(
             f"Retrieved {len(entities)} entities, {len(metrics)} metrics, "
@@ -249,7 +249,7 @@ class HybridRetriever:
             ORDER BY camp.start_date DESC
             LIMIT 50
             """
-            campaigns = self._neo4j.execute_query(
+            campaigns = self._neo4j.execute_read(
                 campaign_query, {"client_id": client_id, "channel": channel}
             )
             for c in campaigns:
@@ -263,7 +263,7 @@ class HybridRetriever:
             RETURN a
             LIMIT 50
             """
-            adsets = self._neo4j.execute_query(adset_query, {"client_id": client_id})
+            adsets = self._neo4j.execute_read(adset_query, {"client_id": client_id})
             for a in adsets:
                 if a.get("a"):
                     entities.append({**a["a"], "entity_type": "adset"})
@@ -280,7 +280,7 @@ class HybridRetriever:
                 RETURN camp
                 LIMIT 10
                 """
-                results = self._neo4j.execute_query(
+                results = self._neo4j.execute_read(
                     search_query, {"client_id": client_id, "term": term}
                 )
                 for r in results:
@@ -309,6 +309,22 @@ class HybridRetriever:
         Returns:
             List of metric dictionaries.
         """
+        return self._filter_metrics(self._fetch_metrics(client_id, date_range), entity_ids)
+
+    def _fetch_metrics(
+        self,
+        client_id: str,
+        date_range: tuple[str, str],
+    ) -> list[dict[str, Any]]:
+        """Fetch the most recent client metrics within a date range.
+
+        Args:
+            client_id: Client ID.
+            date_range: Date range tuple.
+
+        Returns:
+            List of metric dictionaries, newest first.
+        """
         start_date, end_date = date_range
 
         # Get aggregated metrics for client
@@ -319,21 +335,32 @@ class HybridRetriever:
         ORDER BY m.date DESC
         LIMIT 500
         """
-        metrics = self._neo4j.execute_query(
+        metrics = self._neo4j.execute_read(
             summary_query,
             {"client_id": client_id, "start_date": start_date, "end_date": end_date},
         )
 
-        result = []
-        for m in metrics:
-            if m.get("m"):
-                result.append(m["m"])
+        return [m["m"] for m in metrics if m.get("m")]
 
-        # If specific entities, filter metrics
-        if entity_ids:
-            result = [m for m in result if m.get("entity_id") in entity_ids] or result
+    @staticmethod
+    def _filter_metrics(
+        metrics: list[dict[str, Any]],
+        entity_ids: list[str],
+    ) -> list[dict[str, Any]]:
+        """Narrow metrics to specific entities, keeping all if none match.
+
+        Args:
+            metrics: Metric dictionaries.
+            entity_ids: Entity IDs to keep metrics for.
+
+        Returns:
+            Filtered list of metric dictionaries.
+        """
+        if not entity_ids:
+            return metrics
 
-        return result
+        wanted = set(entity_ids)
+        return [m for m in metrics if m.get("entity_id") in wanted] or metrics
 
     def _retrieve_relationships(
         self,
@@ -364,7 +391,7 @@ class HybridRetriever:
             collect(DISTINCT {id: ad.id, name: ad.name}) AS ads
         """
 
-        results = self._neo4j.execute_query(
+        results = self._neo4j.execute_read(
             hierarchy_query, {"client_id": client_id, "entity_ids": entity_ids[:20]}
         )
 
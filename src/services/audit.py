@@ -295,8 +295,9 @@ class AuditService:
         RETURN count(*) AS deleted
         """
 
-        result = self._neo4j.execute_query(query, {"retention_days": retention_days})
-        deleted = result[0]["deleted"] if result else 0
+        deleted = self._neo4j.execute_scalar(
+            query, {"retention_days": retention_days}, "deleted"
+        ) or 0
 
         logger.info(f"Cleaned up {deleted} old audit logs (retention: {retention_days} days)")
         return deleted
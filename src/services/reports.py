@@ -2,7 +2,7 @@
 
 import io
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +17,24 @@ REPORTS_DIR = Path("reports")
 REPORTS_DIR.mkdir(exist_ok=True)
 
 
+def _period_params(client_id: str, start_date: str, end_date: str) -> dict[str, Any]:
+    """Build query parameters for a reporting period.
+
+    Args:
+        client_id: Client ID.
+        start_date: Period start (YYYY-MM-DD).
+        end_date: Period end (YYYY-MM-DD).
+
+    Returns:
+        Parameters with the dates parsed once, here rather than in Cypher.
+    """
+    return {
+        "client_id": client_id,
+        "start_date": date.fromisoformat(start_date),
+        "end_date": date.fromisoformat(end_date),
+    }
+
+
 class ReportService:
     """Service for generating marketing performance reports."""
 
@@ -125,7 +143,7 @@ class ReportService:
         }
 
         # Get client info
-        client_result = self._neo4j.execute_query(
+        client_result = self._neo4j.execute_read(
             "MATCH (c:Client {id: $client_id}) RETURN c",
             {"client_id": client_id},
         )
@@ -180,9 +198,9 @@ class ReportService:
         self, client_id: str, start_date: str, end_date: str
     ) -> dict[str, Any]:
         """Get summary metrics."""
-        result = self._neo4j.execute_query(
+        result = self._neo4j.execute_read(
             self._queries.GET_CLIENT_SUMMARY,
-            {"client_id": client_id, "start_date": start_date, "end_date": end_date},
+            _period_params(client_id, start_date, end_date),
         )
 
         if result:
@@ -199,14 +217,9 @@ class ReportService:
         """Get campaign performance data."""
         statuses = ["active", "paused", "completed"]
 
-        result = self._neo4j.execute_query(
+        result = self._neo4j.execute_read(
             self._queries.GET_CAMPAIGN_COMPARISON,
-            {
-                "client_id": client_id,
-                "start_date": start_date,
-                "end_date": end_date,
-                "statuses": statuses,
-            },
+            {**_period_params(client_id, start_date, end_date), "statuses": statuses},
         )
 
         campaigns = result or []
@@ -224,7 +237,7 @@ class ReportService:
         query = """
         MATCH (c:Client {id: $client_id})-[:OWNS]->(camp:Campaign)-[:CONTAINS]->(adset:AdSet)
         OPTIONAL MATCH (m:Metric {entity_type: 'adset', entity_id: adset.id})
-        WHERE m.date >= date($start_date) AND m.date <= date($end_date)
+        WHERE m.date >= $start_date AND m.date <= $end_date
         WITH adset, camp, m
         RETURN adset.id AS adset_id,
                adset.name AS adset_name,
@@ -236,27 +249,27 @@ class ReportService:
         ORDER BY spend DESC
         LIMIT 50
         """
-        return self._neo4j.execute_query(
+        return self._neo4j.execute_read(
             query,
-            {"client_id": client_id, "start_date": start_date, "end_date": end_date},
+            _period_params(client_id, start_date, end_date),
         )
 
     def _get_trend_data(
         self, client_id: str, start_date: str, end_date: str
     ) -> list[dict[str, Any]]:
         """Get daily trend data."""
-        return self._neo4j.execute_query(
+        return self._neo4j.execute_read(
             self._queries.GET_DAILY_METRICS,
-            {"client_id": client_id, "start_date": start_date, "end_date": end_date},
+            _period_params(client_id, start_date, end_date),
         )
 
     def _get_channel_breakdown(
         self, client_id: str, start_date: str, end_date: str
     ) -> list[dict[str, Any]]:
         """Get channel breakdown data."""
-        return self._neo4j.execute_query(
+        return self._neo4j.execute_read(
             self._queries.GET_CHANNEL_BREAKDOWN,
-            {"client_id": client_id, "start_date": start_date, "end_date": end_date},
+            _period_params(client_id, start_date, end_date),
         )
 
     def _generate_recommendations(self, data: dict[str, Any]) -> list[str]:
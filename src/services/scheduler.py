@@ -185,26 +185,7 @@ class SyncScheduler:
         """
         ingester = DataIngester(self._neo4j)
 
-        for campaign in data.get("campaigns", []):
-            ingester.ingest_campaign(campaign, client_id)
-
-        for adset in data.get("adsets", []):
-            ingester.ingest_adset(adset, adset["campaign_id"], client_id)
-
-        for ad in data.get("ads", []):
-            ingester.ingest_ad(ad, ad["adset_id"], client_id)
-
-        # Group metrics by entity
-        metrics_by_entity: dict[str, list] = {}
-        for m in data.get("metrics", []):
-            key = f"{m['entity_type']}_{m['entity_id']}"
-            if key not in metrics_by_entity:
-                metrics_by_entity[key] = []
-            metrics_by_entity[key].append(m)
-
-        for key, metrics in metrics_by_entity.items():
-            entity_type, entity_id = key.split("_", 1)
-            ingester.ingest_metrics(metrics, entity_type, entity_id, client_id)
+        ingester.ingest_all(data, client_id)
 
     def _get_clients_for_sync(self) -> list[dict[str, Any]]:
         """Get all clients configured for automatic sync.
@@ -36,6 +36,8 @@ def mock_neo4j_client():
     client = MagicMock()
     client.verify_connectivity.return_value = True
     client.execute_query.return_value = []
+    client.execute_read.return_value = []
+    client.execute_scalar.return_value = None
     client.execute_write.return_value = {
         "nodes_created": 1,
         "nodes_deleted": 0,
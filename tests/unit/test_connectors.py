@@ -1,8 +1,33 @@
 """Unit tests for data connectors."""
 
+import asyncio
+import threading
+from datetime import date, datetime
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import numpy as np
 import pytest
 
-from src.connectors.mock_data import MockDataGenerator
+from src.connectors.base import AuthenticationError, BaseConnector, MetricRow, TemporaryError
+from src.connectors.google_ads import GoogleAdsConnector
+from src.connectors.meta_ads import (
+    MetaAdsConnector,
+    MetaRateLimiter,
+    _budget,
+    _creative_type,
+    _iso_date,
+    _usage_pause,
+)
+from src.connectors.mock_data import (
+    MockDataGenerator,
+    _compute_metrics,
+    _date_table,
+    _RandomIdPool,
+    _weighted_draws,
+)
 
 
 class TestMockDataGenerator:
@@ -23,6 +48,17 @@ class TestMockDataGenerator:
             assert "status" in client
             assert client["status"] == "active"
 
+    def test_generate_clients_beyond_company_pool(self):
+        """Test every company is used once before generated names take over."""
+        clients = MockDataGenerator(seed=42).generate_clients(count=8)
+        pool = dict(MockDataGenerator.COMPANY_NAMES)
+
+        names = [c["name"] for c in clients]
+        assert len(set(names)) == 8
+        assert set(names[:5]) == set(pool)
+        assert all(pool[c["name"]] == c["industry"] for c in clients[:5])
+        assert all(c["industry"] in MockDataGenerator.INDUSTRIES for c in clients[5:])
+
     def test_generate_campaigns(self):
         """Test campaign generation."""
         generator = MockDataGenerator(seed=42)
@@ -89,6 +125,107 @@ class TestMockDataGenerator:
             assert metric["clicks"] >= 0
             assert metric["spend"] >= 0
 
+    def test_generate_metrics_reproducible_plain_values(self):
+        """Test seeded metrics repeat exactly and hold plain Python numbers."""
+        metrics1 = MockDataGenerator(seed=7).generate_metrics("e", "campaign", "c", days=14)
+        metrics2 = MockDataGenerator(seed=7).generate_metrics("e", "campaign", "c", days=14)
+
+        assert metrics1 == metrics2
+        assert all(type(m["impressions"]) is int for m in metrics1)
+        assert all(type(m["spend"]) is float for m in metrics1)
+
+    def test_generate_metrics_soa(self):
+        """Test columnar metrics line up with the row form of the same draw."""
+        now = datetime(2024, 3, 1)
+        columns = MockDataGenerator(seed=11).generate_metrics_soa("e", days=5, now=now)
+        rows = MockDataGenerator(seed=11).generate_metrics(
+            "e", "campaign", "c", days=5, currency="EUR", now=now
+        )
+
+        assert all(len(column) == 5 for column in columns.values())
+        assert columns["id"].tolist() == [row["id"] for row in rows]
+        assert columns["spend"].tolist() == [row["spend"] for row in rows]
+        assert all(row["spend_currency"] == "EUR" for row in rows)
+        assert "revenue" not in MockDataGenerator(seed=11).generate_metrics_soa(
+            "e", days=5, include_revenue=False, now=now
+        )
+
+    def test_weighted_draws(self):
+        """Test batched weighted draws follow the cumulative cutoffs."""
+        rng = np.random.default_rng(0)
+        options = (("a", "b", "c"), np.array([0.6, 0.8]))
+
+        draws = _weighted_draws(rng, options, 10000)
+
+        assert set(draws) == {"a", "b", "c"}
+        assert 0.55 < draws.count("a") / len(draws) < 0.65
+        assert 0.15 < draws.count("c") / len(draws) < 0.25
+
+    def test_compute_metrics_kernel(self):
+        """Test the metric kernel applies weekend dampening and funnel rates."""
+        impressions, clicks, conversions, spend, revenue = _compute_metrics(
+            1000, 10.0, 10.0, 2.0, 50.0, 0.0, np.array([0, 5]), np.full((5, 2), 0.5)
+        )
+
+        assert impressions.tolist() == [1000, 700]
+        assert clicks.tolist() == [100, 70]
+        assert conversions.tolist() == [10, 7]
+        assert spend.tolist() == [200.0, 140.0]
+        assert revenue.tolist() == [500.0, 350.0]
+
+    def test_compute_metrics_kernel_without_revenue(self):
+        """Test the metric kernel skips revenue given no order value."""
+        *counts, revenue = _compute_metrics(
+            1000, 10.0, 10.0, 2.0, None, 0.0, np.array([0, 5]), np.full((4, 2), 0.5)
+        )
+
+        assert revenue is None
+        assert counts[3].tolist() == [200.0, 140.0]
+
+    def test_seeded_entities_repeat_with_plain_values(self):
+        """Test seeded generators draw the same entities as plain Python values."""
+        campaigns1 = MockDataGenerator(seed=3).generate_campaigns("c", count=6)
+        campaigns2 = MockDataGenerator(seed=3).generate_campaigns("c", count=6)
+
+        def strip_ids(rows):
+            return [{k: v for k, v in row.items() if not k.endswith("id")} for row in rows]
+
+        assert strip_ids(campaigns1) == strip_ids(campaigns2)
+        assert all(type(c["name"]) is str for c in campaigns1)
+        assert all(type(c["budget"]) is int for c in campaigns1)
+
+    def test_generation_uses_reference_time(self):
+        """Test a pinned reference time drives campaign and metric dates."""
+        generator = MockDataGenerator(seed=5)
+        now = datetime(2024, 3, 1, 12, 0)
+
+        campaigns = generator.generate_campaigns("c", count=4, now=now)
+        metrics = generator.generate_metrics("e", "campaign", "c", days=2, now=now)
+
+        assert all("2023-12-01" <= c["start_date"] <= "2024-01-31" for c in campaigns)
+        assert all(
+            c["status"] == "completed" for c in campaigns if c["end_date"] < "2024-03-01"
+        )
+        assert [m["date"] for m in metrics] == ["2024-02-28", "2024-02-29"]
+
+    def test_date_table(self):
+        """Test the shared date table ends the day before the reference date."""
+        dates, weekdays = _date_table(3, date(2024, 1, 8))
+
+        assert dates == ("2024-01-05", "2024-01-06", "2024-01-07")
+        assert weekdays.tolist() == [4, 5, 6]
+        assert _date_table(3, date(2024, 1, 8))[0] is dates
+
+    def test_random_id_pool(self):
+        """Test pooled IDs are unique, valid UUID4 strings across buffer refills."""
+        pool = _RandomIdPool()
+        ids = [pool.uuid() for _ in range(1000)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(str(UUID(value, version=4)) == value for value in ids)
+        assert len(pool.short_hex()) == 8
+        assert len(pool.short_hex(3)) == 6
+
     def test_generate_full_dataset(self):
         """Test full dataset generation."""
         generator = MockDataGenerator(seed=42)
@@ -107,6 +244,57 @@ class TestMockDataGenerator:
         assert len(data["ads"]) == 16  # 8 adsets * 2 ads
         assert len(data["metrics"]) > 0
 
+    def test_generate_full_dataset_metric_columns_match_rows(self):
+        """Test column batches carry the same metrics as the per-day dictionaries."""
+        options = {
+            "num_clients": 1,
+            "campaigns_per_client": 2,
+            "adsets_per_campaign": 2,
+            "ads_per_adset": 1,
+            "metric_days": 5,
+        }
+        rows = MockDataGenerator(seed=3).generate_full_dataset(**options)["metrics"]
+        data = MockDataGenerator(seed=3).generate_full_dataset(**options, metric_columns=True)
+        batches = data["metrics"]
+
+        revenue = [
+            None if np.isnan(value) else value
+            for batch in batches
+            for value in batch["columns"].get("revenue", np.full(5, np.nan)).tolist()
+        ]
+        assert [b["entity_type"] for b in batches] == ["campaign", "adset", "adset"] * 2
+        assert {b["client_id"] for b in batches} == {data["clients"][0]["id"]}
+        assert [v for b in batches for v in b["columns"]["spend"].tolist()] == [
+            m["spend"] for m in rows
+        ]
+        assert revenue == [m.get("revenue") for m in rows]
+        assert [
+            currency
+            for b in batches
+            for currency in b["columns"].get("revenue_currency", [None] * 5)
+        ] == [m.get("revenue_currency") for m in rows]
+
+    def test_generate_full_dataset_in_worker_processes(self):
+        """Test worker processes reproduce the in-process dataset for a seed."""
+        options = {
+            "num_clients": 2,
+            "campaigns_per_client": 2,
+            "adsets_per_campaign": 1,
+            "ads_per_adset": 1,
+            "metric_days": 3,
+        }
+        serial = MockDataGenerator(seed=9).generate_full_dataset(**options)
+        parallel = MockDataGenerator(seed=9).generate_full_dataset(**options, workers=2)
+
+        for key in ("campaigns", "adsets", "ads", "metrics"):
+            assert len(serial[key]) == len(parallel[key])
+        assert [m["spend"] for m in serial["metrics"]] == [
+            m["spend"] for m in parallel["metrics"]
+        ]
+        assert len({m["id"] for m in serial["metrics"] + parallel["metrics"]}) == 2 * len(
+            serial["metrics"]
+        )
+
     def test_generate_users(self):
         """Test user generation."""
         generator = MockDataGenerator(seed=42)
@@ -137,3 +325,433 @@ class TestMockDataGenerator:
             assert "id" in c1 and "id" in c2
             assert "name" in c1 and "name" in c2
             assert "industry" in c1 and "industry" in c2
+
+
+class _StubConnector(BaseConnector):
+    """In-memory connector for exercising BaseConnector orchestration."""
+
+    async def authenticate(self) -> bool:
+        self._is_authenticated = True
+        return True
+
+    async def fetch_campaigns(self, account_id, start_date, end_date):
+        return [{"id": "c1"}, {"id": "c2"}]
+
+    async def fetch_adsets(self, account_id, campaign_ids, start_date, end_date):
+        return [{"id": f"{cid}-s"} for cid in campaign_ids]
+
+    async def fetch_ads(self, account_id, adset_ids, start_date, end_date):
+        return [{"id": f"{aid}-a"} for aid in adset_ids]
+
+    async def fetch_metrics(
+        self, account_id, entity_type, entity_ids, start_date, end_date
+    ):
+        return [{"entity_type": entity_type, "entity_id": eid} for eid in entity_ids]
+
+
+class TestBaseConnector:
+    """Tests for BaseConnector orchestration."""
+
+    async def test_fetch_all(self, test_settings):
+        """Test fetch_all walks the hierarchy and collects every metric level."""
+        connector = _StubConnector(test_settings)
+
+        data = await connector.fetch_all("acct", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert [c["id"] for c in data["campaigns"]] == ["c1", "c2"]
+        assert [a["id"] for a in data["adsets"]] == ["c1-s", "c2-s"]
+        assert [a["id"] for a in data["ads"]] == ["c1-s-a", "c2-s-a"]
+        assert [m["entity_type"] for m in data["metrics"]] == [
+            "campaign", "campaign", "adset", "adset", "ad", "ad"
+        ]
+
+    async def test_sync_all_transforms_entities(self, test_settings):
+        """Test sync_all tags entities with the client ID."""
+        connector = _StubConnector(test_settings)
+
+        data = await connector.sync_all(
+            "acct", "client-1", date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert all(c["client_id"] == "client-1" for c in data["campaigns"])
+        assert len(data["metrics"]) == 6
+
+
+class TestGoogleAdsConnector:
+    """Tests for GoogleAdsConnector."""
+
+    @pytest.fixture
+    def connector(self, test_settings):
+        """Create connector with a mock Google Ads client."""
+        connector = GoogleAdsConnector(test_settings)
+        connector._client = MagicMock()
+        return connector
+
+    @staticmethod
+    def _campaign_row(campaign_id: int) -> SimpleNamespace:
+        """Build a fake GAQL campaign row."""
+        return SimpleNamespace(
+            campaign=SimpleNamespace(
+                id=campaign_id,
+                name=f"Campaign {campaign_id}",
+                status=2,
+                advertising_channel_type=2,
+                start_date="2024-01-01",
+                end_date="",
+            ),
+            campaign_budget=SimpleNamespace(amount_micros=5_000_000),
+        )
+
+    async def test_fetch_campaigns_many(self, connector):
+        """Test campaigns are fetched per account through the limiter."""
+        service = connector._client.get_service.return_value
+        service.search.side_effect = lambda customer_id, query: [
+            self._campaign_row(int(customer_id))
+        ]
+
+        result = await connector.fetch_campaigns_many(
+            ["111", "222"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert set(result) == {"111", "222"}
+        assert result["111"][0]["id"] == "111"
+        assert result["222"][0]["budget"] == 5.0
+        assert service.search.call_count == 2
+
+    async def test_fetch_campaigns_uses_response_cache(self, test_settings, tmp_path):
+        """Test repeated queries are served from the disk cache."""
+        settings = test_settings.model_copy(
+            update={"CONNECTOR_CACHE_DIR": str(tmp_path)}
+        )
+        connector = GoogleAdsConnector(settings)
+        connector._client = MagicMock()
+        service = connector._client.get_service.return_value
+        service.search.return_value = [self._campaign_row(42)]
+
+        first = await connector.fetch_campaigns(
+            "111", date(2024, 1, 1), date(2024, 1, 31)
+        )
+        second = await connector.fetch_campaigns(
+            "111", date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert first == second
+        assert service.search.call_count == 1
+
+    async def test_fetch_metrics_returns_metric_rows(self, connector):
+        """Test metrics come back as slotted rows convertible to dicts."""
+        service = connector._client.get_service.return_value
+        service.search.return_value = [
+            SimpleNamespace(
+                campaign=SimpleNamespace(id=42),
+                segments=SimpleNamespace(date="2024-01-02"),
+                metrics=SimpleNamespace(
+                    impressions=1000,
+                    clicks=50,
+                    conversions=4.0,
+                    cost_micros=12_500_000,
+                    conversions_value=0,
+                ),
+            )
+        ]
+
+        rows = await connector.fetch_metrics(
+            "111", "campaign", ["42"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert isinstance(rows[0], MetricRow)
+        assert not hasattr(rows[0], "__dict__")
+        assert rows[0].as_dict() == {
+            "entity_id": "42",
+            "entity_type": "campaign",
+            "date": "2024-01-02",
+            "impressions": 1000,
+            "clicks": 50,
+            "conversions": 4,
+            "spend": 12.5,
+            "spend_currency": "USD",
+            "revenue": None,
+            "revenue_currency": None,
+        }
+
+
+class _FakeBatch:
+    """In-memory stand-in for a Graph API batch."""
+
+    def __init__(self, bodies: dict[str, dict]):
+        self.bodies = bodies
+        self.requests = []
+
+    def add(self, entity_id, success, failure):
+        self.requests.append((entity_id, success, failure))
+
+    def execute(self):
+        for entity_id, success, _ in self.requests:
+            success(SimpleNamespace(json=lambda eid=entity_id: self.bodies[eid]))
+        return None
+
+
+class TestMetaAdsConnector:
+    """Tests for MetaAdsConnector."""
+
+    async def test_iter_edges_runs_chunks_concurrently(self, test_settings):
+        """Test chunks are fetched in parallel on the connector's own threads."""
+        connector = MetaAdsConnector(test_settings)
+        barrier = threading.Barrier(2, timeout=5)
+        thread_names = []
+
+        def run_chunk(chunk: list[str]) -> dict:
+            barrier.wait()
+            thread_names.append(threading.current_thread().name)
+            return {eid: {"data": [eid]} for eid in chunk}
+
+        entity_ids = [str(i) for i in range(60)]
+        results = dict(
+            [pair async for pair in connector._iter_edges(run_chunk, list, entity_ids)]
+        )
+
+        assert results == {eid: [eid] for eid in entity_ids}
+        assert all(name.startswith("meta-sdk") for name in thread_names)
+
+    async def test_iter_edges_yields_chunk_failures(self, test_settings):
+        """Test a failed chunk is reported for each of its entities."""
+        connector = MetaAdsConnector(test_settings)
+
+        def run_chunk(chunk: list[str]) -> dict:
+            raise ValueError("boom")
+
+        results = [pair async for pair in connector._iter_edges(run_chunk, list, ["a", "b"])]
+
+        assert [entity_id for entity_id, _ in results] == ["a", "b"]
+        assert all(isinstance(error, ValueError) for _, error in results)
+
+    async def test_iter_edges_batches_requests(self, test_settings):
+        """Test edges are fetched in batches and multi-page edges re-fetched."""
+        connector = MetaAdsConnector(test_settings)
+        entity_ids = [str(i) for i in range(60)]
+        bodies = {eid: {"data": [{"id": f"{eid}-1"}]} for eid in entity_ids}
+        bodies["7"]["paging"] = {"next": "https://graph.facebook.com/next"}
+        batches = []
+
+        def new_batch():
+            batches.append(_FakeBatch(bodies))
+            return batches[-1]
+
+        connector._api = MagicMock()
+        connector._api.new_batch.side_effect = new_batch
+
+        def add_request(entity_id, batch, success, failure):
+            batch.add(entity_id, success, failure)
+
+        edges = connector._iter_edges(
+            partial(connector._run_batch, add_request),
+            lambda eid: [{"id": f"{eid}-1"}, {"id": f"{eid}-2"}],
+            entity_ids,
+        )
+        results = dict([pair async for pair in edges])
+
+        assert [len(b.requests) for b in batches] == [50, 10]
+        assert results["0"] == [{"id": "0-1"}]
+        assert len(results["7"]) == 2
+
+    def test_run_batch_caps_retries_for_unanswered_requests(self, test_settings):
+        """Test sub-requests Meta never answers end as errors, not a loop."""
+
+        class _DroppingBatch(_FakeBatch):
+            executions = 0
+
+            def execute(self):
+                _DroppingBatch.executions += 1
+                for entity_id, success, _ in self.requests:
+                    if entity_id != "2":
+                        success(SimpleNamespace(json=lambda eid=entity_id: self.bodies[eid]))
+                return self
+
+        connector = MetaAdsConnector(test_settings)
+        connector._api = MagicMock()
+        connector._api.new_batch.return_value = _DroppingBatch(
+            {eid: {"data": [eid]} for eid in ("1", "2")}
+        )
+
+        def add_request(entity_id, batch, success, failure):
+            batch.add(entity_id, success, failure)
+
+        with patch("src.connectors.meta_ads.time.sleep") as sleep:
+            responses = connector._run_batch(add_request, ["1", "2"])
+
+        attempts = test_settings.RETRY_MAX_ATTEMPTS
+        assert _DroppingBatch.executions == attempts + 1
+        assert sleep.call_count == attempts
+        assert responses["1"] == {"data": ["1"]}
+        assert isinstance(responses["2"], TemporaryError)
+
+    def test_iterators_require_authentication(self, test_settings):
+        """Test entity iterators refuse to start before authenticate()."""
+        connector = MetaAdsConnector(test_settings)
+
+        with pytest.raises(AuthenticationError):
+            connector.iter_campaigns("123", date(2024, 1, 1), date(2024, 1, 31))
+
+    async def test_aclose_releases_session(self, test_settings):
+        """Test aclose closes the SDK's HTTP session and resets auth state."""
+        connector = MetaAdsConnector(test_settings)
+        api = MagicMock()
+        connector._api = api
+        connector._is_authenticated = True
+
+        await connector.aclose()
+
+        api._session.requests.close.assert_called_once()
+        assert connector._api is None
+        assert connector._executor is None
+        assert not connector.is_authenticated
+
+    async def test_async_context_manager_closes_connector(self, test_settings):
+        """Test leaving an async with block releases the connector."""
+        connector = MetaAdsConnector(test_settings)
+        connector._api = MagicMock()
+
+        async with connector as entered:
+            assert entered is connector
+
+        assert connector._api is None
+
+    async def test_background_sync_closes_connector_on_failure(self, test_settings):
+        """Test the API's background sync releases the connector even when it fails."""
+        from unittest.mock import AsyncMock
+
+        pytest.importorskip("multipart")  # The ingest routes take form uploads
+        from src.api.routes.ingest import _run_sync
+
+        connector = MetaAdsConnector(test_settings)
+        connector.sync_all = AsyncMock(side_effect=RuntimeError("boom"))
+        connector.aclose = AsyncMock()
+
+        await _run_sync(
+            connector, "123", "client-1", date(2024, 1, 1), date(2024, 1, 31), MagicMock()
+        )
+
+        connector.aclose.assert_awaited_once()
+
+    def test_run_ids_query_reads_edge_per_entity(self, test_settings):
+        """Test one ids= request returns each entity's edge body."""
+        connector = MetaAdsConnector(test_settings)
+        connector._api = MagicMock()
+        connector._api.call.return_value.json.return_value = {
+            "1": {"id": "1", "insights": {"data": [{"spend": "1.00"}]}},
+            "2": {"id": "2"},
+        }
+
+        result = connector._run_ids_query("insights", "insights{spend}", ["1", "2"])
+
+        connector._api.call.assert_called_once_with(
+            "GET", ("",), params={"ids": "1,2", "fields": "insights{spend}"}
+        )
+        assert result == {"1": {"data": [{"spend": "1.00"}]}, "2": {}}
+
+    def test_transform_to_graph_format(self, test_settings):
+        """Test rows are transformed in place unless a copy is requested."""
+        connector = MetaAdsConnector(test_settings)
+        row = {"id": "123", "name": "Campaign"}
+
+        copied = connector.transform_to_graph_format(row, "campaign", "client-1", copy=True)
+        transformed = connector.transform_to_graph_format(row, "campaign", "client-1")
+
+        assert copied is not row
+        assert transformed is row
+        assert row == {
+            "id": "123",
+            "name": "Campaign",
+            "client_id": "client-1",
+            "channel": "meta",
+            "external_id": "123",
+        }
+
+    @pytest.mark.parametrize(
+        ("creative", "expected"),
+        [
+            (None, "image"),
+            ({"id": "1", "object_type": "PHOTO"}, "image"),
+            ({"id": "1", "video_id": "99"}, "video"),
+            ({"id": "1", "object_type": "VIDEO"}, "video"),
+            (
+                {"object_story_spec": {"link_data": {"child_attachments": [{}, {}]}}},
+                "carousel",
+            ),
+            ({"id": "1", "name": "Spring Carousel"}, "carousel"),
+            ({"id": "1", "name": "Carousel with VIDEO"}, "video"),
+        ],
+    )
+    def test_creative_type(self, creative, expected):
+        """Test creative type is read from structured creative fields."""
+        assert _creative_type(creative) == expected
+
+    def test_budget(self):
+        """Test budgets are read from cents, preferring the daily budget."""
+        assert _budget("1029", "50000") == 10.29
+        assert _budget(None, "50000") == 500.0
+        assert _budget(None, None) == 0
+
+    def test_iso_date(self):
+        """Test Graph API timestamps are cut to their date part."""
+        assert _iso_date("2024-03-01T00:00:00-0800") == "2024-03-01"
+        assert _iso_date(None) is None
+        assert _iso_date("") is None
+
+
+class TestMetaRateLimiter:
+    """Tests for Meta usage-header driven pacing."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, 0.0),
+            ({"x-app-usage": '{"call_count": 40, "total_time": 10}'}, 0.0),
+            ({"x-app-usage": '{"call_count": 100}'}, 60.0),
+            (
+                {
+                    "x-business-use-case-usage": (
+                        '{"123": [{"type": "ads_insights", "call_count": 80,'
+                        ' "estimated_time_to_regain_access": 2}]}'
+                    )
+                },
+                120.0,
+            ),
+        ],
+    )
+    def test_usage_pause(self, headers, expected):
+        """Test pause length derived from usage headers."""
+        assert _usage_pause(headers) == expected
+
+    def test_on_response_defers_requests(self):
+        """Test high usage pushes back the next request."""
+        limiter = MetaRateLimiter(max_rate=10, max_concurrency=2)
+
+        limiter.on_response(SimpleNamespace(headers={"x-app-usage": '{"call_count": 90}'}))
+
+        assert limiter._resume_at > 0
+
+    def test_on_response_ignores_malformed_headers(self):
+        """Test unparseable usage headers do not break the request."""
+        limiter = MetaRateLimiter(max_rate=10, max_concurrency=2)
+
+        limiter.on_response(SimpleNamespace(headers={"x-app-usage": "not json"}))
+
+        assert limiter._resume_at == 0.0
+
+    async def test_limits_concurrency(self):
+        """Test no more than max_concurrency requests are in flight."""
+        limiter = MetaRateLimiter(max_rate=100, max_concurrency=2)
+        in_flight = peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
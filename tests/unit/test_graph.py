@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from neo4j import RoutingControl
+
 from src.graph.schema import (
     CampaignObjective,
     CampaignStatus,
@@ -38,7 +40,10 @@ class TestGraphSchema:
         schema = GraphSchema()
         statements = schema.get_all_statements()
 
-        assert len(statements) == len(schema.CONSTRAINTS) + len(schema.INDEXES)
+        assert len(statements) == (
+            len(schema.CONSTRAINTS) + len(schema.INDEXES) + len(schema.FULLTEXT_INDEXES)
+        )
+        assert any("CREATE FULLTEXT INDEX entity_name_ft" in s for s in statements)
 
     def test_client_constraint_exists(self):
         """Test that client uniqueness constraint exists."""
@@ -55,6 +60,147 @@ class TestGraphSchema:
 
         # Should have indexes on client_id and date for isolation and filtering
         assert len(metric_indexes) >= 2
+        assert any("(m.client_id, m.date)" in i for i in metric_indexes)
+
+    def test_composite_indexes_lead_with_client_id(self):
+        """Test multi-predicate indexes put the equality column first and range last."""
+        indexes = " ".join(GraphSchema().INDEXES)
+
+        assert "ON (m.client_id, m.entity_type, m.entity_id)" in indexes
+        assert "ON (a.client_id, a.timestamp)" in indexes
+        assert "ON (c.client_id, c.status)" in indexes
+
+    def test_query_index_hints_match_schema(self):
+        """Test every USING INDEX hint names an index the schema creates."""
+        import re
+
+        from src.graph.queries import CypherQueries
+
+        indexes = {
+            (label, re.sub(rf"\b{var}\.", "", props))
+            for index in GraphSchema().INDEXES
+            for var, label, props in re.findall(r"FOR \((\w+):(\w+)\) ON \((.+?)\)", index)
+        }
+        queries = [q for q in vars(CypherQueries).values() if isinstance(q, str)]
+        hints = {
+            hint for q in queries for hint in re.findall(r"USING INDEX \w+:(\w+)\((.+?)\)", q)
+        }
+
+        assert hints
+        assert hints <= indexes
+
+    def test_enums_format_as_their_values(self):
+        """Test enum members render as their raw values in query text and logs."""
+        assert str(NodeLabel.CLIENT) == "Client"
+        assert f"{RelationType.HAS_METRIC}" == "HAS_METRIC"
+        assert CampaignStatus.ACTIVE == "active"
+
+    def test_apply_runs_missing_statements_in_one_transaction(self):
+        """Test apply queues every missing statement in a single write transaction."""
+        schema = GraphSchema()
+        session = MagicMock()
+        session.run.side_effect = [[{"name": "metric_date"}], [{"name": "client_id"}]]
+
+        created = schema.apply(session)
+
+        assert created == len(schema.get_all_statements()) - 2
+        work, statements = session.execute_write.call_args.args
+        tx = MagicMock()
+        work(tx, statements)
+        assert tx.run.call_count == created
+        tx.run.return_value.consume.assert_not_called()
+        assert schema.is_verified
+
+    def test_apply_leaves_schema_unverified_when_batch_fails(self):
+        """Test statements retried one by one do not mark the schema verified."""
+        schema = GraphSchema()
+        session = MagicMock()
+        session.run.side_effect = [[], [], *[None] * len(schema.get_all_statements())]
+        session.execute_write.side_effect = RuntimeError("schema lock")
+
+        assert not schema.is_verified
+        schema.apply(session)
+
+        assert not schema.is_verified
+
+    def test_node_properties_are_read_only_and_cached(self):
+        """Test node property definitions are built once and cannot be mutated."""
+        from src.graph import schema
+
+        properties = schema.get_node_properties()
+
+        assert schema.get_node_properties() is properties
+        assert schema.NODE_PROPERTIES is properties
+        assert properties[NodeLabel.CLIENT]["id"] == "string (UUID)"
+        with pytest.raises(TypeError):
+            properties[NodeLabel.CLIENT]["id"] = "int"
+
+    def test_missing_statements_diffs_by_object_name(self):
+        """Test only statements for objects absent from the database are returned."""
+        schema = GraphSchema()
+
+        assert "client_id" in schema.expected_constraint_names()
+        assert {"metric_date", "entity_name_ft"} <= schema.expected_index_names()
+        assert schema.missing_statements(set()) == schema.get_all_statements()
+
+        existing = schema.expected_constraint_names() | schema.expected_index_names()
+        assert schema.missing_statements(existing) == []
+
+        missing = schema.missing_statements(existing - {"metric_date"})
+        assert len(missing) == 1
+        assert schema.object_name(missing[0]) == "metric_date"
+
+
+class TestCypherQueries:
+    """Tests for Cypher query templates."""
+
+    def test_search_queries_use_fulltext_index(self):
+        """Test entity search probes the full-text index, scoped to the client."""
+        from src.graph.queries import CypherQueries
+
+        for query in (CypherQueries.SEARCH_CAMPAIGNS_BY_NAME, CypherQueries.SEARCH_ALL_ENTITIES):
+            assert "db.index.fulltext.queryNodes('entity_name_ft'" in query
+            assert "node.client_id = $client_id" in query
+            assert "toLower" not in query
+
+    def test_campaign_full_context_avoids_optional_match_chain(self):
+        """Test campaign context collects children without crossing them with metrics."""
+        from src.graph.queries import CypherQueries
+
+        query = CypherQueries.GET_CAMPAIGN_FULL_CONTEXT
+
+        assert "OPTIONAL MATCH (camp)-[:CONTAINS]" not in query
+        assert "OPTIONAL MATCH (adset)-[:CONTAINS]" not in query
+        assert query.index("AS metrics") < query.index("AS adsets")
+
+    def test_date_parameters_are_not_parsed_in_cypher(self):
+        """Test queries take date parameters as-is instead of parsing strings."""
+        from src.graph.queries import CypherQueries
+
+        queries = [q for q in vars(CypherQueries).values() if isinstance(q, str)]
+
+        assert any("$start_date" in q for q in queries)
+        assert not any("date($start_date)" in q or "date($end_date)" in q for q in queries)
+
+    def test_escape_fulltext(self):
+        """Test Lucene syntax in a search term is escaped and operators defused."""
+        from src.graph.queries import escape_fulltext
+
+        assert escape_fulltext("Summer Sale") == "summer sale"
+        assert escape_fulltext("a+b (c)") == r"a\+b \(c\)"
+        assert escape_fulltext("x AND y*") == r"x and y\*"
+
+    def test_build_dynamic_query_is_order_independent(self):
+        """Test the same filter set yields the same query text in any order."""
+        from src.graph.queries import build_dynamic_query
+
+        base = "MATCH (n:Campaign)"
+        query, params = build_dynamic_query(base, {"status": "active", "channel": "meta"})
+        same, _ = build_dynamic_query(base, {"channel": "meta", "status": "active", "x": None})
+
+        assert same is query
+        assert query == f"{base} WHERE n.channel = $filter_channel AND n.status = $filter_status"
+        assert params == {"filter_channel": "meta", "filter_status": "active"}
 
 
 class TestNodeLabel:
@@ -122,27 +268,250 @@ class TestCampaignObjective:
 class TestDataIngester:
     """Tests for DataIngester."""
 
+    @staticmethod
+    def _write_all_rows(client):
+        """Make child upserts report every row as written."""
+        client.execute_scalar.side_effect = lambda query, params, key: [
+            row["id"] for row in params["rows"]
+        ]
+
     @pytest.fixture
     def ingester(self, mock_neo4j_client):
         """Create ingester with mock client."""
         from src.graph.ingest import DataIngester
 
-        mock_neo4j_client.execute_query.return_value = [{"id": "test-id"}]
+        self._write_all_rows(mock_neo4j_client)
         return DataIngester(mock_neo4j_client)
 
     def test_ingest_client(self, ingester, sample_client_data):
-        """Test client ingestion."""
+        """Test client ingestion returns the ID without fetching records."""
         result = ingester.ingest_client(sample_client_data)
 
-        assert result == "test-id"
-        ingester._client.execute_query.assert_called_once()
+        query, _ = ingester._client.execute_write.call_args.args
+        assert result == sample_client_data["id"]
+        assert "RETURN" not in query
+        ingester._client.execute_query.assert_not_called()
 
     def test_ingest_campaign(self, ingester, sample_campaign_data, sample_client_data):
         """Test campaign ingestion."""
         result = ingester.ingest_campaign(sample_campaign_data, sample_client_data["id"])
 
-        assert result == "test-id"
-        ingester._client.execute_query.assert_called()
+        assert result == sample_campaign_data["id"]
+        ingester._client.execute_scalar.assert_called_once()
+
+    def test_ingest_campaigns_bulk(self, ingester, sample_campaign_data):
+        """Test many campaigns are merged in one UNWIND query."""
+        campaigns = [{**sample_campaign_data, "id": "a"}, {**sample_campaign_data, "id": "b"}]
+
+        result = ingester.ingest_campaigns(campaigns, "client-1")
+
+        query, params, _ = ingester._client.execute_scalar.call_args.args
+        assert result == ["a", "b"]
+        assert "UNWIND $rows AS row" in query
+        assert "datetime()" in query and "$now" not in query
+        assert list(params) == ["rows"]
+        assert [row["client_id"] for row in params["rows"]] == ["client-1", "client-1"]
+        assert "MERGE (ch:Channel {name: row.channel})" in query
+        assert "WITH c, row" not in query
+        assert query.endswith("RETURN collect(n.id) AS ids\n")
+        ingester._client.execute_scalar.assert_called_once()
+
+    def test_ingest_campaigns_channel_display_names(self, ingester, caplog):
+        """Test channel display names come from the shared mapping, with no channel allowed."""
+        campaigns = [
+            {"id": "a", "name": "A", "start_date": "2024-01-01", "channel": "google_ads"},
+            {"id": "b", "name": "B", "start_date": "2024-01-01", "channel": "tiktok"},
+            {"id": "c", "name": "C", "start_date": "2024-01-01", "channel": None},
+        ]
+
+        with caplog.at_level("WARNING", logger="src.graph.ingest"):
+            result = ingester.ingest_campaigns(campaigns, "client-1")
+
+        query, params, _ = ingester._client.execute_scalar.call_args.args
+        assert result == ["a", "b", "c"]
+        assert [row["channel_display_name"] for row in params["rows"]] == [
+            "Google Ads",
+            "tiktok",
+            None,
+        ]
+        assert "WHERE row.channel IS NOT NULL" in query
+        assert "['tiktok']" in caplog.text
+
+    def test_ingest_children_skip_rows_without_parent(self, ingester, caplog):
+        """Test rows dropped by the parent MATCH are logged and not reported."""
+        ads = [
+            {"id": "ad-1", "name": "A", "adset_id": "set-1"},
+            {"id": "ad-2", "name": "B", "adset_id": "set-missing"},
+        ]
+        ingester._client.execute_scalar.side_effect = None
+        ingester._client.execute_scalar.return_value = ["ad-1"]
+
+        with caplog.at_level("ERROR", logger="src.graph.ingest"):
+            result = ingester.ingest_ads(ads, "client-1")
+
+        assert result == ["ad-1"]
+        assert "['set-missing']" in caplog.text
+        with pytest.raises(ValueError, match="Ad set set-missing does not exist"):
+            ingester.ingest_ad(ads[1], "set-missing", "client-1")
+
+    def test_ingest_ads_bulk_uses_row_parents(self, ingester):
+        """Test bulk ads attach to each row's own ad set and client."""
+        ads = [
+            {"id": "ad-1", "name": "A", "adset_id": "set-1", "client_id": "c-1"},
+            {"id": "ad-2", "name": "B", "adset_id": "set-2", "client_id": "c-1"},
+        ]
+
+        ingester.ingest_ads(ads)
+
+        query, params, _ = ingester._client.execute_scalar.call_args.args
+        assert "MATCH (parent:AdSet {id: row.adset_id})" in query
+        assert [row["adset_id"] for row in params["rows"]] == ["set-1", "set-2"]
+
+    def test_ingest_all_levels_in_order_metrics_alongside(self, mock_neo4j_client):
+        """Test ingest_all writes hierarchy levels in order and metrics per entity."""
+        from src.graph.ingest import DataIngester
+
+        # Resolved up front; auto-creating child mocks from worker threads races
+        bulk = mock_neo4j_client.bulk_session.return_value.__enter__.return_value
+        self._write_all_rows(mock_neo4j_client)
+        ingester = DataIngester(mock_neo4j_client, chunk_size=2)
+        data = {
+            "campaigns": [
+                {"id": f"camp-{i}", "name": "C", "start_date": "2024-01-01"} for i in range(3)
+            ],
+            "adsets": [{"id": "set-1", "name": "S", "campaign_id": "camp-0"}],
+            "ads": [],
+            "metrics": [
+                {"entity_type": "campaign", "entity_id": "camp-0", "date": "2024-01-01"},
+                {"entity_type": "campaign", "entity_id": "camp-0", "date": "2024-01-02"},
+                {"entity_type": "adset", "entity_id": "set-1", "date": "2024-01-01"},
+            ],
+        }
+
+        counts = ingester.ingest_all(data, "client-1")
+
+        hierarchy = [call.args[0] for call in mock_neo4j_client.execute_scalar.call_args_list]
+        assert counts == {"campaigns": 3, "adsets": 1, "ads": 0, "metrics": 3}
+        assert ["AdSet {id: row.id}" in q for q in hierarchy] == [False, False, True]
+        assert bulk.write.call_count == 2
+
+    def test_ingest_all_hierarchy_does_not_queue_behind_metrics(self, mock_neo4j_client):
+        """Test hierarchy writes proceed while every metric worker is busy."""
+        import threading
+
+        from src.graph.ingest import DataIngester
+
+        ads_written = threading.Event()
+
+        def write_children(query, params, key):
+            if "MERGE (n:Ad {id: row.id})" in query:
+                ads_written.set()
+            return [row["id"] for row in params["rows"]]
+
+        def write_metrics(query, params):
+            assert ads_written.wait(timeout=5)
+            return {}
+
+        mock_neo4j_client.execute_scalar.side_effect = write_children
+        bulk = mock_neo4j_client.bulk_session.return_value.__enter__.return_value
+        bulk.write.side_effect = write_metrics
+        data = {
+            "campaigns": [{"id": "camp-0", "name": "C", "start_date": "2024-01-01"}],
+            "adsets": [{"id": "set-0", "name": "S", "campaign_id": "camp-0"}],
+            "ads": [{"id": "ad-0", "name": "A", "adset_id": "set-0"}],
+            "metrics": [
+                {"entity_type": "ad", "entity_id": f"ad-{i}", "date": "2024-01-01"}
+                for i in range(4)
+            ],
+        }
+
+        counts = DataIngester(mock_neo4j_client).ingest_all(data, "client-1", max_workers=2)
+
+        assert counts == {"campaigns": 1, "adsets": 1, "ads": 1, "metrics": 4}
+
+    def test_ingest_metric_columns_accepts_mock_soa(self, mock_neo4j_client):
+        """Test generated metric columns are sent as native parallel lists."""
+        from src.connectors.mock_data import MockDataGenerator
+        from src.graph.ingest import DataIngester
+
+        columns = MockDataGenerator(seed=1).generate_metrics_soa("camp-1", days=3)
+        ingester = DataIngester(mock_neo4j_client)
+
+        bulk = MagicMock()
+        result = ingester.ingest_metric_columns(columns, "campaign", "camp-1", "client-1", bulk)
+
+        mock_neo4j_client.bulk_session.assert_not_called()
+        query, params = bulk.write.call_args.args
+        assert result == 3
+        assert "UNWIND range(0, size($ids) - 1) AS i" in query
+        assert params["ids"] == columns["id"].tolist()
+        assert type(params["ids"][0]) is str and type(params["clicks"][0]) is int
+        assert all(type(value) is float for value in params["revenue"] + params["roas"])
+        assert params["spend_currency"] == ["USD"] * 3
+
+    def test_metric_columns_pandas_path_matches_small_path(self):
+        """Test large batches coerced through pandas match the per-row path."""
+        from datetime import date
+
+        import numpy as np
+
+        from src.graph.ingest import _metric_columns, _metric_frame_columns
+
+        rows = [
+            {"date": "2024-01-01", "impressions": 5, "clicks": 1, "spend": 2, "revenue": None},
+            {"id": "x", "date": date(2024, 1, 2), "clicks": "3", "revenue": 4.0},
+            {"id": "", "date": "2024-01-03", "spend_currency": "EUR", "revenue_currency": "EUR"},
+        ]
+
+        small = _metric_columns(rows, "e")
+        large = _metric_frame_columns(rows, "e")
+
+        assert small.keys() == large.keys()
+        for name, column in small.items():
+            if isinstance(column, np.ndarray):
+                assert large[name].dtype == column.dtype
+                np.testing.assert_array_equal(large[name], column)
+            else:
+                assert large[name] == column
+
+    def test_ingest_applies_defaults_without_mutating_input(self, ingester):
+        """Test missing fields take defaults, values are coerced and input is untouched."""
+        ad = {"id": "ad-1", "name": "A", "adset_id": "set-1"}
+
+        ingester.ingest_ads([ad], "client-1")
+
+        _, params, _ = ingester._client.execute_scalar.call_args.args
+        row = params["rows"][0]
+        assert row["client_id"] == "client-1"
+        assert (row["headline"], row["creative_type"], row["status"]) == ("", "image", "active")
+        assert ad == {"id": "ad-1", "name": "A", "adset_id": "set-1"}
+
+    def test_build_upsert_sets_create_only_props_on_create(self):
+        """Test generated upserts refresh only the always-set properties on match."""
+        from src.graph.ingest import _build_upsert
+
+        query = _build_upsert(
+            NodeLabel.AD_SET,
+            always=("name",),
+            create_only=("client_id",),
+            expressions={"name": "trim(row.name)"},
+            parent=(NodeLabel.CAMPAIGN, "campaign_id", RelationType.CONTAINS),
+        )
+
+        on_create, on_match = query.split("ON MATCH SET")
+        assert query.startswith(
+            "UNWIND $rows AS row\nMATCH (parent:Campaign {id: row.campaign_id})"
+        )
+        assert "n.client_id = row.client_id" in on_create
+        assert "n.client_id" not in on_match
+        assert "n.name = trim(row.name)" in on_match
+        assert "n.created_at = datetime()" in on_create and "created_at" not in on_match
+        assert "MERGE (parent)-[:CONTAINS]->(n)\nRETURN collect(n.id) AS ids\n" in query
+
+    def test_ingest_bulk_empty_skips_query(self, ingester):
+        """Test an empty batch makes no round-trip."""
+        assert ingester.ingest_adsets([]) == []
+        ingester._client.execute_scalar.assert_not_called()
 
     def test_ingest_metrics(self, ingester, sample_metrics_data, sample_campaign_data, sample_client_data):
         """Test metrics ingestion."""
@@ -154,3 +523,314 @@ class TestDataIngester:
         )
 
         assert result == len(sample_metrics_data)
+
+    def test_derived_metrics(self):
+        """Test CTR, CPC, CPM and ROAS are derived with zero-denominator guards."""
+        import numpy as np
+
+        from src.graph.ingest import _derived_metric_columns
+
+        derived = _derived_metric_columns(
+            np.array([1000, 0, 200]),
+            np.array([50, 0, 10]),
+            np.array([100.0, 0.0, 20.0]),
+            np.array([400.0, np.nan, np.nan]),
+        )
+
+        assert derived["ctr"].tolist() == [5.0, 0.0, 5.0]
+        assert derived["cpc"].tolist() == [2.0, 0.0, 2.0]
+        assert derived["cpm"].tolist() == [100.0, 0.0, 100.0]
+        assert derived["roas"][0] == 4.0
+        assert np.isnan(derived["roas"][1:]).all()
+
+    def test_ingest_metrics_in_chunks(self, mock_neo4j_client):
+        """Test metrics are written one transaction per chunk, skipping failed chunks."""
+        from neo4j.exceptions import TransientError
+
+        from src.graph.ingest import DataIngester
+
+        bulk = mock_neo4j_client.bulk_session.return_value.__enter__.return_value
+        bulk.write.side_effect = [{}, TransientError("busy"), {}]
+        ingester = DataIngester(mock_neo4j_client, chunk_size=2)
+        metrics = [{"date": f"2024-01-0{day}", "impressions": day} for day in range(1, 6)]
+
+        result = ingester.ingest_metrics(metrics, "campaign", "camp-1", "client-1")
+
+        mock_neo4j_client.bulk_session.assert_called_once()
+        mock_neo4j_client.execute_write.assert_not_called()
+        calls = bulk.write.call_args_list
+        chunks = [call.args[1] for call in calls]
+        assert [len(chunk["ids"]) for chunk in chunks] == [2, 2, 1]
+        assert chunks[0]["ids"][0] == "camp-1_2024-01-01"
+        assert chunks[2]["impressions"] == [5]
+        assert chunks[0]["revenue"] == [None, None] and chunks[0]["roas"] == [None, None]
+        assert "MERGE (w:MetricWeekly" in calls[0].args[0]
+        assert result == 3
+
+
+class TestNeo4jClient:
+    """Tests for Neo4jClient."""
+
+    @pytest.fixture
+    def client(self, test_settings):
+        """Create a client whose driver hands out a mock session."""
+        from src.graph.client import Neo4jClient
+
+        client = Neo4jClient(test_settings)
+        client.driver = MagicMock()
+        return client
+
+    def test_close_drops_cached_driver(self, test_settings):
+        """Test the driver is created once and recreated after close."""
+        from src.graph.client import Neo4jClient
+
+        client = Neo4jClient(test_settings)
+        with patch("src.graph.client.GraphDatabase.driver") as make_driver:
+            first = client.driver
+            assert client.driver is first
+
+            client.close()
+            client.close()
+
+            first.close.assert_called_once()
+            assert client.driver is not None
+            assert make_driver.call_count == 2
+
+    def test_execute_write_many_batches_rows(self, client):
+        """Test rows are written in UNWIND batches with summed counters."""
+        session = client.driver.session.return_value
+        tx = MagicMock()
+        tx.run.return_value.consume.return_value.counters = MagicMock(
+            nodes_created=2,
+            nodes_deleted=0,
+            relationships_created=1,
+            relationships_deleted=0,
+            properties_set=4,
+        )
+        session.execute_write.side_effect = lambda work, batch: work(tx, batch)
+        rows = [{"id": i} for i in range(5)]
+
+        result = client.execute_write_many("UNWIND $rows AS r MERGE (:N {id: r.id})", rows, 2)
+
+        batches = [call.kwargs["rows"] for call in tx.run.call_args_list]
+        assert batches == [rows[0:2], rows[2:4], rows[4:5]]
+        assert result["nodes_created"] == 6
+        assert result["relationships_created"] == 3
+        session.close.assert_called_once()
+
+    def test_bulk_session_reuses_one_session(self, client):
+        """Test bulk writes and queries share a single driver session."""
+        session = client.driver.session.return_value
+        session.run.return_value.consume.return_value.counters = MagicMock(
+            nodes_created=1,
+            nodes_deleted=0,
+            relationships_created=0,
+            relationships_deleted=0,
+            properties_set=2,
+        )
+        session.execute_write.return_value.counters = MagicMock(
+            nodes_created=3,
+            nodes_deleted=0,
+            relationships_created=0,
+            relationships_deleted=0,
+            properties_set=6,
+        )
+
+        with client.bulk_session() as bulk:
+            single = bulk.write("CREATE (:N {id: $id})", {"id": 1})
+            many = bulk.write_many("UNWIND $rows AS r CREATE (:N {id: r.id})", [{"id": 2}])
+
+        client.driver.session.assert_called_once_with(database="neo4j")
+        session.close.assert_called_once()
+        assert single["nodes_created"] == 1
+        assert many["nodes_created"] == 3
+
+    def test_get_client_data_streams_records(self, client):
+        """Test client data is shaped straight from streamed query records."""
+        records = {
+            "RETURN c\n": [{"c": {"id": "client-1"}}],
+            "RETURN camp": [{"camp": {"id": "camp-1"}}],
+            "RETURN adset": [{"adset": {"id": "adset-1"}, "campaign_id": "camp-1"}],
+            "RETURN a\n": [{"a": {"id": "ad-1"}}],
+            "RETURN m": [{"m": {"id": "m-1"}}, {"m": {"id": "m-2"}}],
+        }
+
+        def fake_iter_query(query, parameters=None, database="neo4j"):
+            for marker, rows in records.items():
+                if marker in query:
+                    yield from rows
+
+        client.iter_query = fake_iter_query
+
+        result = client.get_client_data("client-1")
+
+        assert result["client"] == {"id": "client-1"}
+        assert result["campaigns"] == [{"id": "camp-1"}]
+        assert result["ad_sets"] == records["RETURN adset"]
+        assert result["ads"] == [{"id": "ad-1"}]
+        assert result["metrics"] == [{"id": "m-1"}, {"id": "m-2"}]
+
+    def test_execute_read_routes_to_readers_with_timeout(self, client):
+        """Test read queries are routed to readers and bounded by the query timeout."""
+        record = MagicMock()
+        record.data.return_value = {"n": 1}
+        client.driver.execute_query.return_value = ([record], None, None)
+
+        result = client.execute_read("MATCH (n) RETURN n", {"x": 1})
+
+        (query, params), kwargs = client.driver.execute_query.call_args
+        assert result == [{"n": 1}]
+        assert query.text == "MATCH (n) RETURN n"
+        assert query.timeout == client._settings.QUERY_TIMEOUT_SECONDS
+        assert params == {"x": 1}
+        assert kwargs["routing_"] == RoutingControl.READ
+
+    def test_execute_scalar_decodes_only_first_value(self, client):
+        """Test a scalar query returns one value, or None without records."""
+        result = client.driver.session.return_value.run.return_value
+        result.single.return_value.value.return_value = 7
+
+        assert client.execute_scalar("RETURN 7 AS n", key="n") == 7
+        result.single.assert_called_once_with(strict=False)
+        result.single.return_value.value.assert_called_once_with("n")
+
+        result.single.return_value = None
+        assert client.execute_scalar("RETURN 1 LIMIT 0") is None
+
+    def test_initialize_schema_creates_only_missing_objects(self, client):
+        """Test existing schema objects are skipped and the rest created in one transaction."""
+        session = client.driver.session.return_value
+        session.run.side_effect = [
+            [{"name": "metric_date"}, {"name": "entity_name_ft"}],
+            [{"name": "client_id"}],
+        ]
+        client._create_channels = MagicMock()
+
+        client.initialize_schema()
+
+        assert [c.args[0] for c in session.run.call_args_list] == [
+            "SHOW INDEXES YIELD name",
+            "SHOW CONSTRAINTS YIELD name",
+        ]
+        work, statements = session.execute_write.call_args.args
+        assert len(statements) == len(client._schema.get_all_statements()) - 3
+        assert not any(" client_id " in s or " metric_date " in s for s in statements)
+        assert not any("entity_name_ft" in s for s in statements)
+        client._create_channels.assert_called_once()
+
+    def test_initialize_schema_skips_queries_once_verified(self, client):
+        """Test a repeat initialization in the same process issues no schema queries."""
+        session = client.driver.session.return_value
+        schema = client._schema
+        names = [{"name": schema.object_name(s)} for s in schema.get_all_statements()]
+        session.run.side_effect = [names, []]
+        client._create_channels = MagicMock()
+
+        client.initialize_schema()
+        client.initialize_schema()
+
+        assert session.run.call_count == 2
+        session.execute_write.assert_not_called()
+        assert client._create_channels.call_count == 2
+
+    def test_create_channels_always_sets_display_name(self, client):
+        """Test default channels overwrite display names set by earlier ingestion."""
+        from src.graph.schema import CHANNEL_DISPLAY_NAMES
+
+        client.execute_write_many = MagicMock()
+
+        client._create_channels()
+
+        query, rows = client.execute_write_many.call_args.args
+        assert "ON CREATE SET" not in query
+        assert "SET c.display_name = row.display_name" in query
+        assert {row["name"]: row["display_name"] for row in rows} == CHANNEL_DISPLAY_NAMES
+
+    def test_delete_client_data_sweeps_each_label(self, client):
+        """Test client deletion sweeps owned labels in batches, then the client."""
+        counters = {
+            "nodes_created": 0,
+            "nodes_deleted": 2,
+            "relationships_created": 0,
+            "relationships_deleted": 1,
+            "properties_set": 0,
+        }
+        client.execute_write = MagicMock(return_value=counters)
+
+        result = client.delete_client_data("client-1")
+
+        queries = [call.args[0] for call in client.execute_write.call_args_list]
+        assert len(queries) == 7
+        assert all("IN TRANSACTIONS OF 5000 ROWS" in q for q in queries[:-1])
+        assert "(n:Campaign {client_id: $client_id})" in "".join(queries)
+        assert "OPTIONAL MATCH" not in "".join(queries)
+        assert "Client {id: $client_id}" in queries[-1]
+        assert "(n:MetricWeekly {client_id: $client_id})" in "".join(queries)
+        assert result["nodes_deleted"] == 14
+
+    def test_cleanup_old_metrics_deletes_in_server_transactions(self, client):
+        """Test old metrics are deleted in one server-batched query."""
+        session = client.driver.session.return_value
+        session.run.return_value.single.return_value.value.return_value = 25000
+
+        deleted = client.cleanup_old_metrics("client-1", 365)
+
+        (query, params), (rollup_query, _) = [c.args for c in session.run.call_args_list]
+        assert deleted == 25000
+        assert "IN TRANSACTIONS OF 10000 ROWS" in query
+        assert "LIMIT" not in query
+        assert params == {"client_id": "client-1", "retention_days": 365}
+        assert "MetricWeekly" in rollup_query
+
+
+    def test_build_weekly_rollups_fills_only_missing_weeks(self, client):
+        """Test the rollup backfill sums daily rows for weeks without a rollup."""
+        session = client.driver.session.return_value
+        session.run.return_value.single.return_value.value.return_value = 12
+
+        built = client.build_weekly_rollups("client-1")
+
+        query, params = session.run.call_args.args
+        assert built == 12
+        assert params == {"client_id": "client-1"}
+        assert "MATCH (d:Metric {client_id: $client_id})" in query
+        assert "date.truncate('week', d.date) AS week" in query
+        assert "WHERE NOT EXISTS" in query
+        assert "IN TRANSACTIONS OF 1000 ROWS" in query
+
+
+class TestAsyncNeo4jClient:
+    """Tests for AsyncNeo4jClient."""
+
+    async def test_get_client_data_runs_queries_concurrently(self, test_settings):
+        """Test the client data queries overlap and are shaped like the sync client."""
+        import asyncio
+
+        from src.graph.client import AsyncNeo4jClient
+
+        client = AsyncNeo4jClient(test_settings)
+        in_flight = 0
+        peak = 0
+
+        async def fake_query(query, parameters=None, database="neo4j"):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "RETURN c\n" in query:
+                return [{"c": {"id": parameters["client_id"]}}]
+            if "RETURN m" in query:
+                return [{"m": {"id": "m1"}}]
+            return []
+
+        client.execute_query = fake_query
+
+        result = await client.get_client_data("client-1")
+        without_metrics = await client.get_client_data("client-1", include_metrics=False)
+
+        assert peak == 5
+        assert result["client"] == {"id": "client-1"}
+        assert result["metrics"] == [{"id": "m1"}]
+        assert "metrics" not in without_metrics
+
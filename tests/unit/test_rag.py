@@ -1,7 +1,9 @@
 """Unit tests for RAG components."""
 
+import bisect
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.rag.confidence import ConfidenceLevel, ConfidenceScore, ConfidenceScorer
 
@@ -44,11 +46,15 @@ class TestConfidenceScorer:
 
     def test_score_with_empty_context(self, scorer):
         """Test scoring with no data."""
+        scorer._compute_score = MagicMock()
+
         score = scorer.score("Test query", [], None)
 
         assert score.overall < 0.5
         assert score.level == ConfidenceLevel.INSUFFICIENT
         assert len(score.missing_data) > 0
+        assert set(score.factors.values()) == {0.0}
+        scorer._compute_score.assert_not_called()
 
     def test_score_with_limited_data(self, scorer):
         """Test scoring with limited data."""
@@ -82,6 +88,105 @@ class TestConfidenceScorer:
         assert scorer.should_refuse(low_score) is True
         assert scorer.should_refuse(high_score) is False
 
+    def test_confidence_score_is_immutable(self, scorer):
+        """Test cached scores cannot be modified by callers."""
+        from dataclasses import FrozenInstanceError
+
+        score = scorer.score("Test query", [])
+
+        assert not hasattr(score, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            score.overall = 1.0
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.6, 0.7])
+    def test_level_table_matches_threshold_ladder(self, threshold):
+        """Test the bisect table gives the same level as the threshold comparisons."""
+        thresholds, levels = ConfidenceScorer._level_table(threshold)
+
+        for overall in [0.0, 0.3, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 1.0]:
+            if overall >= 0.8:
+                expected = ConfidenceLevel.HIGH
+            elif overall >= 0.6:
+                expected = ConfidenceLevel.MEDIUM
+            elif overall >= threshold:
+                expected = ConfidenceLevel.LOW
+            else:
+                expected = ConfidenceLevel.INSUFFICIENT
+            assert levels[bisect.bisect_right(thresholds, overall)] == expected
+
+    def test_data_recency_checks_range_coverage(self, scorer):
+        """Test recency scores by whether dates reach either end of the range."""
+        context = [
+            {"date": "2024-07-05", "created_at": "2024-06-01"},
+            {"start_date": "2024-07-20"},
+            {"name": "No dates"},
+        ]
+
+        assert scorer._score_data_recency(context, ("2024-07-01", "2024-07-31")) == 0.2
+        assert scorer._score_data_recency(context, ("2024-08-01", "2024-08-31")) == 0.15
+        assert scorer._score_data_recency(context, None) == 0.15
+        assert scorer._score_data_recency([{"name": "No dates"}], None) == 0.1
+
+    def test_entity_types_from_fields_not_text(self, scorer):
+        """Test items are typed by their fields, not by words in their values."""
+        metric = {"entity_type": "campaign", "impressions": 100, "clicks": 5, "spend": 10}
+        campaign = {"id": "camp-1", "name": "Metric Boost", "objective": "sales"}
+        adset = {"entity_type": "adset", "name": "Retargeting"}
+
+        # Metrics carry the type of the entity they measure; they still count as metrics
+        assert scorer._score_data_completeness([metric]) == pytest.approx(0.15)
+        assert scorer._score_source_diversity([metric]) == pytest.approx(0.025)
+        assert scorer._score_source_diversity([metric, campaign, adset]) == pytest.approx(0.075)
+
+    def test_query_specificity_matches_terms_in_one_pass(self, scorer):
+        """Test overlapping query terms are all found, numeric values included."""
+        from src.rag.confidence import _matched_terms, _searchable_text
+
+        context = [{"name": "Summer Campaigns", "status": "active", "spend": 1234}]
+        text = _searchable_text(context)
+
+        assert "1234" in text
+        assert "spend" in text
+        terms = {"campaign", "campaigns", "paign", "spend", "1234", "winter"}
+        assert _matched_terms(terms, text) == {t for t in terms if t in str(context).lower()}
+        assert scorer._score_query_specificity("summer campaigns spend", context) == 0.2
+
+    def test_query_specificity_matches_numeric_values(self, scorer):
+        """Test numbers in the query match numeric context values, as str(context) did."""
+        context = [{"id": "c1", "name": "Spring", "budget": 5000}]
+
+        score = scorer._score_query_specificity("campaigns with budget 5000", context)
+
+        # "budget" and "5000" match, "campaigns" and "with" do not
+        assert score == pytest.approx(2 / 4 * 0.25)
+
+    def test_get_confidence_scorer_is_singleton(self, test_settings):
+        """Test the shared scorer is built once."""
+        from src.rag import confidence
+
+        with patch.object(confidence, "_scorer", None), patch.object(
+            confidence, "get_settings", return_value=test_settings
+        ) as get_settings:
+            scorer = confidence.get_confidence_scorer()
+            assert confidence.get_confidence_scorer() is scorer
+            get_settings.assert_called_once()
+
+    def test_score_is_cached_by_context_fingerprint(self, scorer):
+        """Test repeat scoring hits the cache until the context changes or is cleared."""
+        context = [{"id": "camp-1", "name": "Test", "updated_at": "2024-07-01"}]
+        scorer._compute_score = MagicMock(wraps=scorer._compute_score)
+
+        first = scorer.score("Test query", context)
+        assert scorer.score("Test query", [dict(context[0])]) is first
+        assert scorer._compute_score.call_count == 1
+
+        scorer.score("Test query", [{**context[0], "updated_at": "2024-07-02"}])
+        assert scorer._compute_score.call_count == 2
+
+        scorer.clear_cache()
+        scorer.score("Test query", context)
+        assert scorer._compute_score.call_count == 3
+
     def test_format_confidence_for_response(self, scorer):
         """Test confidence formatting."""
         score = ConfidenceScore(
@@ -170,6 +275,283 @@ class TestRetrieval:
         assert "Test" in formatted
         assert "campaign" in formatted.lower()
 
+    def test_retrieve_overlaps_metric_scan_with_entity_lookup(self, retriever):
+        """Test the metric scan starts before entity retrieval finishes."""
+        import threading
+
+        metrics_started = threading.Event()
+
+        def fetch_metrics(client_id, date_range):
+            metrics_started.set()
+            return [{"entity_id": "camp-1"}, {"entity_id": "camp-2"}]
+
+        def retrieve_entities(query, client_id, query_intent):
+            assert metrics_started.wait(timeout=5)
+            return [{"id": "camp-1", "entity_type": "campaign"}]
+
+        retriever._fetch_metrics = fetch_metrics
+        retriever._retrieve_entities = retrieve_entities
+        retriever._retrieve_relationships = MagicMock(return_value=[{"campaign_id": "camp-1"}])
+
+        context = retriever.retrieve("How is camp-1 doing?", "client-123")
+
+        assert context.metrics == [{"entity_id": "camp-1"}]
+        assert context.relationships == [{"campaign_id": "camp-1"}]
+        retriever._retrieve_relationships.assert_called_once_with("client-123", ["camp-1"])
+
+    def test_filter_metrics_keeps_all_when_no_entity_matches(self, retriever):
+        """Test metric filtering falls back to every metric."""
+        metrics = [{"entity_id": "camp-1"}, {"entity_id": "camp-2"}]
+
+        assert retriever._filter_metrics(metrics, ["camp-2"]) == [{"entity_id": "camp-2"}]
+        assert retriever._filter_metrics(metrics, ["camp-9"]) == metrics
+        assert retriever._filter_metrics(metrics, []) == metrics
+
+
+class TestConversationMemory:
+    """Tests for ConversationMemory."""
+
+    def test_turns_and_sessions_are_bounded(self):
+        """Test old turns and the least recently active sessions are dropped."""
+        from src.rag.engine import ConversationMemory
+
+        memory = ConversationMemory(max_turns=2, max_sessions=2)
+        for i in range(3):
+            memory.add_turn("s-1", f"q{i}", f"a{i}", MagicMock())
+        memory.add_turn("s-2", "q", "a", MagicMock())
+        memory.add_turn("s-1", "q3", "a3", MagicMock())
+        memory.add_turn("s-3", "q", "a", MagicMock())
+
+        assert [t["query"] for t in memory.get_history("s-1")] == ["q2", "q3"]
+        assert memory.get_history("s-2") == []
+        assert memory.get_last_context("s-3") is not None
+
+
+class TestGraphRAGEngine:
+    """Tests for GraphRAGEngine."""
+
+    @pytest.fixture
+    def engine(self, mock_neo4j_client, test_settings):
+        """Create engine with mock retrieval and Claude clients."""
+        from src.rag.engine import GraphRAGEngine
+        from src.rag.retrieval import RetrievalContext
+
+        engine = GraphRAGEngine(mock_neo4j_client, test_settings)
+        engine._retriever = MagicMock()
+        engine._retriever.retrieve.return_value = RetrievalContext(
+            query="How are campaigns performing?",
+            client_id="client-123",
+            entities=[{"entity_type": "campaign", "id": "camp-1", "name": "Summer Sale"}],
+            metrics=[{"entity_id": "camp-1", "impressions": 1000, "clicks": 50}] * 10,
+            relationships=[],
+            date_range=("2024-07-01", "2024-07-31"),
+            metadata={"query_intent": {"query_type": "performance"}},
+        )
+        engine._retriever.format_context_for_llm.return_value = "context"
+        engine._confidence_scorer = MagicMock()
+        engine._confidence_scorer.should_refuse.return_value = False
+        return engine
+
+    @staticmethod
+    def _stream_factory(chunks_for, counters):
+        """Build a fake messages.stream returning the chunks for each request."""
+        import asyncio
+
+        class FakeStream:
+            def __init__(self, chunks):
+                self._chunks = chunks
+
+            async def __aenter__(self):
+                counters["in_flight"] += 1
+                counters["peak"] = max(counters["peak"], counters["in_flight"])
+                await asyncio.sleep(0)
+                return self
+
+            async def __aexit__(self, *exc):
+                counters["in_flight"] -= 1
+                return False
+
+            @property
+            async def text_stream(self):
+                for chunk in self._chunks:
+                    counters["chunks"] += 1
+                    yield chunk
+
+            async def get_final_message(self):
+                return MagicMock()
+
+        return lambda **request: FakeStream(chunks_for(request))
+
+    async def test_aquery_requests_answer_and_recommendations_concurrently(self, engine):
+        """Test the answer and recommendation streams overlap rather than serialize."""
+        counters = {"in_flight": 0, "peak": 0, "chunks": 0}
+
+        def chunks_for(request):
+            if request["max_tokens"] == 1024:
+                return ["- Raise bids\n1. Pause", " ad B\n- Shift budget\n", "- Extra\n", "tail"]
+            return ["An", "swer"]
+
+        engine._async_anthropic = MagicMock()
+        engine._async_anthropic.messages.stream = self._stream_factory(chunks_for, counters)
+
+        result = await engine.aquery("How are campaigns performing?", "client-123")
+
+        assert counters["peak"] == 2
+        assert result.answer == "Answer"
+        assert result.recommendations == ["- Raise bids", "1. Pause ad B", "- Shift budget"]
+        # Recommendation streaming stopped after the third recommendation
+        assert counters["chunks"] == 2 + 2
+        assert [s.entity_id for s in result.sources] == ["camp-1"]
+
+    async def test_query_batch_submits_message_batch(self, engine, test_settings):
+        """Test bulk queries go through one message batch, retrying failed entries."""
+        from types import SimpleNamespace
+
+        from src.api.models import QueryRequest
+
+        test_settings.ANTHROPIC_USE_BATCH_API = True
+        test_settings.ANTHROPIC_BATCH_POLL_SECONDS = 0
+        batches = MagicMock()
+        submitted = {}
+
+        async def create(requests):
+            submitted.update((r["custom_id"], r["params"]) for r in requests)
+            return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+        async def results(batch_id):
+            async def entries():
+                for custom_id in list(submitted)[1:]:
+                    message = SimpleNamespace(content=[SimpleNamespace(text=f"- {custom_id}")])
+                    result = SimpleNamespace(type="succeeded", message=message)
+                    yield SimpleNamespace(custom_id=custom_id, result=result)
+
+            return entries()
+
+        batches.create = create
+        batches.retrieve = AsyncMock(
+            return_value=SimpleNamespace(id="batch-1", processing_status="ended")
+        )
+        batches.results = results
+        engine._async_anthropic = MagicMock()
+        engine._async_anthropic.messages.batches = batches
+        engine._acomplete = AsyncMock(return_value="- Retried")
+
+        requests = [
+            QueryRequest(query="How are campaigns performing?", client_id="client-123"),
+            QueryRequest(query="Which campaign has the best ROAS?", client_id="client-123"),
+        ]
+        results = await engine.query_batch(requests)
+
+        # Answer and recommendations for each query, in one batch
+        assert len(submitted) == 4
+        batches.retrieve.assert_awaited_once_with("batch-1")
+        engine._acomplete.assert_awaited_once_with(next(iter(submitted.values())))
+        assert [r.answer for r in results] == [
+            "- Retried",
+            f"- {results[1].query_id}_answer",
+        ]
+        assert results[0].recommendations == [f"- {results[0].query_id}_recommendations"]
+
+    async def test_query_batch_cancels_batch_past_max_wait(self, engine, test_settings):
+        """Test a batch still running at the deadline is cancelled and answered directly."""
+        from types import SimpleNamespace
+
+        from src.api.models import QueryRequest
+
+        test_settings.ANTHROPIC_USE_BATCH_API = True
+        test_settings.ANTHROPIC_BATCH_POLL_SECONDS = 0
+        test_settings.ANTHROPIC_BATCH_MAX_WAIT_SECONDS = 0
+        running = SimpleNamespace(id="batch-1", processing_status="in_progress")
+        batches = MagicMock()
+        batches.create = AsyncMock(return_value=running)
+        batches.retrieve = AsyncMock(return_value=running)
+        batches.cancel = AsyncMock()
+        engine._async_anthropic = MagicMock()
+        engine._async_anthropic.messages.batches = batches
+        engine._acomplete = AsyncMock(return_value="- Direct")
+
+        requests = [QueryRequest(query="How are campaigns performing?", client_id="client-123")]
+        results = await engine.query_batch(requests)
+
+        batches.cancel.assert_awaited_once_with("batch-1")
+        batches.results.assert_not_called()
+        assert engine._acomplete.await_count == 2
+        assert results[0].answer == "- Direct"
+
+    def test_query_reuses_cached_answer(self, engine, mock_anthropic_client):
+        """Test a repeat sessionless question is answered from the cache."""
+        engine._anthropic = mock_anthropic_client
+
+        first = engine.query("How are campaigns performing?", "client-123")
+        second = engine.query("  how are   CAMPAIGNS performing? ", "client-123")
+
+        assert second.answer == first.answer
+        assert second.query_id != first.query_id
+        assert engine._retriever.retrieve.call_count == 1
+        assert mock_anthropic_client.messages.create.call_count == 2
+
+        # Other clients and conversation turns are not served from the cache
+        engine.query("How are campaigns performing?", "client-456")
+        engine.query("How are campaigns performing?", "client-123", session_id="s-1")
+        assert engine._retriever.retrieve.call_count == 3
+
+    def test_answer_cache_expires_entries(self):
+        """Test cached answers are dropped after their TTL."""
+        from src.rag.engine import AnswerCache
+
+        cache = AnswerCache(max_size=1, ttl_seconds=60)
+        result = MagicMock()
+
+        with patch("src.rag.engine.time.monotonic", return_value=0):
+            cache.set(("a",), result)
+            cache.set(("b",), result)
+        with patch("src.rag.engine.time.monotonic", return_value=59):
+            assert cache.get(("a",)) is None
+            assert cache.get(("b",)) is result
+        with patch("src.rag.engine.time.monotonic", return_value=60):
+            assert cache.get(("b",)) is None
+
+    def test_is_follow_up_query_matches_whole_words(self, engine):
+        """Test follow-up indicators match as whole words, case-insensitively."""
+        assert engine._is_follow_up_query("Tell me MORE about it")
+        assert engine._is_follow_up_query("What about Meta?")
+        assert not engine._is_follow_up_query("Show another campaign")
+        assert not engine._is_follow_up_query("Top campaigns by spend")
+
+    def test_follow_up_automaton_matches_regex(self):
+        """Test the Aho-Corasick matcher agrees with the word-boundary regex."""
+        pytest.importorskip("ahocorasick")
+        from src.rag.engine import _FOLLOW_UP_PATTERN, _has_follow_up_indicator
+
+        queries = [
+            "Tell me MORE about it",
+            "What about Meta?",
+            "Show another campaign",
+            "why_not",
+            "and",
+            "Top campaigns by spend",
+        ]
+        for query in queries:
+            assert _has_follow_up_indicator(query) == bool(_FOLLOW_UP_PATTERN.search(query))
+
+    def test_query_uses_sync_client(self, engine, mock_anthropic_client):
+        """Test the sync path still answers through the sync client."""
+        engine._anthropic = mock_anthropic_client
+
+        result = engine.query("How are campaigns performing?", "client-123")
+
+        assert result.answer == "This is a test response from Claude."
+        assert mock_anthropic_client.messages.create.call_count == 2
+        assert result.recommendations == []
+        # Formatted once, shared by both prompts and the summary
+        engine._retriever.format_context_for_llm.assert_called_once()
+        assert result.context_summary == "context"
+
+        # The static system prompt is marked for prompt caching
+        for call in mock_anthropic_client.messages.create.call_args_list:
+            (system,) = call.kwargs["system"]
+            assert system["cache_control"] == {"type": "ephemeral"}
+
 
 class TestPrompts:
     """Tests for prompt templates."""